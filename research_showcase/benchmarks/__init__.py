@@ -0,0 +1,10 @@
+"""
+Opt-in performance benchmarks.
+
+These are Django test cases kept out of the regular suite because they build
+large corpora.  Run them from the research_showcase directory with:
+
+    python manage.py test benchmarks --pattern "bench_*.py"
+
+``BENCH_CORPUS_SIZE`` (default 100000) controls the number of projects.
+"""
@@ -0,0 +1,36 @@
+import time
+import tracemalloc
+
+from django.test import TestCase
+from research.export import export_queryset, iter_export
+
+from .corpus import CORPUS_SIZE, build_corpus
+
+# Peak Python memory allowed for exporting the whole corpus
+EXPORT_MEMORY_BUDGET_MB: float = 20.0
+
+
+class ExportBenchmark(TestCase):
+    """Streaming export of the full archive: first-line latency and peak memory."""
+
+    @classmethod
+    def setUpTestData(cls):
+        build_corpus()
+
+    def test_streaming_export(self):
+        print(f"\nArchive export, {CORPUS_SIZE} projects")
+        print(f"{'format':<10} {'first line ms':>14} {'total s':>10} {'peak MB':>10}")
+        for fmt in ("csv", "ndjson"):
+            tracemalloc.start()
+            started = time.perf_counter()
+            lines = iter_export(export_queryset(), fmt)
+            next(lines)
+            first_line = (time.perf_counter() - started) * 1000
+            count = 1 + sum(1 for _ in lines)
+            total = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+            print(f"{fmt:<10} {first_line:>14.1f} {total:>10.2f} {peak:>10.1f}")
+
+            self.assertGreaterEqual(count, CORPUS_SIZE)
+            self.assertLess(peak, EXPORT_MEMORY_BUDGET_MB, fmt)
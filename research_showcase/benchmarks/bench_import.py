@@ -0,0 +1,58 @@
+import csv
+import os
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from research.importer import import_projects
+from research.models import ResearchProject, StatusHistory
+
+User = get_user_model()
+
+IMPORT_ROWS: int = int(os.environ.get("BENCH_IMPORT_ROWS", "10000"))
+# Projects imported per second, with one 256 KB paper each
+IMPORT_THROUGHPUT_BUDGET: float = 200.0
+PAPER_BYTES = b"%PDF-1.4\n" + b"0" * (256 * 1024) + b"\n%%EOF\n"
+ABSTRACT = "A historical capstone project on statistical learning for field data. " * 2
+
+
+class ImportBenchmark(TestCase):
+    """Bulk import of a manifest with files, with one and with eight copy threads."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.source = tempfile.mkdtemp()
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, self.source, ignore_errors=True)
+        self.author = User.objects.create_user(username="bench_import", password="password")
+
+        self.manifest = os.path.join(self.source, "manifest.csv")
+        with open(self.manifest, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["title", "student_author_name", "abstract", "date_presented", "pdf_file"]
+            )
+            for i in range(IMPORT_ROWS):
+                name = f"paper{i:05d}.pdf"
+                with open(os.path.join(self.source, name), "wb") as paper:
+                    paper.write(PAPER_BYTES)
+                writer.writerow(
+                    [f"Archived Project {i:05d}", f"Student {i}", ABSTRACT, "2018-10-01", name]
+                )
+
+    def test_import_throughput(self):
+        print(f"\nImport of {IMPORT_ROWS} projects with a paper each")
+        print(f"{'workers':<10} {'total s':>10} {'projects/s':>12}")
+        for workers in (1, 8):
+            ResearchProject.objects.all().delete()
+            shutil.rmtree(self.media_root, ignore_errors=True)
+            report = import_projects(self.manifest, self.source, self.author, workers=workers)
+            print(f"{workers:<10} {report.seconds:>10.2f} {report.rows_per_second:>12.0f}")
+
+            self.assertEqual(report.imported, IMPORT_ROWS)
+            self.assertEqual(StatusHistory.objects.count(), IMPORT_ROWS)
+            self.assertGreater(report.rows_per_second, IMPORT_THROUGHPUT_BUDGET)
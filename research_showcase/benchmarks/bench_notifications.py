@@ -0,0 +1,71 @@
+import os
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from users.models import Notification
+
+from .corpus import BATCH_SIZE, report, time_call
+
+User = get_user_model()
+
+# Notifications held by the benchmark user; a handful of them unread
+HISTORY_SIZE: int = int(os.environ.get("BENCH_NOTIFICATIONS", "100000"))
+UNREAD: int = 20
+INDEX: str = "users_notif_unread_idx"
+# Latency budget for the navbar lookups with the index in place
+UNREAD_BUDGET_MS: float = 2.0
+
+
+class UnreadNotificationBenchmark(TestCase):
+    """Unread lookups for a user with a long read history, with and without the index."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="bench_reader", password="password")
+        batch = []
+        for i in range(HISTORY_SIZE):
+            batch.append(
+                Notification(
+                    recipient=cls.user,
+                    message=f"Your research project 'Project {i}' has been approved.",
+                    read=i < HISTORY_SIZE - UNREAD,
+                )
+            )
+            if len(batch) >= BATCH_SIZE:
+                Notification.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            Notification.objects.bulk_create(batch)
+
+    def _cases(self):
+        unread = Notification.objects.filter(recipient=self.user, read=False)
+        return {
+            "unread count": lambda: unread.count(),
+            "recent unread (dropdown)": lambda: list(unread[:5]),
+            # After the first call nothing is unread; this times the lookup
+            "mark read (update)": lambda: unread.update(read=True),
+        }
+
+    def test_unread_lookup_latency(self):
+        rows = {}
+        for name, func in self._cases().items():
+            rows[f"index    {name}"] = time_call(func)
+        # Restore the unread tail that "mark read" cleared
+        Notification.objects.filter(
+            pk__in=list(
+                Notification.objects.filter(recipient=self.user)
+                .order_by("-id")
+                .values_list("id", flat=True)[:UNREAD]
+            )
+        ).update(read=False)
+
+        # Dropped inside the test transaction, so it comes back on rollback
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX {connection.ops.quote_name(INDEX)}")
+        for name, func in self._cases().items():
+            rows[f"no index {name}"] = time_call(func, repeat=5)
+        report(f"Unread notifications, {HISTORY_SIZE} in the user's history", rows)
+
+        for name in ("unread count", "recent unread (dropdown)"):
+            self.assertLess(rows[f"index    {name}"]["median"], UNREAD_BUDGET_MS, name)
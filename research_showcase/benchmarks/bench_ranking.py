@@ -0,0 +1,44 @@
+import os
+import random
+
+from django.test import TestCase
+from research.models import ResearchProject
+from research.search_index import get_search_backend, rank_projects
+
+from .corpus import CORPUS_SIZE, SEED, add_projects, create_author, report, time_call
+
+PAGE_SIZE: int = 25
+# Corpus sizes to measure, capped at BENCH_CORPUS_SIZE
+SIZES = [
+    size
+    for size in (
+        int(n) for n in os.environ.get("BENCH_RANK_SIZES", "10000,50000,100000").split(",")
+    )
+    if size <= CORPUS_SIZE
+]
+
+
+class RelevanceRankingBenchmark(TestCase):
+    """BM25 ranking latency as the archive grows."""
+
+    def _ranked_page(self, query):
+        qs = rank_projects(
+            ResearchProject.objects.filter(approval_status="approved"), query
+        ).order_by("relevance", "id")
+        return lambda: list(qs[:PAGE_SIZE])
+
+    def test_ranking_latency_by_corpus_size(self):
+        queries = {
+            "rare term": "term01234",
+            "common term": "regression",
+            "mixed": "regression term00042",
+        }
+        author = create_author()
+        rng = random.Random(SEED)
+        rows = {}
+        for size in SIZES:
+            add_projects(author, size - ResearchProject.objects.count(), rng)
+            get_search_backend().reindex()
+            for name, query in queries.items():
+                rows[f"{size:>7} {name}"] = time_call(self._ranked_page(query), repeat=20)
+        report("BM25-ranked first page by corpus size", rows)
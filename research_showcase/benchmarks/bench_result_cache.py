@@ -0,0 +1,59 @@
+import random
+import time
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from research.result_cache import reset_result_cache_stats, result_cache_stats
+
+from .corpus import CORPUS_SIZE, RARE_WORDS, SEED, build_corpus
+
+REQUESTS: int = 300
+# Distinct search requests in the workload; popular ones repeat
+DISTINCT_REQUESTS: int = 30
+
+
+def _workload():
+    """Anonymous search requests drawn with a skew towards popular ones."""
+    rng = random.Random(SEED)
+    distinct = [{}, {"sort_by": "title"}, {"q": "student learning"}]
+    while len(distinct) < DISTINCT_REQUESTS:
+        params = {"q": rng.choice(RARE_WORDS)}
+        if rng.random() < 0.3:
+            params.update(start_semester="Fall 2018", end_semester="Spring 2022")
+        distinct.append(params)
+    weights = [1 / (rank + 1) for rank in range(len(distinct))]
+    return rng.choices(distinct, weights=weights, k=REQUESTS)
+
+
+class SearchResultCacheBenchmark(TestCase):
+    """Search page throughput with and without the result page cache."""
+
+    @classmethod
+    def setUpTestData(cls):
+        build_corpus()
+
+    def _throughput(self, workload):
+        url = reverse("search_research")
+        cache.clear()
+        reset_result_cache_stats()
+        started = time.perf_counter()
+        for params in workload:
+            self.client.get(url, params)
+        return len(workload) / (time.perf_counter() - started)
+
+    def test_cached_throughput(self):
+        workload = _workload()
+        with override_settings(SEARCH_RESULT_CACHE_TIMEOUT=0):
+            uncached = self._throughput(workload)
+        cached = self._throughput(workload)
+        stats = result_cache_stats()
+
+        print(f"\nSearch page throughput, {CORPUS_SIZE} projects, {REQUESTS} requests")
+        print(f"{'case':<40} {'req/s':>10}")
+        print(f"{'uncached':<40} {uncached:>10.1f}")
+        print(f"{'cached':<40} {cached:>10.1f}")
+        print(f"hit rate {stats.hit_rate:.1%} ({stats.hits} hits, {stats.misses} misses)")
+
+        self.assertGreater(stats.hit_rate, 0.8)
+        self.assertGreater(cached, uncached)
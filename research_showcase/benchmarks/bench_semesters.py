@@ -0,0 +1,60 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+from research.semester_utils import generate_semesters
+from research.views import _semester_selection
+
+from .corpus import report, time_call
+
+# An archive spanning ten years of presentations
+EARLIEST: date = date(2015, 2, 1)
+LATEST: date = date(2024, 11, 30)
+
+
+def _legacy_selection(start_semester, end_semester, earliest_date, latest_date):
+    """The search view's semester handling before the catalog, for comparison."""
+    semesters = generate_semesters(earliest_date.year - 1, latest_date.year + 1)
+    season_order = {"Spring": 0, "Summer": 1, "Fall": 2, "Winter": 3}
+    sorted_semesters = sorted(
+        semesters.keys(), key=lambda x: (int(x.split()[1]), season_order[x.split()[0]])
+    )
+    if not start_semester:
+        for sem in sorted_semesters:
+            if semesters[sem]["end"] >= earliest_date:
+                start_semester = sem
+                break
+    if not end_semester:
+        for sem in reversed(sorted_semesters):
+            if semesters[sem]["start"] <= latest_date:
+                end_semester = sem
+                break
+    if start_semester in semesters and end_semester in semesters:
+        if sorted_semesters.index(start_semester) > sorted_semesters.index(end_semester):
+            start_semester, end_semester = end_semester, start_semester
+    return (
+        semesters.get(start_semester, {}).get("start"),
+        semesters.get(end_semester, {}).get("end"),
+    )
+
+
+class SemesterSelectionBenchmark(SimpleTestCase):
+    """Per-request semester work done by the search view before its queries."""
+
+    def test_pre_query_overhead(self):
+        cases = {
+            "defaults": ("", ""),
+            "explicit range": ("Fall 2017", "Spring 2022"),
+            "reversed range": ("Spring 2022", "Fall 2017"),
+        }
+        rows = {}
+        for name, (start, end) in cases.items():
+            rows[f"legacy  {name}"] = time_call(
+                lambda: _legacy_selection(start, end, EARLIEST, LATEST), repeat=2000
+            )
+            rows[f"catalog {name}"] = time_call(
+                lambda: _semester_selection(start, end, EARLIEST, LATEST), repeat=2000
+            )
+        report("Semester selection, ten-year archive", rows)
+
+        for name in cases:
+            self.assertLess(rows[f"catalog {name}"]["median"], rows[f"legacy  {name}"]["median"])
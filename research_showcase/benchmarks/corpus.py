@@ -0,0 +1,112 @@
+"""Helpers for building synthetic research archives for benchmarks."""
+
+import os
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List
+
+from django.contrib.auth import get_user_model
+from research.models import ResearchProject
+from research.search_index import get_search_backend
+from research.semester_utils import semester_key_for_date
+
+User = get_user_model()
+
+CORPUS_SIZE: int = int(os.environ.get("BENCH_CORPUS_SIZE", "100000"))
+BATCH_SIZE: int = 5000
+SEED: int = 20250427
+
+# Small fixed vocabulary so term frequencies are realistic: a few very
+# common words and a long tail of rare ones.
+COMMON_WORDS: List[str] = (
+    "data model analysis study results method approach statistical research "
+    "project using based student learning network time series regression"
+).split()
+RARE_WORDS: List[str] = [f"term{i:05d}" for i in range(20000)]
+SPONSORS: List[str] = [
+    "Arizona Water Board",
+    "Flagstaff Medical Center",
+    "NAU Mathematics Department",
+    "Lowell Observatory",
+    "",
+]
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    words = []
+    for _ in range(length):
+        if rng.random() < 0.7:
+            words.append(rng.choice(COMMON_WORDS))
+        else:
+            words.append(rng.choice(RARE_WORDS))
+    return " ".join(words)
+
+
+def create_author() -> User:
+    return User.objects.create_user(
+        username="bench_author", password="password", role="faculty"
+    )
+
+
+def add_projects(author: User, count: int, rng: random.Random) -> None:
+    """Bulk insert ``count`` approved projects (without indexing them)."""
+    start = date(2015, 1, 1)
+    offset = ResearchProject.objects.count()
+    batch: List[ResearchProject] = []
+    for i in range(offset, offset + count):
+        presented = start + timedelta(days=rng.randrange(3650))
+        batch.append(
+            ResearchProject(
+                title=_sentence(rng, 8).title(),
+                abstract=_sentence(rng, 80),
+                author=author,
+                student_author_name=f"Student {i}",
+                collaborator_names=f"Collaborator {rng.randrange(5000)}",
+                project_sponsor=rng.choice(SPONSORS),
+                date_presented=presented,
+                # bulk_create skips ResearchProject.save()
+                semester_key=semester_key_for_date(presented),
+                approval_status="approved",
+            )
+        )
+        if len(batch) >= BATCH_SIZE:
+            ResearchProject.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        ResearchProject.objects.bulk_create(batch)
+
+
+def build_corpus(size: int = CORPUS_SIZE) -> User:
+    """Insert ``size`` approved projects and rebuild the search index."""
+    author = create_author()
+    add_projects(author, size, random.Random(SEED))
+    # bulk_create bypasses the signal handlers
+    get_search_backend().reindex()
+    return author
+
+
+def time_call(func: Callable[[], object], repeat: int = 50) -> Dict[str, float]:
+    """Run ``func`` ``repeat`` times after one warm-up call; return ms stats."""
+    func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "median": statistics.median(samples),
+        "p95": samples[int(len(samples) * 0.95) - 1],
+        "max": samples[-1],
+    }
+
+
+def report(title: str, rows: Dict[str, Dict[str, float]]) -> None:
+    print(f"\n{title}")
+    print(f"{'case':<40} {'median ms':>10} {'p95 ms':>10} {'max ms':>10}")
+    for name, stats in rows.items():
+        print(
+            f"{name:<40} {stats['median']:>10.2f} {stats['p95']:>10.2f} {stats['max']:>10.2f}"
+        )
@@ -1,6 +1,7 @@
 from django.contrib import admin
+from django.utils import timezone
 
-from .models import Colloquium, ResearchProject, StatusHistory
+from .models import Colloquium, Job, OutboxEmail, ResearchProject, StatusHistory
 
 
 # Inline admin for Status History
@@ -98,7 +99,40 @@ class StatusHistoryAdmin(admin.ModelAdmin):
     )  # Make all fields read-only
 
 
+# Admin view for background jobs, mainly to inspect and retry failures
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("name", "status", "attempts", "max_attempts", "run_at", "created_at")
+    list_filter = ("status", "name")
+    readonly_fields = ("created_at", "locked_at", "finished_at", "last_error")
+    actions = ["retry_jobs"]
+
+    @admin.action(description="Retry selected jobs now")
+    def retry_jobs(self, request, queryset):
+        count = queryset.exclude(status=Job.RUNNING).update(
+            status=Job.PENDING, attempts=0, run_at=timezone.now(), finished_at=None
+        )
+        self.message_user(request, f"{count} job(s) queued for retry.")
+
+
+# Admin view for the email outbox, mainly to inspect and resend dead letters
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "to_email", "status", "attempts", "created_at", "sent_at")
+    list_filter = ("status",)
+    search_fields = ("to_email", "subject")
+    readonly_fields = ("created_at", "sent_at", "claimed_at", "claim_token", "last_error")
+    actions = ["resend_emails"]
+
+    @admin.action(description="Resend selected emails")
+    def resend_emails(self, request, queryset):
+        count = queryset.filter(status=OutboxEmail.DEAD).update(
+            status=OutboxEmail.PENDING, attempts=0, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f"{count} email(s) queued for resending.")
+
+
 # Register models
 admin.site.register(ResearchProject, ResearchProjectAdmin)
 admin.site.register(Colloquium)
 admin.site.register(StatusHistory, StatusHistoryAdmin)
+admin.site.register(Job, JobAdmin)
+admin.site.register(OutboxEmail, OutboxEmailAdmin)
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ResearchConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "research"
+
+    def ready(self):
+        # Register signal handlers (search index sync, etc.) and the
+        # background tasks run by the run_jobs worker
+        from . import signals, tasks  # noqa: F401
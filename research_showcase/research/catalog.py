@@ -0,0 +1,161 @@
+"""
+Cached facts about the public catalog (approved projects).
+
+The search page needs the earliest and latest presentation dates of all
+approved projects to build its semester dropdowns.  That aggregate scans every
+approved project but only changes when a project enters or leaves the
+catalog, or an approved project's date is edited, so it is cached here and
+dropped by the ``ResearchProject`` signal handlers in ``research/signals.py``.
+Code that changes approval status or dates without saving instances
+(``QuerySet.update()``, ``bulk_create``) must call
+``invalidate_catalog_cache()`` itself.
+
+Search facet counts are cached per normalized query string.  There is one
+entry per query ever searched, too many to delete individually, so their keys
+embed a catalog version token instead: ``bump_catalog_version()`` replaces the
+token and every older entry simply stops being read.  The signal handlers bump
+it whenever an approved project is saved or deleted.
+
+Entries also expire after ``CATALOG_CACHE_TIMEOUT`` so that per-process caches
+(the default local-memory backend) cannot serve stale values for long.
+"""
+
+import hashlib
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import BooleanField, Count, ExpressionWrapper, Max, Min, Q
+
+from .models import ResearchProject
+from .search_index import search_projects
+
+CATALOG_CACHE_TIMEOUT: int = 10 * 60
+DATE_RANGE_KEY: str = "research:catalog:date-range"
+VERSION_KEY: str = "research:catalog:version"
+# Sponsors beyond this many (by project count) are left out of the facets
+FACET_SPONSOR_LIMIT: int = 10
+
+
+@dataclass
+class SearchFacets:
+    """Approved projects matching a query, counted per facet value."""
+
+    total: int = 0
+    # (semester_key, count), chronological
+    semesters: List[Tuple[int, int]] = field(default_factory=list)
+    # (sponsor, count), most projects first
+    sponsors: List[Tuple[str, int]] = field(default_factory=list)
+    has_paper: int = 0
+    has_github: int = 0
+    has_video: int = 0
+
+
+def approved_date_range() -> Tuple[Optional[date], Optional[date]]:
+    """Earliest and latest ``date_presented`` of approved projects."""
+    cached = cache.get(DATE_RANGE_KEY)
+    if cached is None:
+        date_range = ResearchProject.objects.filter(approval_status="approved").aggregate(
+            earliest=Min("date_presented"), latest=Max("date_presented")
+        )
+        cached = (date_range["earliest"], date_range["latest"])
+        cache.set(DATE_RANGE_KEY, cached, CATALOG_CACHE_TIMEOUT)
+    return cached
+
+
+def catalog_version() -> str:
+    """Token embedded in the keys of per-query catalog cache entries."""
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # A fresh token: entries cached under a lost one must not be reused
+        version = uuid.uuid4().hex
+        if not cache.add(VERSION_KEY, version, timeout=None):
+            version = cache.get(VERSION_KEY, version)
+    return version
+
+
+def _new_catalog_version() -> None:
+    cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def bump_catalog_version(using: Optional[str] = None) -> None:
+    """
+    Retire every per-query cache entry, now and again when the current
+    transaction commits.
+    """
+    _new_catalog_version()
+    transaction.on_commit(_new_catalog_version, using=using)
+
+
+def invalidate_catalog_cache(using: Optional[str] = None) -> None:
+    """
+    Drop cached catalog facts now and again when the current transaction
+    commits, so no request re-caches the pre-commit state in between.
+    """
+    cache.delete(DATE_RANGE_KEY)
+    transaction.on_commit(lambda: cache.delete(DATE_RANGE_KEY), using=using)
+    bump_catalog_version(using)
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase ``query`` and collapse its whitespace."""
+    return " ".join((query or "").lower().split())
+
+
+def _facets_key(query: str) -> str:
+    digest = hashlib.sha1(query.encode("utf-8")).hexdigest()
+    return f"research:catalog:facets:{catalog_version()}:{digest}"
+
+
+def search_facets(query: str = "") -> SearchFacets:
+    """
+    Facet counts for the approved projects matching ``query``.
+
+    Every facet comes from one grouped aggregate over (semester, sponsor,
+    attachment flags), rolled up here, rather than a count per facet value.
+    """
+    query = normalize_query(query)
+    key = _facets_key(query)
+    facets = cache.get(key)
+    if facets is not None:
+        return facets
+
+    projects = ResearchProject.objects.filter(approval_status="approved")
+    if query:
+        projects = search_projects(projects, query)
+    rows = (
+        projects.annotate(
+            has_paper=ExpressionWrapper(Q(pdf_file__gt=""), output_field=BooleanField()),
+            has_github=ExpressionWrapper(Q(github_link__gt=""), output_field=BooleanField()),
+            has_video=ExpressionWrapper(Q(video_link__gt=""), output_field=BooleanField()),
+        )
+        .values("semester_key", "project_sponsor", "has_paper", "has_github", "has_video")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+
+    facets = SearchFacets()
+    semesters: Counter = Counter()
+    sponsors: Counter = Counter()
+    for row in rows:
+        count = row["count"]
+        facets.total += count
+        if row["semester_key"] is not None:
+            semesters[row["semester_key"]] += count
+        # Kept verbatim so the facet links filter on the stored value
+        sponsor = row["project_sponsor"]
+        if sponsor and sponsor.strip():
+            sponsors[sponsor] += count
+        facets.has_paper += count if row["has_paper"] else 0
+        facets.has_github += count if row["has_github"] else 0
+        facets.has_video += count if row["has_video"] else 0
+    facets.semesters = sorted(semesters.items())
+    facets.sponsors = sorted(sponsors.items(), key=lambda item: (-item[1], item[0]))[
+        :FACET_SPONSOR_LIMIT
+    ]
+    cache.set(key, facets, CATALOG_CACHE_TIMEOUT)
+    return facets
@@ -0,0 +1,206 @@
+"""
+Streaming export of the research archive for department reporting.
+
+Rows are read with ``values_list(...).iterator(chunk_size=...)`` and written
+out one line at a time, so exporting the whole archive holds a single chunk
+in memory and the first bytes go out before the last rows are read.  Under
+ASGI the lines come from ``aiter_export``: Django would otherwise consume a
+sync iterator with ``sync_to_async(list)``, buffering the whole export.  Used by
+the admin ``export_projects`` view and the ``export_projects`` command, which
+accept the search page's filters (research/search_filters.py) plus a status
+and a changed-since cutoff.
+"""
+
+import csv
+import json
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    IntegerField,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import ResearchProject, StatusHistory
+from .search_filters import SEARCH_SORT_ORDERS, filter_projects, resolve_sort
+from .semester_utils import semester_key, semester_name
+
+EXPORT_CHUNK_SIZE: int = 2000
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+# (column name, values_list expression); the semester is converted from its
+# key in Python
+EXPORT_COLUMNS = [
+    ("id", "id"),
+    ("title", "title"),
+    ("student_author_name", "student_author_name"),
+    ("collaborator_names", "collaborator_names"),
+    ("project_sponsor", "project_sponsor"),
+    ("faculty_author", "author__username"),
+    ("approval_status", "approval_status"),
+    ("date_presented", "date_presented"),
+    ("semester", "semester_key"),
+    ("submission_date", "submission_date"),
+    ("updated_at", "updated_at"),
+    ("status_changes", "status_changes"),
+    ("has_paper", "has_paper"),
+    ("has_poster", "has_poster"),
+    ("has_presentation", "has_presentation"),
+    ("has_github", "has_github"),
+    ("has_video", "has_video"),
+]
+SEMESTER_COLUMN = [name for name, _ in EXPORT_COLUMNS].index("semester")
+
+# Cells starting with these are run as formulas by spreadsheet programs
+_FORMULA_PREFIXES = ("=", "+", "-", "@")
+
+
+def export_statuses() -> list:
+    return [value for value, _ in ResearchProject.STATUS_CHOICES] + ["all"]
+
+
+def parse_since(value: str):
+    """An ISO date or date/time as an aware datetime, or ``None`` if invalid."""
+    try:
+        since = parse_datetime(value) or parse_datetime(f"{value}T00:00")
+    except ValueError:
+        # Well formed but out of range, e.g. 2024-02-30
+        return None
+    if since is not None and timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+def _present(field: str) -> Case:
+    # A CASE rather than the bare comparison, which is NULL for NULL links
+    return Case(
+        When(**{f"{field}__gt": ""}, then=Value(True)),
+        default=Value(False),
+        output_field=BooleanField(),
+    )
+
+
+def export_queryset(
+    status: str = "approved",
+    query: str = "",
+    start_semester: str = "",
+    end_semester: str = "",
+    sponsor: str = "",
+    attachments=(),
+    sort_by: str = "",
+    since=None,
+    using: Optional[str] = None,
+) -> QuerySet:
+    """
+    Export rows (tuples in ``EXPORT_COLUMNS`` order) for the given filters.
+
+    ``status`` is an approval status or ``"all"``; semesters are names such
+    as "Fall 2023"; ``since`` keeps projects changed after that datetime.
+    Raises ``ValueError`` for malformed semester names.
+    """
+    projects = ResearchProject.objects.using(using)
+    if status != "all":
+        projects = projects.filter(approval_status=status)
+    if since is not None:
+        projects = projects.filter(updated_at__gt=since)
+    sort_by = resolve_sort(sort_by, query)
+    projects = filter_projects(
+        projects,
+        query=query,
+        start_key=semester_key(start_semester) if start_semester else None,
+        end_key=semester_key(end_semester) if end_semester else None,
+        sponsor=sponsor,
+        attachments=attachments,
+        sort_by=sort_by,
+    )
+    # A correlated count keeps one row per project without a GROUP BY
+    history_count = (
+        StatusHistory.objects.filter(project=OuterRef("pk"))
+        .order_by()
+        .values("project")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    return (
+        projects.annotate(
+            status_changes=Coalesce(Subquery(history_count, output_field=IntegerField()), 0),
+            has_paper=_present("pdf_file"),
+            has_poster=_present("poster_image"),
+            has_presentation=_present("presentation_file"),
+            has_github=_present("github_link"),
+            has_video=_present("video_link"),
+        )
+        .order_by(*SEARCH_SORT_ORDERS[sort_by])
+        .values_list(*(expression for _, expression in EXPORT_COLUMNS))
+    )
+
+
+def _rows(queryset: QuerySet, chunk_size: int) -> Iterator[list]:
+    for row in queryset.iterator(chunk_size=chunk_size):
+        row = list(row)
+        key = row[SEMESTER_COLUMN]
+        row[SEMESTER_COLUMN] = semester_name(key) if key is not None else None
+        yield row
+
+
+class _Echo:
+    """File-like object whose write() returns the line instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_safe(value):
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_export(
+    queryset: QuerySet, fmt: str = "csv", chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Lines of the export of ``queryset`` in ``fmt`` (see ``EXPORT_FORMATS``)."""
+    columns = [name for name, _ in EXPORT_COLUMNS]
+    if fmt == "ndjson":
+        for row in _rows(queryset, chunk_size):
+            yield json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder) + "\n"
+        return
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in _rows(queryset, chunk_size):
+        yield writer.writerow([_csv_safe(value) for value in row])
+
+
+def _next_lines(lines: Iterator[str], count: int) -> List[str]:
+    return list(islice(lines, count))
+
+
+async def aiter_export(
+    queryset: QuerySet, fmt: str = "csv", chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[str]:
+    """
+    ``iter_export`` for async responses: each chunk of rows is fetched
+    through ``sync_to_async``, on the thread that holds the database cursor.
+    """
+    lines = iter_export(queryset, fmt, chunk_size)
+    while True:
+        batch = await sync_to_async(_next_lines)(lines, chunk_size)
+        if not batch:
+            return
+        for line in batch:
+            yield line
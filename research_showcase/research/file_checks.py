@@ -0,0 +1,149 @@
+"""
+Content checks for uploaded posters, papers and slides.
+
+``ResearchProjectForm`` used to check only the extension and size of a file,
+so a renamed file of any kind was accepted and later broke thumbnail and PDF
+preview generation.  ``sniff_upload`` checks that the content matches the
+extension without loading the file into memory (uploads over
+FILE_UPLOAD_MAX_MEMORY_SIZE are temporary files on disk):
+
+- PDFs need a ``%PDF-`` header and an ``%%EOF`` marker near the end, so
+  only the first and last KB are read;
+- images need their format's signature and must pass Pillow's ``verify()``,
+  which streams through the file's structure without decoding any pixels;
+- ``.ppt`` files need the OLE2 signature, and ``.pptx`` files must be zip
+  archives holding ``ppt/presentation.xml`` (read from the zip's central
+  directory at the end of the file).
+
+``sniff_uploads`` checks a submission's files concurrently.
+"""
+
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from django.core.files import File
+from PIL import Image
+
+# The PDF header must be in the first 1024 bytes and the end-of-file marker in
+# the last 1024, which is also how much trailing junk readers tolerate
+HEAD_BYTES: int = 1024
+TAIL_BYTES: int = 1024
+FILE_CHECK_WORKERS: int = 4
+
+# Extension -> (accepted leading bytes, Pillow format)
+IMAGE_SIGNATURES = {
+    "jpg": ((b"\xff\xd8\xff",), "JPEG"),
+    "jpeg": ((b"\xff\xd8\xff",), "JPEG"),
+    "png": ((b"\x89PNG\r\n\x1a\n",), "PNG"),
+    "gif": ((b"GIF87a", b"GIF89a"), "GIF"),
+}
+OLE2_SIGNATURE: bytes = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_SIGNATURE: bytes = b"PK\x03\x04"
+
+
+def _extension(name: str) -> str:
+    return os.path.splitext(name or "")[1][1:].lower()
+
+
+def read_head(upload: File, size: int = HEAD_BYTES) -> bytes:
+    """The first ``size`` bytes of ``upload``, read through its chunks."""
+    head = b""
+    for chunk in upload.chunks(chunk_size=size):
+        head += chunk
+        if len(head) >= size:
+            break
+    return head[:size]
+
+
+def read_tail(upload: File, size: int = TAIL_BYTES) -> bytes:
+    """The last ``size`` bytes of ``upload``."""
+    if upload.size <= size:
+        return read_head(upload, size)
+    upload.seek(upload.size - size)
+    return upload.read(size)
+
+
+def _check_pdf(upload: File, extension: str) -> Optional[str]:
+    if b"%PDF-" not in read_head(upload):
+        return "File is not a valid PDF document"
+    if b"%%EOF" not in read_tail(upload):
+        return "PDF file is truncated or corrupted"
+    return None
+
+
+def _check_image(upload: File, extension: str) -> Optional[str]:
+    signatures, image_format = IMAGE_SIGNATURES[extension]
+    if not read_head(upload, 16).startswith(signatures):
+        return f"File is not a valid {image_format} image"
+    upload.seek(0)
+    try:
+        with Image.open(upload, formats=[image_format]) as image:
+            image.verify()
+    except Exception:
+        # Pillow reports damaged files with many exception types
+        return "Image file is corrupted or unreadable"
+    return None
+
+
+def _check_ppt(upload: File, extension: str) -> Optional[str]:
+    if read_head(upload, len(OLE2_SIGNATURE)) != OLE2_SIGNATURE:
+        return "File is not a valid PowerPoint presentation"
+    return None
+
+
+def _check_pptx(upload: File, extension: str) -> Optional[str]:
+    if read_head(upload, len(ZIP_SIGNATURE)) != ZIP_SIGNATURE:
+        return "File is not a valid PowerPoint presentation"
+    try:
+        with zipfile.ZipFile(upload) as archive:
+            names = set(archive.namelist())
+    except zipfile.BadZipFile:
+        return "PowerPoint file is truncated or corrupted"
+    if "ppt/presentation.xml" not in names:
+        return "File is not a valid PowerPoint presentation"
+    return None
+
+
+CONTENT_CHECKS: Dict[str, Callable[[File, str], Optional[str]]] = {
+    "pdf": _check_pdf,
+    "ppt": _check_ppt,
+    "pptx": _check_pptx,
+    **{extension: _check_image for extension in IMAGE_SIGNATURES},
+}
+
+
+def sniff_upload(upload: File) -> Optional[str]:
+    """
+    Check that ``upload``'s content matches its extension.
+
+    Returns an error message, or ``None`` if the file looks valid or its
+    extension has no content check.
+    """
+    extension = _extension(upload.name)
+    check = CONTENT_CHECKS.get(extension)
+    if check is None:
+        return None
+    try:
+        return check(upload, extension)
+    except OSError:
+        return "File could not be read"
+    finally:
+        # Leave the file ready to be saved
+        upload.seek(0)
+
+
+def sniff_uploads(uploads: Dict[str, File]) -> Dict[str, str]:
+    """
+    Check each upload with ``sniff_upload``, concurrently when there are
+    several.  Returns error messages by key for the files that failed.
+    """
+    if len(uploads) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(FILE_CHECK_WORKERS, len(uploads))
+        ) as pool:
+            results = dict(zip(uploads, pool.map(sniff_upload, uploads.values())))
+    else:
+        results = {key: sniff_upload(upload) for key, upload in uploads.items()}
+    return {key: message for key, message in results.items() if message}
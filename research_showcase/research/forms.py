@@ -5,6 +5,7 @@ from typing import List, Optional
 from django import forms
 from django.core.files.uploadedfile import UploadedFile
 
+from .file_checks import sniff_uploads
 from .models import ResearchProject
 
 # Constants for validation with type annotations
@@ -20,6 +21,7 @@ VALID_PDF_EXTENSION: str = "pdf"
 VALID_IMAGE_EXTENSIONS: List[str] = ["jpg", "jpeg", "png", "gif"]  # For project images
 MAX_IMAGE_SIZE_MB: int = 2  # Max size per image file
 MAX_TOTAL_IMAGE_SIZE_MB: int = 10  # Max total size for all images
+UPLOAD_FIELDS: List[str] = ["poster_image", "presentation_file", "pdf_file"]
 
 
 class ResearchProjectForm(forms.ModelForm):
@@ -226,6 +228,19 @@ class ResearchProjectForm(forms.ModelForm):
                 )
         return pres
 
+    def clean(self):
+        cleaned_data = super().clean()
+        # Check the content of newly uploaded files once their extension and
+        # size have passed; all of a submission's files are checked at once
+        uploads = {
+            name: cleaned_data[name]
+            for name in UPLOAD_FIELDS
+            if name in self.files and cleaned_data.get(name)
+        }
+        for name, message in sniff_uploads(uploads).items():
+            self.add_error(name, message)
+        return cleaned_data
+
     # Validate the GitHub link
     def clean_github_link(self) -> Optional[str]:
         github_link: Optional[str] = self.cleaned_data.get("github_link")
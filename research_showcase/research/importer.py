@@ -0,0 +1,303 @@
+"""
+Bulk import of historical projects from a CSV or JSON manifest.
+
+Each manifest row names a project's fields and, optionally, files (posters,
+papers, slides) relative to a source directory.  Rows are validated with
+``ResearchProjectForm``, so imported projects obey the same rules as web
+submissions, then processed in batches:
+
+1. the batch's files are copied into media storage by a thread pool, while
+   the main thread validates the next batch;
+2. the projects and their initial ``StatusHistory`` rows are inserted with
+   ``bulk_create`` inside one transaction, together with the search index
+   rows and thumbnails that the skipped ``save()`` signals would have made.
+
+Rows whose title and student author already exist are skipped, so an
+interrupted import can simply be run again.  Card thumbnails and PDF previews
+are not rendered; run ``manage.py generate_thumbnails`` afterwards.
+
+JSON manifests are a list of objects; Django fixture entries (with a
+``fields`` key, like ``research/sample_data.json``) are accepted too.
+"""
+
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.files import File
+from django.db import transaction
+
+from .catalog import invalidate_catalog_cache
+from .forms import ResearchProjectForm
+from .models import ResearchProject, StatusHistory, refresh_project_thumbnails
+from .search_index import get_search_backend
+from .semester_utils import semester_key_for_date
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE: int = 500
+DEFAULT_WORKERS: int = 8
+FILE_FIELDS: Tuple[str, ...] = ("poster_image", "presentation_file", "pdf_file")
+DATA_FIELDS: Tuple[str, ...] = tuple(
+    name for name in ResearchProjectForm.Meta.fields if name not in FILE_FIELDS
+)
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    files: int = 0
+    bytes_copied: int = 0
+    seconds: float = 0.0
+    # (manifest row number, message)
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.imported / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class _ValidRow:
+    number: int
+    project: ResearchProject
+    # field name -> source path
+    sources: Dict[str, str]
+    stored: Dict[str, str] = field(default_factory=dict)
+
+
+def read_manifest(path: str) -> Iterator[dict]:
+    """Rows of a ``.csv`` or ``.json`` manifest as dicts."""
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+        for entry in entries:
+            yield entry.get("fields", entry) if isinstance(entry, dict) else {}
+        return
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        yield from csv.DictReader(f)
+
+
+def _text(value) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def validate_row(
+    row: dict, files_dir: str
+) -> Tuple[Optional[ResearchProjectForm], Dict[str, str], str]:
+    """
+    Validate one manifest row with ``ResearchProjectForm``.
+
+    Returns the bound form (``None`` when a file is missing), the source path
+    of each referenced file and an error message ('' when valid).
+    """
+    data = {name: _text(row.get(name)) for name in DATA_FIELDS}
+    sources = {}
+    for name in FILE_FIELDS:
+        relative = _text(row.get(name))
+        if relative:
+            path = os.path.join(files_dir, relative)
+            if not os.path.isfile(path):
+                return None, {}, f"{name}: file not found: {relative}"
+            sources[name] = path
+
+    handles = {name: open(path, "rb") for name, path in sources.items()}
+    try:
+        files = {
+            name: File(handle, name=os.path.basename(sources[name]))
+            for name, handle in handles.items()
+        }
+        form = ResearchProjectForm(data=data, files=files)
+        valid = form.is_valid()
+    finally:
+        for handle in handles.values():
+            handle.close()
+    if not valid:
+        return form, sources, "; ".join(
+            f"{name}: {' '.join(messages)}" for name, messages in form.errors.items()
+        )
+    return form, sources, ""
+
+
+def _copy_file(model_field, source: str) -> Tuple[str, int]:
+    target = model_field.generate_filename(None, os.path.basename(source))
+    with open(source, "rb") as f:
+        name = model_field.storage.save(target, File(f))
+    return name, os.path.getsize(source)
+
+
+def _start_copies(batch: List[_ValidRow], pool: ThreadPoolExecutor) -> list:
+    return [
+        (row, name, pool.submit(_copy_file, ResearchProject._meta.get_field(name), source))
+        for row in batch
+        for name, source in row.sources.items()
+    ]
+
+
+def _finish_copies(
+    batch: List[_ValidRow], copies: list, report: ImportReport
+) -> List[_ValidRow]:
+    """Wait for the batch's copies; rows whose copy failed are dropped."""
+    failed = set()
+    for row, name, future in copies:
+        try:
+            stored, size = future.result()
+        except OSError as e:
+            report.errors.append((row.number, f"{name}: could not copy file: {e}"))
+            failed.add(row.number)
+            continue
+        row.stored[name] = stored
+        report.files += 1
+        report.bytes_copied += size
+    if failed:
+        _delete_files([row for row in batch if row.number in failed])
+    return [row for row in batch if row.number not in failed]
+
+
+def _discard_copies(batch: List[_ValidRow], copies: list) -> None:
+    for row, name, future in copies:
+        try:
+            row.stored[name] = future.result()[0]
+        except OSError:
+            pass
+    _delete_files(batch)
+
+
+def _delete_files(rows: Iterable[_ValidRow]) -> None:
+    for row in rows:
+        for name, stored in row.stored.items():
+            ResearchProject._meta.get_field(name).storage.delete(stored)
+
+
+def _insert_batch(batch: List[_ValidRow], actor, comment: str) -> None:
+    for row in batch:
+        for name, stored in row.stored.items():
+            setattr(row.project, name, stored)
+    try:
+        with transaction.atomic():
+            projects = ResearchProject.objects.bulk_create([row.project for row in batch])
+            StatusHistory.objects.bulk_create(
+                StatusHistory(
+                    project=project,
+                    actor=actor,
+                    status_from=None,
+                    status_to=project.approval_status,
+                    comment=comment,
+                )
+                for project in projects
+            )
+            # bulk_create sends no signals; do what the save() handlers would
+            ids = [project.pk for project in projects]
+            get_search_backend().reindex(ids)
+            refresh_project_thumbnails(ResearchProject.objects.filter(pk__in=ids))
+    except Exception:
+        _delete_files(batch)
+        raise
+
+
+def import_projects(
+    manifest: str,
+    files_dir: str,
+    author,
+    status: str = "approved",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = DEFAULT_WORKERS,
+    dry_run: bool = False,
+    progress: Optional[Callable[[ImportReport], None]] = None,
+) -> ImportReport:
+    """
+    Import the projects listed in ``manifest`` as ``author``'s submissions
+    with approval ``status``.  ``progress`` is called after every batch.
+    With ``dry_run`` rows are only validated.
+    """
+    report = ImportReport()
+    started = time.perf_counter()
+    comment = f"Imported from {os.path.basename(manifest)}"
+    seen = set()
+    # The batch whose files are being copied while the next one is validated
+    in_flight: Optional[Tuple[List[_ValidRow], list]] = None
+
+    def complete():
+        nonlocal in_flight
+        batch, copies = in_flight
+        in_flight = None
+        batch = _finish_copies(batch, copies, report)
+        if batch:
+            _insert_batch(batch, author, comment)
+        report.imported += len(batch)
+        report.seconds = time.perf_counter() - started
+        if progress:
+            progress(report)
+
+    def flush(batch):
+        nonlocal in_flight
+        if not batch or dry_run:
+            return
+        # Skip rows already in the archive (e.g. from an interrupted run)
+        existing = set(
+            ResearchProject.objects.filter(
+                title__in=[row.project.title for row in batch]
+            ).values_list("title", "student_author_name")
+        )
+        fresh = []
+        for row in batch:
+            if (row.project.title, row.project.student_author_name) in existing:
+                report.duplicates += 1
+            else:
+                fresh.append(row)
+        copies = _start_copies(fresh, pool)
+        if in_flight:
+            try:
+                complete()
+            except Exception:
+                _discard_copies(fresh, copies)
+                raise
+        in_flight = (fresh, copies)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        batch: List[_ValidRow] = []
+        try:
+            for number, row in enumerate(read_manifest(manifest), start=1):
+                report.rows += 1
+                form, sources, error = validate_row(row, files_dir)
+                if error:
+                    report.errors.append((number, error))
+                    continue
+                data = form.cleaned_data
+                identity = (data["title"], data["student_author_name"])
+                if identity in seen:
+                    report.duplicates += 1
+                    continue
+                seen.add(identity)
+                project = ResearchProject(
+                    author=author,
+                    approval_status=status,
+                    semester_key=semester_key_for_date(data["date_presented"]),
+                    **{name: data[name] for name in DATA_FIELDS},
+                )
+                batch.append(_ValidRow(number, project, sources))
+                if len(batch) >= batch_size:
+                    flush(batch)
+                    batch = []
+            flush(batch)
+            if in_flight:
+                complete()
+        except BaseException:
+            if in_flight:
+                _discard_copies(*in_flight)
+            raise
+
+    if report.imported:
+        invalidate_catalog_cache()
+    report.seconds = time.perf_counter() - started
+    logger.info(
+        "Imported %d of %d manifest rows in %.1fs", report.imported, report.rows, report.seconds
+    )
+    return report
@@ -0,0 +1,165 @@
+"""
+A small database-backed job queue.
+
+Side effects that may be slow or flaky (sending mail, for example) should not
+run inside the admin's HTTP request.  Views call ``enqueue()`` instead, which
+only inserts a ``Job`` row; if the caller is inside a transaction, the job
+commits or rolls back together with the change that caused it.  The
+``manage.py run_jobs`` worker picks due jobs up, runs the registered task
+function and retries failures with exponential backoff until
+``Job.max_attempts`` is reached, after which the job stays ``failed`` for
+inspection in the admin.
+
+Tasks are plain functions registered by name::
+
+    @task("research.notify_author")
+    def notify_author(project_id, ...):
+        ...
+
+    enqueue("research.notify_author", project_id=project.id)
+
+Payloads must be JSON-serializable, so pass ids rather than model instances.
+No external broker is needed; claiming a job is a conditional UPDATE, so
+several workers can share one queue.
+"""
+
+import logging
+import traceback
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+BACKOFF_BASE_SECONDS: int = 30
+MAX_BACKOFF_SECONDS: int = 60 * 60
+# A job still marked running after this long belongs to a dead worker
+STALE_LOCK_SECONDS: int = 15 * 60
+
+_registry: Dict[str, Callable] = {}
+
+
+class UnknownTask(LookupError):
+    """Raised for job names that no task is registered under."""
+
+
+def task(name: str) -> Callable[[Callable], Callable]:
+    """Register the decorated function as the task called ``name``."""
+
+    def register(func: Callable) -> Callable:
+        _registry[name] = func
+        return func
+
+    return register
+
+
+def get_task(name: str) -> Callable:
+    try:
+        return _registry[name]
+    except KeyError:
+        raise UnknownTask(name) from None
+
+
+def enqueue(
+    name: str,
+    *,
+    max_attempts: Optional[int] = None,
+    unique: bool = False,
+    run_at: Optional[datetime] = None,
+    **payload,
+) -> Job:
+    """
+    Queue the task ``name`` to run with ``payload`` as keyword arguments,
+    now or at ``run_at``.
+
+    With ``unique``, an identical job that is still waiting to run is reused
+    instead of queueing another one.
+    """
+    get_task(name)  # Fail at the call site rather than in the worker
+    if unique:
+        for waiting in Job.objects.filter(name=name, status=Job.PENDING):
+            if waiting.payload == payload:
+                return waiting
+    job = Job(name=name, payload=payload)
+    if max_attempts is not None:
+        job.max_attempts = max_attempts
+    if run_at is not None:
+        job.run_at = run_at
+    job.save()
+    return job
+
+
+def backoff_delay(attempts: int) -> timedelta:
+    """Wait before retrying a job that has failed ``attempts`` times."""
+    seconds = BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, MAX_BACKOFF_SECONDS))
+
+
+def requeue_stale_jobs() -> int:
+    """Return jobs locked by a worker that died mid-run to the queue."""
+    cutoff = timezone.now() - timedelta(seconds=STALE_LOCK_SECONDS)
+    return Job.objects.filter(status=Job.RUNNING, locked_at__lt=cutoff).update(
+        status=Job.PENDING, locked_at=None
+    )
+
+
+def claim_next_job() -> Optional[Job]:
+    """Lock the next due job for this worker, or return ``None``."""
+    while True:
+        now = timezone.now()
+        job = (
+            Job.objects.filter(status=Job.PENDING, run_at__lte=now)
+            .order_by("run_at", "id")
+            .first()
+        )
+        if job is None:
+            return None
+        # Only one worker's UPDATE can match while the job is still pending
+        claimed = Job.objects.filter(pk=job.pk, status=Job.PENDING).update(
+            status=Job.RUNNING, locked_at=now, attempts=F("attempts") + 1
+        )
+        if claimed:
+            job.refresh_from_db()
+            return job
+
+
+def run_job(job: Job) -> bool:
+    """Run a claimed job and record the outcome; returns True on success."""
+    try:
+        get_task(job.name)(**job.payload)
+    except Exception as e:
+        now = timezone.now()
+        job.last_error = traceback.format_exc()
+        job.locked_at = None
+        if job.attempts >= job.max_attempts:
+            job.status = Job.FAILED
+            job.finished_at = now
+            logger.error("Job %s failed permanently: %s", job, e)
+        else:
+            job.status = Job.PENDING
+            job.run_at = now + backoff_delay(job.attempts)
+            logger.warning("Job %s failed, retrying at %s: %s", job, job.run_at, e)
+        job.save(update_fields=["status", "run_at", "locked_at", "last_error", "finished_at"])
+        return False
+
+    job.status = Job.DONE
+    job.locked_at = None
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "locked_at", "finished_at"])
+    return True
+
+
+def run_pending_jobs(limit: Optional[int] = None) -> int:
+    """Run due jobs until the queue is empty or ``limit`` jobs ran."""
+    ran = 0
+    while limit is None or ran < limit:
+        job = claim_next_job()
+        if job is None:
+            break
+        run_job(job)
+        ran += 1
+    return ran
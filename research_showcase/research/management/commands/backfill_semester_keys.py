@@ -0,0 +1,48 @@
+# Description: Backfills the stored semester_key column of research projects
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Max
+from research.models import ResearchProject, refresh_semester_keys
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes ResearchProject.semester_key from date_presented for "
+        "existing projects"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Projects updated per statement (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to backfill (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        batch_size = max(1, options["batch_size"])
+        projects = ResearchProject.objects.using(using)
+        max_id = projects.aggregate(max_id=Max("id"))["max_id"] or 0
+
+        started = time.perf_counter()
+        updated = 0
+        # Walk the primary key in ranges so each UPDATE stays short
+        for low in range(0, max_id + 1, batch_size):
+            updated += refresh_semester_keys(
+                projects.filter(pk__gte=low, pk__lt=low + batch_size)
+            )
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Backfilled semester keys for {updated} projects in {elapsed:.2f}s"
+            )
+        )
@@ -0,0 +1,63 @@
+# Description: Generates resized derivatives for project images, posters and PDF previews
+
+import time
+
+from django.core.management.base import BaseCommand
+from research.models import ProjectImage, ResearchProject
+from research.previews import get_renderer, render_pdf_preview
+from research.thumbnails import generate_derivatives, is_image_name, is_previewable_name
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates the card/detail thumbnails for uploaded project images and "
+        "posters, and first-page previews of PDF posters and papers, that do "
+        "not have them yet"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-render derivatives that already exist",
+        )
+
+    def _names(self, model, field):
+        return (
+            model._meta.get_field(field).storage,
+            model.objects.exclude(**{field: ""})
+            .exclude(**{f"{field}__isnull": True})
+            .values_list(field, flat=True),
+        )
+
+    def handle(self, *args, **options):
+        force = options["force"]
+        sources = [
+            self._names(ProjectImage, "image"),
+            self._names(ResearchProject, "poster_image"),
+            self._names(ResearchProject, "pdf_file"),
+        ]
+        if get_renderer() is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    "No PDF renderer (PyMuPDF or pdftoppm) found; PDF previews are skipped"
+                )
+            )
+
+        started = time.perf_counter()
+        checked = written = 0
+        for storage, names in sources:
+            for name in names.iterator():
+                if is_image_name(name):
+                    written += len(generate_derivatives(storage, name, force=force))
+                elif is_previewable_name(name):
+                    written += len(render_pdf_preview(storage, name, force=force))
+                else:
+                    continue
+                checked += 1
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {checked} files, wrote {written} thumbnails in {elapsed:.2f}s"
+            )
+        )
@@ -0,0 +1,116 @@
+# Description: Bulk-imports historical research projects and their files from a manifest
+
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from research.importer import DEFAULT_BATCH_SIZE, DEFAULT_WORKERS, import_projects
+from research.models import ResearchProject
+
+User = get_user_model()
+
+# Invalid rows listed individually before the rest are summarised
+MAX_REPORTED_ERRORS: int = 20
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports projects from a CSV or JSON manifest, copying the posters, "
+        "papers and slides it names from a directory; rows are validated like "
+        "web submissions and inserted in batches"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("manifest", help="CSV or JSON file, one project per row")
+        parser.add_argument(
+            "--files",
+            default="",
+            help="Directory the manifest's file paths are relative to "
+            "(default: the manifest's directory)",
+        )
+        parser.add_argument(
+            "--author",
+            required=True,
+            help="Username recorded as the submitting faculty member",
+        )
+        parser.add_argument(
+            "--status",
+            choices=[value for value, _ in ResearchProject.STATUS_CHOICES],
+            default="approved",
+            help="Approval status of the imported projects (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Projects inserted per transaction (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=DEFAULT_WORKERS,
+            help="Threads copying files (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate the manifest without importing anything",
+        )
+
+    def handle(self, *args, **options):
+        manifest = options["manifest"]
+        if not os.path.isfile(manifest):
+            raise CommandError(f"Manifest not found: {manifest}")
+        files_dir = options["files"] or os.path.dirname(os.path.abspath(manifest))
+        if not os.path.isdir(files_dir):
+            raise CommandError(f"Files directory not found: {files_dir}")
+        try:
+            author = User.objects.get(username=options["author"])
+        except User.DoesNotExist as e:
+            raise CommandError(f"No user named {options['author']!r}") from e
+
+        def progress(report):
+            self.stdout.write(
+                f"  {report.imported} imported, {report.files} files "
+                f"({report.bytes_copied / 1024 / 1024:.1f} MB), "
+                f"{report.rows_per_second:.0f} projects/s"
+            )
+
+        report = import_projects(
+            manifest,
+            files_dir,
+            author,
+            status=options["status"],
+            batch_size=max(1, options["batch_size"]),
+            workers=max(1, options["workers"]),
+            dry_run=options["dry_run"],
+            progress=progress,
+        )
+
+        for number, message in report.errors[:MAX_REPORTED_ERRORS]:
+            self.stderr.write(f"Row {number}: {message}")
+        if len(report.errors) > MAX_REPORTED_ERRORS:
+            self.stderr.write(f"... and {len(report.errors) - MAX_REPORTED_ERRORS} more")
+
+        if options["dry_run"]:
+            valid = report.rows - len(report.errors) - report.duplicates
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Validated {report.rows} rows: {valid} valid, "
+                    f"{len(report.errors)} invalid, {report.duplicates} duplicates "
+                    f"in {report.seconds:.2f}s"
+                )
+            )
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report.imported} of {report.rows} projects "
+                f"({len(report.errors)} invalid, {report.duplicates} duplicates), "
+                f"{report.files} files ({report.bytes_copied / 1024 / 1024:.1f} MB) "
+                f"in {report.seconds:.2f}s, {report.rows_per_second:.0f} projects/s"
+            )
+        )
+        if report.files:
+            self.stdout.write(
+                "Run 'manage.py generate_thumbnails' to render thumbnails and PDF previews"
+            )
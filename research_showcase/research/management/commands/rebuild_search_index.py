@@ -0,0 +1,61 @@
+# Description: Rebuilds the full-text search index for research projects
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, transaction
+from research.export import parse_since
+from research.models import ResearchProject
+from research.search_index import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the full-text search index from the research project table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to rebuild (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--since",
+            help=(
+                "Only reindex projects changed after this ISO date or date/time "
+                "(deleted projects are removed by the signal handlers)"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        backend = get_search_backend(using)
+        started = time.perf_counter()
+        if options["since"]:
+            since = parse_since(options["since"])
+            if since is None:
+                raise CommandError(
+                    f"Invalid --since value {options['since']!r}; use an ISO date or date/time"
+                )
+            changed = list(
+                ResearchProject.objects.using(using)
+                .changed_since(since)
+                .values_list("id", flat=True)
+            )
+            with transaction.atomic(using=using):
+                backend.reindex(changed)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Reindexed {len(changed)} projects changed since "
+                    f"{since.isoformat()} in {elapsed:.2f}s"
+                )
+            )
+            return
+        with transaction.atomic(using=using):
+            backend.reindex()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt search index with {type(backend).__name__} in {elapsed:.2f}s"
+            )
+        )
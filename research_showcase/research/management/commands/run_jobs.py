@@ -0,0 +1,49 @@
+# Description: Runs queued background jobs (status emails, etc.)
+
+import time
+
+from django.core.management.base import BaseCommand
+from research.jobs import requeue_stale_jobs, run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Works through the database job queue, retrying failed jobs with "
+        "backoff. Runs until interrupted unless --once is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the jobs that are due now, then exit (e.g. from cron)",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=2.0,
+            help="Seconds to wait when the queue is empty (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=None,
+            help="Exit after running this many jobs",
+        )
+
+    def handle(self, *args, **options):
+        max_jobs = options["max_jobs"]
+        total = 0
+        try:
+            while max_jobs is None or total < max_jobs:
+                requeue_stale_jobs()
+                limit = None if max_jobs is None else max_jobs - total
+                ran = run_pending_jobs(limit=limit)
+                total += ran
+                if options["once"]:
+                    break
+                if not ran:
+                    time.sleep(options["sleep"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"Ran {total} jobs"))
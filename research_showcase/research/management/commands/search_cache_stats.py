@@ -0,0 +1,25 @@
+# Description: Reports the hit rate of the cached search result pages
+
+from django.core.management.base import BaseCommand
+from research.result_cache import reset_result_cache_stats, result_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Prints search result cache hits, misses and hit rate since the last reset"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Zero the counters after reporting them",
+        )
+
+    def handle(self, *args, **options):
+        stats = result_cache_stats()
+        self.stdout.write(
+            f"Search result cache: {stats.hits} hits, {stats.misses} misses "
+            f"({stats.hit_rate:.1%} hit rate)"
+        )
+        if options["reset"]:
+            reset_result_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset"))
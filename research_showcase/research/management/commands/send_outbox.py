@@ -0,0 +1,29 @@
+# Description: Sends queued status-change emails from the outbox
+
+from django.core.management.base import BaseCommand
+from research.outbox import DEFAULT_BATCH_SIZE, deliver_outbox
+
+
+class Command(BaseCommand):
+    help = (
+        "Delivers pending outbox emails in batches over a single mail "
+        "connection, retrying failures and dead-lettering exhausted messages"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Messages claimed per batch (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        report = deliver_outbox(batch_size=max(1, options["batch_size"]))
+        style = self.style.SUCCESS if not (report.retried or report.dead) else self.style.WARNING
+        self.stdout.write(
+            style(
+                f"Sent {report.sent} emails, {report.retried} to retry, "
+                f"{report.dead} dead-lettered"
+            )
+        )
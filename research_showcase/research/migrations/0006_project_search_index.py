@@ -0,0 +1,80 @@
+# Creates the full-text index used by research.search_index.
+
+from django.db import migrations
+from django.db.utils import OperationalError
+
+SQLITE_CREATE = """
+CREATE VIRTUAL TABLE research_projectsearch USING fts5(
+    title,
+    abstract,
+    project_sponsor,
+    student_author_name,
+    collaborator_names,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+SQLITE_POPULATE = """
+INSERT INTO research_projectsearch (
+    rowid, title, abstract, project_sponsor, student_author_name, collaborator_names
+)
+SELECT id, COALESCE(title, ''), COALESCE(abstract, ''), COALESCE(project_sponsor, ''),
+       COALESCE(student_author_name, ''), COALESCE(collaborator_names, '')
+FROM research_researchproject
+"""
+
+POSTGRES_CREATE = [
+    """
+    CREATE TABLE research_projectsearch (
+        project_id bigint PRIMARY KEY
+            REFERENCES research_researchproject (id)
+            ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
+        document tsvector NOT NULL
+    )
+    """,
+    "CREATE INDEX research_projectsearch_document_gin "
+    "ON research_projectsearch USING GIN (document)",
+]
+
+POSTGRES_POPULATE = """
+INSERT INTO research_projectsearch (project_id, document)
+SELECT id,
+       setweight(to_tsvector('english', COALESCE(title, '')), 'A')
+       || setweight(to_tsvector('english', COALESCE(abstract, '')), 'B')
+       || setweight(to_tsvector('english', COALESCE(project_sponsor, '')), 'C')
+       || setweight(to_tsvector('english', COALESCE(student_author_name, '')), 'D')
+       || setweight(to_tsvector('english', COALESCE(collaborator_names, '')), 'D')
+FROM research_researchproject
+"""
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        try:
+            schema_editor.execute(SQLITE_CREATE)
+        except OperationalError:
+            # SQLite built without FTS5; search falls back to LIKE queries
+            return
+        schema_editor.execute(SQLITE_POPULATE)
+    elif vendor == "postgresql":
+        for statement in POSTGRES_CREATE:
+            schema_editor.execute(statement)
+        schema_editor.execute(POSTGRES_POPULATE)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in ("sqlite", "postgresql"):
+        schema_editor.execute("DROP TABLE IF EXISTS research_projectsearch")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("research", "0005_alter_researchproject_pdf_file_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0006_project_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(fields=['approval_status', 'date_presented', 'id'], name='research_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(fields=['approval_status', 'title', 'id'], name='research_status_title_idx'),
+        ),
+    ]
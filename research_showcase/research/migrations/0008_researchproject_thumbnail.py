@@ -0,0 +1,39 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:44
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, NullIf
+
+
+def backfill_thumbnails(apps, schema_editor):
+    # Same rule as research.models.refresh_project_thumbnails; large archives
+    # can instead be backfilled in batches with `manage.py backfill_thumbnails`
+    ResearchProject = apps.get_model("research", "ResearchProject")
+    ProjectImage = apps.get_model("research", "ProjectImage")
+    first_image = (
+        ProjectImage.objects.filter(project=OuterRef("pk"))
+        .exclude(image="")
+        .order_by("id")
+        .values("image")[:1]
+    )
+    ResearchProject.objects.using(schema_editor.connection.alias).update(
+        thumbnail=Coalesce(
+            Subquery(first_image), NullIf("poster_image", Value("")), Value("")
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0007_researchproject_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='researchproject',
+            name='thumbnail',
+            field=models.FileField(blank=True, editable=False, max_length=255, upload_to=''),
+        ),
+        migrations.RunPython(backfill_thumbnails, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Thumbnails now fall back to the paper PDF (rendered as a first-page preview)
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, NullIf
+
+
+def backfill_thumbnails(apps, schema_editor):
+    # Same rule as research.models.refresh_project_thumbnails
+    ResearchProject = apps.get_model("research", "ResearchProject")
+    ProjectImage = apps.get_model("research", "ProjectImage")
+    first_image = (
+        ProjectImage.objects.filter(project=OuterRef("pk"))
+        .exclude(image="")
+        .order_by("id")
+        .values("image")[:1]
+    )
+    ResearchProject.objects.using(schema_editor.connection.alias).update(
+        thumbnail=Coalesce(
+            Subquery(first_image),
+            NullIf("poster_image", Value("")),
+            NullIf("pdf_file", Value("")),
+            Value(""),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("research", "0008_researchproject_thumbnail"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_thumbnails, migrations.RunPython.noop),
+    ]
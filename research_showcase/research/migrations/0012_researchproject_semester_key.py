@@ -0,0 +1,39 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+from research.semester_utils import semester_key_for_date
+
+
+def backfill_semester_keys(apps, schema_editor):
+    # Same rule as ResearchProject.save(); large archives can instead be
+    # backfilled in batches with `manage.py backfill_semester_keys`
+    ResearchProject = apps.get_model("research", "ResearchProject")
+    projects = ResearchProject.objects.using(schema_editor.connection.alias)
+    updated = []
+    for project in projects.exclude(date_presented=None).only("id", "date_presented"):
+        project.semester_key = semester_key_for_date(project.date_presented)
+        updated.append(project)
+    projects.bulk_update(updated, ["semester_key"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0011_outboxemail'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='researchproject',
+            name='semester_key',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(fields=['approval_status', 'semester_key'], name='research_status_semester_idx'),
+        ),
+        migrations.RunPython(backfill_semester_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:55
+
+from django.db import migrations, models
+
+
+def backfill_updated_at(apps, schema_editor):
+    # Existing projects have no change history; their submission time is
+    # the best available answer (and keeps their pages' ETags stable)
+    ResearchProject = apps.get_model("research", "ResearchProject")
+    ResearchProject.objects.using(schema_editor.connection.alias).update(
+        updated_at=models.F("submission_date")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0012_researchproject_semester_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='researchproject',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0013_researchproject_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(fields=['updated_at', 'id'], name='research_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.6 on 2026-10-18 17:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0014_researchproject_updated_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThumbnailSource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+            ],
+        ),
+    ]
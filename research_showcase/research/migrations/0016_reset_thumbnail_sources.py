@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+def forget_thumbnail_sources(apps, schema_editor):
+    # Derivative names now keep the original's extension, so files recorded
+    # under the old names must be rendered again by `manage.py generate_thumbnails`
+    ThumbnailSource = apps.get_model("research", "ThumbnailSource")
+    ThumbnailSource.objects.using(schema_editor.connection.alias).all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0015_thumbnailsource'),
+    ]
+
+    operations = [
+        migrations.RunPython(forget_thumbnail_sources, migrations.RunPython.noop),
+    ]
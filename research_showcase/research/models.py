@@ -1,12 +1,41 @@
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 from django.db import models
+from django.db.models import Case, F, Max, Min, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce, NullIf
 from django.utils import timezone
 from users.models import User
 
+from .semester_utils import get_semester_catalog, semester_key_for_date, semester_name
+
 # In research/models.py
 
 
+class ResearchProjectQuerySet(models.QuerySet):
+    """Keeps ``ResearchProject.updated_at`` current on bulk writes too."""
+
+    def update(self, **kwargs):
+        # Maintenance of derived columns passes updated_at=F("updated_at")
+        kwargs.setdefault("updated_at", timezone.now())
+        return super().update(**kwargs)
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        objs = list(objs)
+        if "updated_at" not in fields:
+            now = timezone.now()
+            for obj in objs:
+                obj.updated_at = now
+            fields = [*fields, "updated_at"]
+        return super().bulk_update(objs, fields, batch_size=batch_size)
+
+    def changed_since(self, since):
+        """
+        Projects modified after ``since`` (a datetime), oldest change first;
+        walks the ``updated_at`` index, for incremental sync and exports.
+        """
+        return self.filter(updated_at__gt=since).order_by("updated_at", "id")
+
+
 class ResearchProject(models.Model):
     """
     Model representing a research project submission.
@@ -23,6 +52,7 @@ class ResearchProject(models.Model):
         collaborator_names: Text field listing all collaborators
         faculty_advisor: Optional link to faculty advisor user
         submission_date: When the project was submitted
+        updated_at: When the project or its images last changed
         date_presented: When the research was presented (if applicable)
         approval_status: Current status in the approval workflow
         Various optional fields for links and file attachments
@@ -60,6 +90,11 @@ class ResearchProject(models.Model):
     )
 
     submission_date: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+    # Last change to the project or its images. Maintained by save(), by
+    # ResearchProjectQuerySet for update()/bulk_update() and by
+    # research/signals.py for images; the public page's ETag and
+    # Last-Modified and changed_since() derive from it
+    updated_at: models.DateTimeField = models.DateTimeField(auto_now=True)
 
     # New field: When the research was presented
     date_presented: models.DateField = models.DateField(null=True, blank=True)
@@ -99,6 +134,24 @@ class ResearchProject(models.Model):
         help_text="PDF of the research paper (max 10MB)",
     )
 
+    # Denormalized card image for the search page: the first project image,
+    # else the poster, else the paper (PDFs render as first-page previews).
+    # Maintained by research/signals.py; use the backfill_thumbnails command
+    # after writes that bypass signals.
+    thumbnail: models.FileField = models.FileField(
+        max_length=255, blank=True, editable=False
+    )
+
+    # Semester of date_presented as year * 10 + season index (see
+    # research/semester_utils.py), so semester filters and per-semester
+    # counts are plain indexed SQL. Set by save(); use the
+    # backfill_semester_keys command after writes that bypass it.
+    semester_key: models.PositiveIntegerField = models.PositiveIntegerField(
+        null=True, blank=True, editable=False
+    )
+
+    objects = ResearchProjectQuerySet.as_manager()
+
     # Derived properties for semester/year (optional, for easier querying/display)
     @property
     def year_presented(self):
@@ -106,22 +159,50 @@ class ResearchProject(models.Model):
 
     @property
     def semester_presented(self):
-        if not self.date_presented:
-            return None
-        month = self.date_presented.month
-        if 3 <= month <= 5:
-            return "Spring"
-        if 6 <= month <= 7:
-            return "Summer"  # Approx
-        if 8 <= month <= 11:
-            return "Fall"
-        if month == 12 or month <= 2:
-            return "Winter"  # Approx
-        return None  # Should not happen
+        """Name of the semester presented in, e.g. "Fall 2023" (see semester_utils)."""
+        key = self.semester_key
+        if key is None:
+            # Not saved since date_presented was set
+            key = semester_key_for_date(self.date_presented)
+        return semester_name(key) if key is not None else None
+
+    class Meta:
+        # Match the keyset pagination orderings of the search page so each
+        # page is a bounded range scan (see research/pagination.py)
+        indexes = [
+            models.Index(
+                fields=["approval_status", "date_presented", "id"],
+                name="research_status_date_idx",
+            ),
+            models.Index(
+                fields=["approval_status", "title", "id"],
+                name="research_status_title_idx",
+            ),
+            # Semester range filters and per-semester counts
+            models.Index(
+                fields=["approval_status", "semester_key"],
+                name="research_status_semester_idx",
+            ),
+            # changed_since() scans for incremental sync
+            models.Index(fields=["updated_at", "id"], name="research_updated_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        # Skipped when date_presented is deferred: it cannot have changed
+        if "date_presented" in self.__dict__:
+            self.semester_key = semester_key_for_date(self.date_presented)
+            if update_fields is not None and "date_presented" in update_fields:
+                update_fields = {*update_fields, "semester_key"}
+        # auto_now only applies to the fields being saved
+        if update_fields:
+            update_fields = {*update_fields, "updated_at"}
+            kwargs["update_fields"] = update_fields
+        super().save(*args, **kwargs)
+
 
 class ProjectImage(models.Model):
     """Represents a single image associated with a ResearchProject."""
@@ -140,6 +221,19 @@ class ProjectImage(models.Model):
             return f"Image for {self.project.title} ({self.image.name})"
 
 
+class ThumbnailSource(models.Model):
+    """
+    An uploaded file whose resized derivatives (research/thumbnails.py) have
+    been written.  Templates link derivatives only for recorded files, so
+    rendering a page never has to ask storage whether they exist.
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+
+    def __str__(self) -> str:
+        return self.name
+
+
 class StatusHistory(models.Model):
     """Tracks the status changes and feedback for a ResearchProject."""
 
@@ -178,3 +272,173 @@ class Colloquium(models.Model):
 
     def __str__(self):
         return f"{self.title} by {self.presenter.username} on {self.date}"
+
+
+class Job(models.Model):
+    """
+    A unit of background work, stored in the database and run by the
+    ``run_jobs`` worker (see research/jobs.py).
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES: List[Tuple[str, str]] = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    name: models.CharField = models.CharField(max_length=100)
+    payload: models.JSONField = models.JSONField(default=dict, blank=True)
+    status: models.CharField = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=PENDING
+    )
+    attempts: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    max_attempts: models.PositiveIntegerField = models.PositiveIntegerField(default=5)
+    # Earliest time the job may run; pushed back after each failed attempt
+    run_at: models.DateTimeField = models.DateTimeField(default=timezone.now)
+    locked_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+    last_error: models.TextField = models.TextField(blank=True)
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+    finished_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["run_at", "id"]
+        indexes = [
+            # The worker's "next due job" lookup
+            models.Index(fields=["status", "run_at"], name="research_job_due_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.name} #{self.pk} ({self.status})"
+
+
+class OutboxEmail(models.Model):
+    """
+    An email waiting to be sent, written in the same transaction as the change
+    it reports and delivered in batches by research/outbox.py.
+    """
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    DEAD = "dead"
+    STATUS_CHOICES: List[Tuple[str, str]] = [
+        (PENDING, "Pending"),
+        (SENDING, "Sending"),
+        (SENT, "Sent"),
+        (DEAD, "Dead letter"),
+    ]
+
+    project: models.ForeignKey = models.ForeignKey(
+        ResearchProject,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="outbox_emails",
+    )
+    to_email: models.EmailField = models.EmailField()
+    from_email: models.CharField = models.CharField(max_length=254, blank=True)
+    subject: models.CharField = models.CharField(max_length=255)
+    body: models.TextField = models.TextField()
+    status: models.CharField = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=PENDING
+    )
+    attempts: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    max_attempts: models.PositiveIntegerField = models.PositiveIntegerField(default=5)
+    next_attempt_at: models.DateTimeField = models.DateTimeField(default=timezone.now)
+    # Identifies the delivery run that claimed the row while it is sending
+    claim_token: models.CharField = models.CharField(max_length=32, blank=True)
+    claimed_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+    last_error: models.TextField = models.TextField(blank=True)
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+    sent_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name = "Outbox email"
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"], name="research_outbox_due_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.subject} -> {self.to_email} ({self.status})"
+
+
+def refresh_project_thumbnails(projects: models.QuerySet) -> int:
+    """
+    Recompute the denormalized ``thumbnail`` of ``projects`` in a single UPDATE.
+
+    Returns the number of rows updated.
+    """
+    first_image = (
+        ProjectImage.objects.filter(project=OuterRef("pk"))
+        .exclude(image="")
+        .order_by("id")
+        .values("image")[:1]
+    )
+    return projects.update(
+        thumbnail=Coalesce(
+            Subquery(first_image),
+            NullIf("poster_image", Value("")),
+            NullIf("pdf_file", Value("")),
+            Value(""),
+        ),
+        # Derived data; not a change to the project
+        updated_at=F("updated_at"),
+    )
+
+
+def record_thumbnail_source(name: str) -> None:
+    """Record that the derivatives of the file stored as ``name`` exist."""
+    ThumbnailSource.objects.bulk_create(
+        [ThumbnailSource(name=name)], ignore_conflicts=True
+    )
+
+
+def load_thumbnail_flags(fields: Iterable[Tuple[models.Model, str]]) -> None:
+    """
+    Set ``<field>_derivatives`` on each ``(instance, field)`` pair: whether the
+    file in that field has derivatives, as read by the thumbnail template
+    filters.  One query for all of a page's files.
+    """
+    fields = list(fields)
+    names = {getattr(instance, field).name for instance, field in fields}
+    names.discard("")
+    names.discard(None)
+    ready = set(
+        ThumbnailSource.objects.filter(name__in=names).values_list("name", flat=True)
+        if names
+        else ()
+    )
+    for instance, field in fields:
+        setattr(instance, f"{field}_derivatives", getattr(instance, field).name in ready)
+
+
+def refresh_semester_keys(projects: models.QuerySet) -> int:
+    """
+    Recompute the stored ``semester_key`` of ``projects`` in a single UPDATE.
+
+    Returns the number of rows updated.
+    """
+    span = projects.aggregate(earliest=Min("date_presented"), latest=Max("date_presented"))
+    if span["earliest"] is None:
+        return projects.update(semester_key=None, updated_at=F("updated_at"))
+    # January dates can belong to the previous year's Winter
+    catalog = get_semester_catalog(span["earliest"].year - 1, span["latest"].year)
+    return projects.update(
+        semester_key=Case(
+            *(
+                When(date_presented__range=(s.start, s.end), then=Value(s.key))
+                for s in catalog
+            ),
+            default=None,
+            output_field=models.PositiveIntegerField(),
+        ),
+        updated_at=F("updated_at"),
+    )
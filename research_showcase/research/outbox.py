@@ -0,0 +1,203 @@
+"""
+Transactional outbox for status-change emails.
+
+Review views render the message and insert an ``OutboxEmail`` row inside the
+same transaction as the status change, so an email exists exactly when the
+change it reports was committed.  ``deliver_outbox()`` then sends pending
+rows in batches over a single reused mail connection instead of opening one
+SMTP connection per message.  It runs from the ``deliver_outbox`` background
+job queued after each review and from ``manage.py send_outbox``.
+
+Each row records its own status and attempt count.  A failed message is
+retried with the job queue's backoff schedule; after ``max_attempts`` it is
+dead-lettered and left for an administrator to inspect.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import F
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .jobs import backoff_delay, enqueue
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE: int = 100
+# Rows still "sending" after this long belong to a delivery run that died
+STALE_CLAIM_SECONDS: int = 15 * 60
+
+DELIVER_TASK: str = "research.deliver_outbox"
+
+
+@dataclass
+class DeliveryReport:
+    sent: int = 0
+    retried: int = 0
+    dead: int = 0
+
+
+def build_status_change_email(project, template_name, feedback=None) -> Optional[OutboxEmail]:
+    """
+    Render an unsaved outbox row for a status-change email to the project's
+    author, or return ``None`` when the author opted out or has no address.
+    """
+    faculty_user = project.author
+
+    # Check if the user wants email notifications and has an email address
+    if (
+        not faculty_user
+        or not faculty_user.email
+        or not faculty_user.notify_by_email_on_status_change
+    ):
+        if faculty_user and not faculty_user.notify_by_email_on_status_change:
+            print(
+                f"Skipping email for '{project.title}': User {faculty_user.username} opted out."
+            )  # Log skip
+        elif not faculty_user or not faculty_user.email:
+            print(
+                f"WARNING: Could not send notification for '{project.title}': Author or email missing."
+            )
+        return None
+
+    context = {
+        "project": project,
+        "faculty_name": faculty_user.get_full_name() or faculty_user.username,
+        "feedback": feedback or project.admin_feedback or "N/A",
+    }
+    # Render subject and message from templates
+    email_content = render_to_string(template_name, context)
+    # Simple subject extraction (assumes first line is Subject: ...)
+    subject = email_content.splitlines()[0]
+    message = "\n".join(email_content.splitlines()[1:]).strip()
+
+    return OutboxEmail(
+        project=project,
+        to_email=faculty_user.email,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        subject=subject[:255],
+        body=message,
+    )
+
+
+def queue_status_change_email(project, template_name, feedback=None) -> Optional[OutboxEmail]:
+    """
+    Write a status-change email to the project's author into the outbox.
+
+    Returns ``None`` when the author opted out or has no email address.
+    Call inside the transaction that changes the status.
+    """
+    email = build_status_change_email(project, template_name, feedback=feedback)
+    if email is not None:
+        email.save()
+    return email
+
+
+def schedule_delivery() -> None:
+    """Make sure a background job will drain the outbox soon."""
+    enqueue(DELIVER_TASK, unique=True)
+
+
+def requeue_stale_claims() -> int:
+    cutoff = timezone.now() - timedelta(seconds=STALE_CLAIM_SECONDS)
+    return OutboxEmail.objects.filter(
+        status=OutboxEmail.SENDING, claimed_at__lt=cutoff
+    ).update(status=OutboxEmail.PENDING, claim_token="", claimed_at=None)
+
+
+def _claim_batch(batch_size: int):
+    """Mark up to ``batch_size`` due rows as sending and return them."""
+    now = timezone.now()
+    due_ids = list(
+        OutboxEmail.objects.filter(status=OutboxEmail.PENDING, next_attempt_at__lte=now)
+        .order_by("id")
+        .values_list("id", flat=True)[:batch_size]
+    )
+    if not due_ids:
+        return []
+    token = uuid.uuid4().hex
+    # Rows another delivery run claimed in the meantime no longer match
+    OutboxEmail.objects.filter(pk__in=due_ids, status=OutboxEmail.PENDING).update(
+        status=OutboxEmail.SENDING,
+        claim_token=token,
+        claimed_at=now,
+        attempts=F("attempts") + 1,
+    )
+    return list(OutboxEmail.objects.filter(claim_token=token).order_by("id"))
+
+
+def _record_results(sent_ids, failures, report: DeliveryReport) -> None:
+    now = timezone.now()
+    if sent_ids:
+        OutboxEmail.objects.filter(pk__in=sent_ids).update(
+            status=OutboxEmail.SENT, sent_at=now, claim_token="", last_error=""
+        )
+        report.sent += len(sent_ids)
+
+    for row, error in failures:
+        row.claim_token = ""
+        row.last_error = error
+        if row.attempts >= row.max_attempts:
+            row.status = OutboxEmail.DEAD
+            report.dead += 1
+            logger.error("Dead-lettered email %s after %s attempts: %s", row.pk, row.attempts, error)
+        else:
+            row.status = OutboxEmail.PENDING
+            row.next_attempt_at = now + backoff_delay(row.attempts)
+            report.retried += 1
+    if failures:
+        OutboxEmail.objects.bulk_update(
+            [row for row, _ in failures],
+            ["status", "claim_token", "last_error", "next_attempt_at"],
+        )
+
+
+def deliver_outbox(batch_size: int = DEFAULT_BATCH_SIZE, connection=None) -> DeliveryReport:
+    """
+    Send every due outbox email over one mail connection, ``batch_size`` rows
+    at a time, and record each message's outcome.
+    """
+    report = DeliveryReport()
+    requeue_stale_claims()
+    connection = connection or get_connection(fail_silently=False)
+    try:
+        connection.open()
+        while True:
+            batch = _claim_batch(batch_size)
+            if not batch:
+                break
+            sent_ids, failures = [], []
+            for row in batch:
+                message = EmailMessage(
+                    subject=row.subject,
+                    body=row.body,
+                    from_email=row.from_email or settings.DEFAULT_FROM_EMAIL,
+                    to=[row.to_email],
+                    connection=connection,
+                )
+                # One message per call so a failure is attributed to its row;
+                # the connection stays open across calls
+                try:
+                    connection.send_messages([message])
+                except Exception as e:
+                    failures.append((row, f"{type(e).__name__}: {e}"))
+                    # The session may be unusable after an error; start afresh
+                    connection.close()
+                    try:
+                        connection.open()
+                    except Exception:
+                        logger.warning("Could not reconnect to the mail server", exc_info=True)
+                else:
+                    sent_ids.append(row.pk)
+            _record_results(sent_ids, failures, report)
+    finally:
+        connection.close()
+    return report
+
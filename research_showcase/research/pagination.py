@@ -0,0 +1,190 @@
+"""
+Keyset (cursor) pagination for the search/browse page.
+
+Offset pagination (``LIMIT n OFFSET k``) makes the database walk and discard
+``k`` rows, so deep pages get slower as the archive grows.  Keyset pagination
+instead remembers the sort key of the last row shown and asks for rows
+strictly after it, which is a bounded range scan on an index matching the
+ordering (see ``ResearchProject.Meta.indexes``).
+
+Cursors are opaque, URL-safe tokens that encode the boundary row's sort key
+and the direction to move in.  They stay valid when rows are added or
+removed elsewhere in the archive.
+"""
+
+import base64
+import binascii
+import json
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+
+DEFAULT_PAGE_SIZE: int = 24
+MAX_PAGE_SIZE: int = 60
+
+FORWARD: str = "n"
+BACKWARD: str = "p"
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token cannot be decoded for this ordering."""
+
+
+def clamp_page_size(value: Optional[str], default: int = DEFAULT_PAGE_SIZE) -> int:
+    """Parse a ``page_size`` query parameter, capped at ``MAX_PAGE_SIZE``."""
+    try:
+        size = int(value) if value else default
+    except (TypeError, ValueError):
+        size = default
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def encode_cursor(direction: str, values: Sequence[Any]) -> str:
+    payload = json.dumps([direction, list(values)], cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[str, List[Any]]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        direction, values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursor(str(e)) from e
+    if direction not in (FORWARD, BACKWARD) or not isinstance(values, list):
+        raise InvalidCursor("Malformed cursor")
+    return direction, values
+
+
+class KeysetPage:
+    """One page of results plus the cursors needed to move away from it."""
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor: Optional[str] = next_cursor
+        self.previous_cursor: Optional[str] = previous_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by a unique ordering.
+
+    ``ordering`` uses ``order_by`` syntax and must end in a unique column
+    (normally ``id``) so that every row has a distinct key.  Sort columns
+    must be non-null; filter out NULLs before paginating.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        ordering: Sequence[str],
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        self.queryset = queryset
+        self.fields: List[Tuple[str, bool]] = [
+            (name.lstrip("-"), name.startswith("-")) for name in ordering
+        ]
+        self.page_size = page_size
+
+    def _order_by(self, reverse: bool) -> List[str]:
+        return [
+            f"-{name}" if descending != reverse else name
+            for name, descending in self.fields
+        ]
+
+    def _key(self, obj) -> List[Any]:
+        return [getattr(obj, name) for name, _ in self.fields]
+
+    def _parse_values(self, values: List[Any]) -> List[Any]:
+        if len(values) != len(self.fields):
+            raise InvalidCursor("Cursor does not match the current ordering")
+        parsed = []
+        for (name, _), value in zip(self.fields, values):
+            if value is None:
+                raise InvalidCursor("Cursor contains a NULL sort key")
+            # Cursors come from the query string, so reject lists, objects
+            # and the Infinity/NaN that json.loads accepts
+            if not isinstance(value, (str, int, float)) or (
+                isinstance(value, float) and not math.isfinite(value)
+            ):
+                raise InvalidCursor("Cursor contains a malformed sort key")
+            try:
+                field = self.queryset.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                # Annotations such as relevance scores
+                field = None
+            try:
+                if field is None:
+                    parsed.append(float(value))
+                else:
+                    # Validators include the database's integer range
+                    parsed.append(field.to_python(value))
+                    field.run_validators(parsed[-1])
+            except (ValidationError, TypeError, ValueError, OverflowError) as e:
+                raise InvalidCursor(str(e)) from e
+        return parsed
+
+    def _beyond(self, values: List[Any], reverse: bool) -> Q:
+        """Rows strictly after ``values`` in the (possibly reversed) ordering."""
+        condition = Q()
+        for i, (name, descending) in enumerate(self.fields):
+            lookup = "lt" if descending != reverse else "gt"
+            term = Q(**{f"{name}__{lookup}": values[i]})
+            for j, (prior_name, _) in enumerate(self.fields[:i]):
+                term &= Q(**{prior_name: values[j]})
+            condition |= term
+        return condition
+
+    def get_page(self, cursor: Optional[str] = None) -> KeysetPage:
+        """
+        Return the page identified by ``cursor`` (the first page when empty).
+
+        Raises ``InvalidCursor`` for tokens that cannot be decoded.
+        """
+        direction, values = FORWARD, None
+        if cursor:
+            direction, raw_values = decode_cursor(cursor)
+            values = self._parse_values(raw_values)
+
+        reverse = direction == BACKWARD
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(self._beyond(values, reverse))
+        # Fetch one extra row to learn whether another page exists
+        rows = list(queryset.order_by(*self._order_by(reverse))[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        if not rows:
+            return KeysetPage([])
+
+        if reverse:
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, values is not None
+
+        return KeysetPage(
+            rows,
+            next_cursor=encode_cursor(FORWARD, self._key(rows[-1])) if has_next else None,
+            previous_cursor=(
+                encode_cursor(BACKWARD, self._key(rows[0])) if has_previous else None
+            ),
+        )
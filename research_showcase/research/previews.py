@@ -0,0 +1,124 @@
+"""
+First-page raster previews of PDF posters and papers.
+
+An ``<img>`` cannot display a PDF, so search cards for projects whose poster
+is a PDF used to show a broken image (and browsers that did try fetched the
+whole multi-MB document).  After upload, the first page is rendered once to
+``<name>.preview.<ext>`` next to the document and run through the usual
+thumbnail pipeline (``research/thumbnails.py``), so cards and the detail page
+get small images like any other upload.
+
+Rendering uses PyMuPDF when it is installed, else poppler's ``pdftoppm``
+binary.  With neither available no preview is produced and templates show a
+placeholder instead.  Uploads queue a job for the ``run_jobs`` worker (see
+research/jobs.py) rather than rendering in the request, so a restart does
+not lose pending previews; ``manage.py generate_thumbnails`` renders
+previews for existing documents.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Callable, List, Optional
+
+from django.core.files.storage import Storage
+from PIL import Image
+
+from .jobs import enqueue
+from .thumbnails import (
+    DERIVATIVE_WIDTHS,
+    generate_derivatives,
+    is_previewable_name,
+    prepare_image,
+    preview_name,
+    write_image,
+)
+
+logger = logging.getLogger(__name__)
+
+# Width the first page is rasterized at; the largest derivative is made from it
+PREVIEW_WIDTH: int = max(DERIVATIVE_WIDTHS.values())
+RENDER_TIMEOUT_SECONDS: int = 60
+PREVIEW_TASK: str = "research.render_pdf_preview"
+
+Renderer = Callable[[bytes, int], Image.Image]
+
+
+def _render_with_pymupdf(data: bytes, width: int) -> Image.Image:
+    import fitz  # PyMuPDF
+
+    with fitz.open(stream=data, filetype="pdf") as document:
+        page = document.load_page(0)
+        zoom = width / page.rect.width
+        pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        return Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+
+
+def _render_with_pdftoppm(data: bytes, width: int) -> Image.Image:
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, "document.pdf")
+        with open(source, "wb") as f:
+            f.write(data)
+        output_root = os.path.join(workdir, "page")
+        subprocess.run(
+            [
+                "pdftoppm", "-f", "1", "-l", "1", "-singlefile", "-png",
+                "-scale-to-x", str(width), "-scale-to-y", "-1",
+                source, output_root,
+            ],
+            check=True,
+            capture_output=True,
+            timeout=RENDER_TIMEOUT_SECONDS,
+        )
+        with Image.open(f"{output_root}.png") as page:
+            # Copy before the temporary file (and the image) is closed
+            return page.copy()
+
+
+def get_renderer() -> Optional[Renderer]:
+    """The best available PDF renderer, or ``None`` if there is none."""
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        return _render_with_pymupdf
+    if shutil.which("pdftoppm"):
+        return _render_with_pdftoppm
+    return None
+
+
+def render_pdf_preview(storage: Storage, name: str, force: bool = False) -> List[str]:
+    """
+    Render the first page of the PDF ``name`` and its thumbnail derivatives.
+
+    The preview is cached on disk: an existing one is reused unless ``force``
+    is set.  Returns the names written; failures are logged, not raised.
+    """
+    if not is_previewable_name(name):
+        return []
+    target = preview_name(name)
+    written = []
+    if force or not storage.exists(target):
+        renderer = get_renderer()
+        if renderer is None:
+            logger.info("No PDF renderer installed; skipping preview of %s", name)
+            return []
+        try:
+            with storage.open(name, "rb") as document:
+                page = renderer(document.read(), PREVIEW_WIDTH)
+        except Exception as e:  # Renderers raise their own error types
+            logger.warning("Cannot render a preview of %s: %s", name, e)
+            return []
+        written.append(write_image(storage, target, prepare_image(page), PREVIEW_WIDTH))
+    return written + generate_derivatives(storage, target, force=force, record_as=name)
+
+
+def schedule_pdf_preview(name: str) -> None:
+    """
+    Queue a job rendering the preview of ``name`` from default storage.
+    Call inside the transaction that stores the upload.
+    """
+    enqueue(PREVIEW_TASK, unique=True, path=name)
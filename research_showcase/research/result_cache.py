@@ -0,0 +1,94 @@
+"""
+Cached search result pages.
+
+Public search traffic repeats the same few queries, so ``search_research``
+caches each result page as the ordered list of project ids plus its
+pagination cursors, keyed on the normalized request (query, semester range,
+facet filters, sort, cursor and page size).  A hit costs one primary-key
+lookup instead of the search, filter and sort queries; the template is still
+rendered per request, so ids stay valid whatever the page looks like.
+
+Keys embed the catalog version token (``research.catalog.catalog_version``),
+which is replaced whenever an approved project is saved, approved, withdrawn
+or deleted, so invalidation never has to find the affected pages.
+
+``SEARCH_RESULT_CACHE_TIMEOUT`` (seconds) bounds how long an entry lives;
+``0`` disables the cache.  Hits and misses are counted in the cache so that
+``manage.py search_cache_stats`` can report the hit rate across processes
+sharing a cache backend.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .catalog import CATALOG_CACHE_TIMEOUT, catalog_version
+
+HITS_KEY: str = "research:results:hits"
+MISSES_KEY: str = "research:results:misses"
+
+
+@dataclass
+class CachedPage:
+    ids: List[int]
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+
+
+@dataclass
+class ResultCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def result_cache_timeout() -> int:
+    return getattr(settings, "SEARCH_RESULT_CACHE_TIMEOUT", CATALOG_CACHE_TIMEOUT)
+
+
+def result_cache_key(**params) -> str:
+    """Versioned key for one normalized search request."""
+    digest = hashlib.sha1(
+        json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"research:results:{catalog_version()}:{digest}"
+
+
+def _count(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Lost or never set; add() so a concurrent first count is not clobbered
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_cached_page(key: str) -> Optional[CachedPage]:
+    if not result_cache_timeout():
+        return None
+    page = cache.get(key)
+    _count(HITS_KEY if page is not None else MISSES_KEY)
+    return page
+
+
+def cache_page(key: str, page: CachedPage) -> None:
+    timeout = result_cache_timeout()
+    if timeout:
+        cache.set(key, page, timeout)
+
+
+def result_cache_stats() -> ResultCacheStats:
+    counts = cache.get_many([HITS_KEY, MISSES_KEY])
+    return ResultCacheStats(hits=counts.get(HITS_KEY, 0), misses=counts.get(MISSES_KEY, 0))
+
+
+def reset_result_cache_stats() -> None:
+    cache.delete_many([HITS_KEY, MISSES_KEY])
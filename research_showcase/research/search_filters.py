@@ -0,0 +1,87 @@
+"""
+Filters and orderings of the search page, shared with the archive export.
+
+``search_research`` and ``research/export.py`` accept the same parameters
+('q', semester range, 'sponsor', 'has' and 'sort_by'); this module turns them
+into a queryset so both stay in step.
+"""
+
+from typing import Iterable, Optional
+
+from django.db.models import F, Q, QuerySet
+
+from .search_index import rank_projects, search_projects
+
+# Sort modes offered on the search page and their ORDER BY clauses.
+# "relevance" is only available when there is a text query. Each ordering
+# ends in id so it is unique, as keyset pagination requires.
+SEARCH_SORT_ORDERS = {
+    "relevance": ("relevance", "id"),
+    "date": ("-date_presented", "-id"),
+    "title": ("title", "id"),
+}
+
+
+# Attachment facets: URL value -> (label, filter)
+SEARCH_ATTACHMENT_FILTERS = {
+    "paper": ("Paper", Q(pdf_file__gt="")),
+    "github": ("Code on GitHub", Q(github_link__gt="")),
+    "video": ("Video", Q(video_link__gt="")),
+}
+
+
+def resolve_sort(requested: str, query: str) -> str:
+    """Relevance is the default whenever there is a query, date otherwise."""
+    if requested not in SEARCH_SORT_ORDERS or (requested == "relevance" and not query):
+        requested = ""
+    return requested or ("relevance" if query else "date")
+
+
+def clean_attachments(values: Iterable[str]) -> list:
+    return [value for value in values if value in SEARCH_ATTACHMENT_FILTERS]
+
+
+def filter_projects(
+    projects: QuerySet,
+    query: str = "",
+    start_key: Optional[int] = None,
+    end_key: Optional[int] = None,
+    sponsor: str = "",
+    attachments: Iterable[str] = (),
+    sort_by: str = "date",
+) -> QuerySet:
+    """
+    Apply the search page's filters to ``projects``.
+
+    ``start_key``/``end_key`` are semester keys (see semester_utils).  Ranked
+    (``sort_by="relevance"``) results carry a ``relevance`` annotation; the
+    caller applies the ordering.
+    """
+    # Apply text search through the full-text index if provided; relevance
+    # scores are computed by the index itself (BM25 on SQLite)
+    if query and sort_by == "relevance":
+        projects = rank_projects(projects, query)
+    elif query:
+        projects = search_projects(projects, query)
+
+    # Apply the semester range through the stored, indexed semester key.
+    # Ranked queries must stay driven by the full-text index: given a range
+    # on an indexed column, SQLite walks that range instead and re-runs the
+    # MATCH for every row, so they compare an unindexable copy of the key.
+    semester_key = "semester_key"
+    if query and sort_by == "relevance":
+        projects = projects.alias(unindexed_semester_key=F("semester_key") + 0)
+        semester_key = "unindexed_semester_key"
+
+    if start_key is not None:
+        projects = projects.filter(**{f"{semester_key}__gte": start_key})
+
+    if end_key is not None:
+        projects = projects.filter(**{f"{semester_key}__lte": end_key})
+
+    # Apply facet filters
+    if sponsor:
+        projects = projects.filter(project_sponsor=sponsor)
+    for value in attachments:
+        projects = projects.filter(SEARCH_ATTACHMENT_FILTERS[value][1])
+    return projects
@@ -0,0 +1,346 @@
+"""
+Full-text search index for research projects.
+
+The search page used to filter with ``icontains`` lookups, which compile to
+``LIKE '%term%'`` and force a scan of every approved project.  This module
+keeps a separate full-text index over the searchable text columns of
+``ResearchProject`` and exposes a small backend abstraction so the same view
+code works on every database we deploy to:
+
+- SQLite: an FTS5 virtual table (``research_projectsearch``) keyed by rowid.
+- PostgreSQL: a ``tsvector`` table with a GIN index.
+- Anything else: the original ``icontains`` filter (no index).
+
+Backends can also rank matches by relevance inside the database (BM25 on
+SQLite, weighted ``ts_rank_cd`` on PostgreSQL), with title weighted above
+abstract above sponsor.
+
+The index tables are created by migration ``0006_project_search_index`` and
+kept in sync by the signal handlers in ``research/signals.py``.  Writes that
+bypass signals (``bulk_create``, raw SQL) should call ``reindex()`` with the
+affected ids, or run ``manage.py rebuild_search_index``.
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, List, Optional
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TABLE: str = "research_projectsearch"
+PROJECT_TABLE: str = "research_researchproject"
+
+# Columns copied into the index, in index column order.
+INDEXED_FIELDS: List[str] = [
+    "title",
+    "abstract",
+    "project_sponsor",
+    "student_author_name",
+    "collaborator_names",
+]
+
+# Relevance weights per indexed column: title > abstract > sponsor > people
+RANK_WEIGHTS: Dict[str, float] = {
+    "title": 10.0,
+    "abstract": 4.0,
+    "project_sponsor": 2.0,
+    "student_author_name": 1.0,
+    "collaborator_names": 1.0,
+}
+
+# Guard against pathological queries pasted into the search box
+MAX_QUERY_TERMS: int = 12
+# Keep id lists well under SQLite's bound-parameter limit
+REINDEX_CHUNK_SIZE: int = 500
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize_query(query: str) -> List[str]:
+    """Split raw user input into lowercase search terms.
+
+    Only word characters survive, so the terms can be embedded in FTS5 or
+    tsquery syntax without any further escaping.
+    """
+    return _TERM_RE.findall((query or "").lower())[:MAX_QUERY_TERMS]
+
+
+def _chunked(ids: List[int], size: int = REINDEX_CHUNK_SIZE) -> Iterable[List[int]]:
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+class SearchBackend:
+    """
+    Base class for full-text search backends.
+
+    Subclasses restrict a ``ResearchProject`` queryset to the rows matching
+    a user query and keep their index table in step with the project table.
+    """
+
+    vendor: Optional[str] = None
+
+    def __init__(self, using: str = DEFAULT_DB_ALIAS):
+        self.using = using
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    def is_available(self) -> bool:
+        return True
+
+    def filter(self, queryset: QuerySet, query: str) -> QuerySet:
+        raise NotImplementedError
+
+    def rank(self, queryset: QuerySet, query: str) -> QuerySet:
+        """
+        Filter ``queryset`` to matches and annotate each row with ``relevance``.
+
+        Lower ``relevance`` means a better match, so callers sort ascending
+        (``order_by("relevance", "id")``).
+        """
+        raise NotImplementedError
+
+    def reindex(self, project_ids: Optional[Iterable[int]] = None) -> None:
+        """Refresh index rows for ``project_ids`` (all projects when None)."""
+        raise NotImplementedError
+
+    def remove(self, project_ids: Iterable[int]) -> None:
+        raise NotImplementedError
+
+
+class LikeSearchBackend(SearchBackend):
+    """Fallback for databases without a supported full-text engine."""
+
+    def filter(self, queryset: QuerySet, query: str) -> QuerySet:
+        if not query:
+            return queryset
+        condition = Q()
+        for field in INDEXED_FIELDS:
+            condition |= Q(**{f"{field}__icontains": query})
+        return queryset.filter(condition)
+
+    def rank(self, queryset: QuerySet, query: str) -> QuerySet:
+        # No scoring without an index; every match ties
+        return self.filter(queryset, query).annotate(
+            relevance=Value(0.0, output_field=FloatField())
+        )
+
+    def reindex(self, project_ids: Optional[Iterable[int]] = None) -> None:
+        pass
+
+    def remove(self, project_ids: Iterable[int]) -> None:
+        pass
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """Full-text search through an FTS5 virtual table whose rowid is the project id."""
+
+    vendor = "sqlite"
+
+    def __init__(self, using: str = DEFAULT_DB_ALIAS):
+        super().__init__(using)
+        self._available: Optional[bool] = None
+
+    def is_available(self) -> bool:
+        # The migration skips the table when SQLite was built without FTS5
+        if self._available is None:
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                    [SEARCH_TABLE],
+                )
+                self._available = cursor.fetchone() is not None
+        return self._available
+
+    @staticmethod
+    def build_match(query: str) -> str:
+        # Every term must match; the trailing * turns each into a prefix
+        # query so partially typed words still find results.
+        return " ".join(f'"{term}"*' for term in tokenize_query(query))
+
+    def filter(self, queryset: QuerySet, query: str) -> QuerySet:
+        match = self.build_match(query)
+        if not match:
+            return queryset
+        return queryset.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s",
+                (match,),
+            )
+        )
+
+    def rank(self, queryset: QuerySet, query: str) -> QuerySet:
+        match = self.build_match(query)
+        if not match:
+            return queryset.annotate(relevance=Value(0.0, output_field=FloatField()))
+        # bm25() only works in a query that MATCHes the FTS table itself, so
+        # join the index in rather than filtering through a subquery.
+        # The score is an annotation (not an extra select) so it can also be
+        # filtered on, e.g. by keyset pagination cursors.
+        weights = ", ".join(str(RANK_WEIGHTS[field]) for field in INDEXED_FIELDS)
+        return queryset.extra(
+            tables=[SEARCH_TABLE],
+            where=[
+                f"{SEARCH_TABLE}.rowid = {PROJECT_TABLE}.id",
+                f"{SEARCH_TABLE} MATCH %s",
+            ],
+            params=[match],
+        ).annotate(
+            relevance=RawSQL(
+                f"bm25({SEARCH_TABLE}, {weights})", (), output_field=FloatField()
+            )
+        )
+
+    def reindex(self, project_ids: Optional[Iterable[int]] = None) -> None:
+        columns = ", ".join(INDEXED_FIELDS)
+        values = ", ".join(f"COALESCE({field}, '')" for field in INDEXED_FIELDS)
+        insert = (
+            f"INSERT INTO {SEARCH_TABLE} (rowid, {columns}) "
+            f"SELECT id, {values} FROM {PROJECT_TABLE}"
+        )
+        with self.connection.cursor() as cursor:
+            if project_ids is None:
+                cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+                cursor.execute(insert)
+                return
+            for chunk in _chunked(list(project_ids)):
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(
+                    f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({placeholders})",
+                    chunk,
+                )
+                cursor.execute(f"{insert} WHERE id IN ({placeholders})", chunk)
+
+    def remove(self, project_ids: Iterable[int]) -> None:
+        with self.connection.cursor() as cursor:
+            for chunk in _chunked(list(project_ids)):
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(
+                    f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({placeholders})",
+                    chunk,
+                )
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Full-text search through a weighted ``tsvector`` column with a GIN index."""
+
+    vendor = "postgresql"
+    config: str = "english"
+    # Title > abstract > sponsor > people, mapped onto tsvector weights
+    WEIGHTS: Dict[str, str] = {
+        "title": "A",
+        "abstract": "B",
+        "project_sponsor": "C",
+        "student_author_name": "D",
+        "collaborator_names": "D",
+    }
+
+    # ts_rank_cd weight array is ordered {D, C, B, A}
+    RANK_WEIGHT_ARRAY: str = "{0.1, 0.2, 0.4, 1.0}"
+    # Divide by 1 + log(document length), the closest to BM25 length damping
+    RANK_NORMALIZATION: int = 1
+
+    @staticmethod
+    def build_tsquery(query: str) -> str:
+        return " & ".join(f"{term}:*" for term in tokenize_query(query))
+
+    def filter(self, queryset: QuerySet, query: str) -> QuerySet:
+        tsquery = self.build_tsquery(query)
+        if not tsquery:
+            return queryset
+        return queryset.filter(
+            id__in=RawSQL(
+                f"SELECT project_id FROM {SEARCH_TABLE} "
+                f"WHERE document @@ to_tsquery('{self.config}', %s)",
+                (tsquery,),
+            )
+        )
+
+    def rank(self, queryset: QuerySet, query: str) -> QuerySet:
+        tsquery = self.build_tsquery(query)
+        if not tsquery:
+            return queryset.annotate(relevance=Value(0.0, output_field=FloatField()))
+        # PostgreSQL has no built-in BM25; ts_rank_cd over the weighted
+        # document is computed in the database the same way.  Negated so
+        # that, as with bm25(), lower means more relevant.
+        return queryset.extra(
+            tables=[SEARCH_TABLE],
+            where=[
+                f"{SEARCH_TABLE}.project_id = {PROJECT_TABLE}.id",
+                f"{SEARCH_TABLE}.document @@ to_tsquery('{self.config}', %s)",
+            ],
+            params=[tsquery],
+        ).annotate(
+            relevance=RawSQL(
+                f"-ts_rank_cd('{self.RANK_WEIGHT_ARRAY}', {SEARCH_TABLE}.document, "
+                f"to_tsquery('{self.config}', %s), {self.RANK_NORMALIZATION})",
+                (tsquery,),
+                output_field=FloatField(),
+            )
+        )
+
+    def _document_sql(self) -> str:
+        return " || ".join(
+            f"setweight(to_tsvector('{self.config}', COALESCE({field}, '')), '{weight}')"
+            for field, weight in self.WEIGHTS.items()
+        )
+
+    def reindex(self, project_ids: Optional[Iterable[int]] = None) -> None:
+        upsert = (
+            f"INSERT INTO {SEARCH_TABLE} (project_id, document) "
+            f"SELECT id, {self._document_sql()} FROM {PROJECT_TABLE}"
+        )
+        conflict = " ON CONFLICT (project_id) DO UPDATE SET document = EXCLUDED.document"
+        with self.connection.cursor() as cursor:
+            if project_ids is None:
+                cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+                cursor.execute(upsert + conflict)
+                return
+            for chunk in _chunked(list(project_ids)):
+                cursor.execute(f"{upsert} WHERE id = ANY(%s){conflict}", [chunk])
+
+    def remove(self, project_ids: Iterable[int]) -> None:
+        with self.connection.cursor() as cursor:
+            for chunk in _chunked(list(project_ids)):
+                cursor.execute(
+                    f"DELETE FROM {SEARCH_TABLE} WHERE project_id = ANY(%s)", [chunk]
+                )
+
+
+BACKENDS = {
+    backend.vendor: backend for backend in (SQLiteFTS5Backend, PostgresSearchBackend)
+}
+
+_backend_cache: Dict[str, SearchBackend] = {}
+
+
+def get_search_backend(using: str = DEFAULT_DB_ALIAS) -> SearchBackend:
+    """Return the search backend for the given database alias."""
+    backend = _backend_cache.get(using)
+    if backend is None:
+        backend_class = BACKENDS.get(connections[using].vendor, LikeSearchBackend)
+        backend = backend_class(using)
+        if not backend.is_available():
+            logger.warning(
+                "Full-text index %s is missing; falling back to LIKE search.",
+                SEARCH_TABLE,
+            )
+            backend = LikeSearchBackend(using)
+        _backend_cache[using] = backend
+    return backend
+
+
+def search_projects(queryset: QuerySet, query: str) -> QuerySet:
+    """Restrict a ResearchProject queryset to projects matching ``query``."""
+    return get_search_backend(queryset.db).filter(queryset, query)
+
+
+def rank_projects(queryset: QuerySet, query: str) -> QuerySet:
+    """Like ``search_projects`` but annotates ``relevance`` (lower is better)."""
+    return get_search_backend(queryset.db).rank(queryset, query)
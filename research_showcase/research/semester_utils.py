@@ -1,4 +1,8 @@
+from bisect import bisect_left, bisect_right
 from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple, Optional
 
 SEMESTER_PATTERNS = {
     'Spring': {'start_month': 1, 'start_day': 10, 'end_month': 5, 'end_day': 10},
@@ -7,6 +11,32 @@ SEMESTER_PATTERNS = {
     'Winter': {'start_month': 12, 'start_day': 16, 'end_month': 1, 'end_day': 9}
 }
 
+# Season order within a year; also the last digit of a semester key
+SEASONS = tuple(SEMESTER_PATTERNS)
+
+
+def semester_key(name):
+    """
+    Sortable integer for a semester name: ``year * 10 + season index``, so
+    'Fall 2023' is 20232.  Winter is keyed by the year it starts in.
+    """
+    season, year = name.split()
+    return int(year) * 10 + SEASONS.index(season)
+
+
+def semester_name(key):
+    return f'{SEASONS[key % 10]} {key // 10}'
+
+
+def semester_key_for_date(day):
+    """Key of the semester containing ``day``, or ``None`` for no date."""
+    if day is None:
+        return None
+    # January dates may still belong to the previous year's Winter
+    semester = get_semester_catalog(day.year - 1, day.year).last_starting_on_or_before(day)
+    return semester.key
+
+
 def generate_semesters(start_year, end_year):
     semesters = {}
     
@@ -25,14 +55,76 @@ def generate_semesters(start_year, end_year):
     
     return semesters
 
+class Semester(NamedTuple):
+    name: str
+    start: date
+    end: date
+    ordinal: int  # Position in its catalog, earliest first
+    key: int  # See semester_key(); stored as ResearchProject.semester_key
+
+
+class SemesterCatalog:
+    """
+    The semesters of a span of years in chronological order, with constant
+    time lookups by name.  Instances are immutable and shared; get them from
+    ``get_semester_catalog``.
+    """
+
+    __slots__ = ('semesters', 'names', '_by_name', '_starts', '_ends')
+
+    def __init__(self, start_year, end_year):
+        ranges = generate_semesters(start_year, end_year)
+        # SEMESTER_PATTERNS lists the seasons in calendar order and the
+        # ranges do not overlap, so sorting by start date is chronological
+        ordered = sorted(ranges.items(), key=lambda item: item[1]['start'])
+        semesters = tuple(
+            Semester(name, dates['start'], dates['end'], ordinal, semester_key(name))
+            for ordinal, (name, dates) in enumerate(ordered)
+        )
+        # Catalogs are shared between requests, so they refuse assignment
+        # (see __setattr__) and are filled in through object.__setattr__
+        init = object.__setattr__
+        init(self, 'semesters', semesters)
+        init(self, 'names', tuple(s.name for s in semesters))
+        init(self, '_by_name', MappingProxyType({s.name: s for s in semesters}))
+        init(self, '_starts', tuple(s.start for s in semesters))
+        init(self, '_ends', tuple(s.end for s in semesters))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('SemesterCatalog is immutable')
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __iter__(self):
+        return iter(self.semesters)
+
+    def __len__(self):
+        return len(self.semesters)
+
+    def get(self, name) -> Optional[Semester]:
+        return self._by_name.get(name)
+
+    def first_ending_on_or_after(self, day) -> Optional[Semester]:
+        """The earliest semester that ends on or after ``day``."""
+        i = bisect_left(self._ends, day)
+        return self.semesters[i] if i < len(self.semesters) else None
+
+    def last_starting_on_or_before(self, day) -> Optional[Semester]:
+        """The latest semester that starts on or before ``day``."""
+        i = bisect_right(self._starts, day)
+        return self.semesters[i - 1] if i else None
+
+
+@lru_cache(maxsize=32)
+def get_semester_catalog(start_year, end_year) -> SemesterCatalog:
+    """The (memoized) catalog of semesters from ``start_year`` to ``end_year``."""
+    return SemesterCatalog(start_year, end_year)
+
+
 def get_semester_choices(start_year, end_year):
-    semesters = generate_semesters(start_year, end_year)
-    # Sort by year then by standard season order
-    season_order = {'Fall': 0, 'Winter': 1, 'Spring': 2, 'Summer': 3 }
-    return [(key, key) for key in sorted(
-        semesters.keys(),
-        key=lambda x: (int(x.split()[1]), season_order[x.split()[0]])
-    )]
+    # Chronological, the same order as the search page's dropdowns
+    return [(name, name) for name in get_semester_catalog(start_year, end_year).names]
 
 # Pre-generate common data
 CURRENT_YEAR = date.today().year
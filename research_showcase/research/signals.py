@@ -0,0 +1,144 @@
+"""
+Signal handlers that keep derived data in step with ResearchProject writes.
+
+Connected in ``ResearchConfig.ready()``.
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .catalog import bump_catalog_version, invalidate_catalog_cache
+from .models import ProjectImage, ResearchProject, refresh_project_thumbnails
+from .previews import schedule_pdf_preview
+from .search_index import get_search_backend
+from .thumbnails import is_image_name, is_previewable_name, schedule_derivatives
+
+
+@receiver(post_save, sender=ResearchProject)
+def index_project_on_save(sender, instance, using=None, **kwargs):
+    """Refresh the project's full-text index row after every save."""
+    get_search_backend(using).reindex([instance.pk])
+
+
+@receiver(post_delete, sender=ResearchProject)
+def remove_project_from_index(sender, instance, using=None, **kwargs):
+    get_search_backend(using).remove([instance.pk])
+
+
+@receiver(post_save, sender=ResearchProject)
+def refresh_thumbnail_on_save(sender, instance, using=None, update_fields=None, **kwargs):
+    """Pick up poster/paper changes; saves that cannot touch them are skipped."""
+    if update_fields is not None and not {"poster_image", "pdf_file"} & set(update_fields):
+        return
+    refresh_project_thumbnails(
+        ResearchProject.objects.using(using).filter(pk=instance.pk)
+    )
+
+
+@receiver(post_save, sender=ProjectImage)
+@receiver(post_delete, sender=ProjectImage)
+def refresh_thumbnail_on_image_change(sender, instance, using=None, **kwargs):
+    refresh_project_thumbnails(
+        ResearchProject.objects.using(using).filter(pk=instance.project_id)
+    )
+
+
+@receiver(post_save, sender=ProjectImage)
+@receiver(post_delete, sender=ProjectImage)
+def touch_project_on_image_change(sender, instance, using=None, **kwargs):
+    """The gallery is part of the project page; record the change time."""
+    ResearchProject.objects.using(using).filter(pk=instance.project_id).update(
+        updated_at=timezone.now()
+    )
+
+
+def _schedule_derivatives(fieldfile):
+    """
+    Queue the rendering of an upload's derivatives (or PDF preview) for the
+    ``run_jobs`` worker; the job commits or rolls back with the upload.
+    """
+    if not fieldfile:
+        return
+    if is_image_name(fieldfile.name):
+        schedule_derivatives(fieldfile.name)
+    elif is_previewable_name(fieldfile.name):
+        schedule_pdf_preview(fieldfile.name)
+
+
+@receiver(post_save, sender=ProjectImage)
+def generate_image_derivatives(sender, instance, using=None, **kwargs):
+    _schedule_derivatives(instance.image)
+
+
+@receiver(post_save, sender=ResearchProject)
+def generate_document_derivatives(sender, instance, using=None, update_fields=None, **kwargs):
+    for field in ("poster_image", "pdf_file"):
+        if update_fields is None or field in update_fields:
+            _schedule_derivatives(getattr(instance, field))
+
+
+def _catalog_state(instance):
+    # Read __dict__ so deferred fields stay unloaded; None means "unknown"
+    return instance.__dict__.get("approval_status"), instance.__dict__.get("date_presented")
+
+
+@receiver(post_init, sender=ResearchProject)
+def remember_catalog_state(sender, instance, **kwargs):
+    instance._loaded_catalog_state = _catalog_state(instance)
+
+
+@receiver(post_save, sender=ResearchProject)
+def invalidate_catalog_on_save(
+    sender, instance, created=False, using=None, update_fields=None, **kwargs
+):
+    """Drop cached catalog facts when a project enters, leaves or moves within it."""
+    if update_fields is not None and not {"approval_status", "date_presented"} & set(
+        update_fields
+    ):
+        return
+    was_status, was_date = (None, None) if created else instance._loaded_catalog_state
+    status, presented = _catalog_state(instance)
+    if created:
+        changed = status != "pending"
+    else:
+        changed = (
+            was_status is None
+            or status != was_status
+            or (status == "approved" and presented != was_date)
+        )
+    if changed:
+        invalidate_catalog_cache(using)
+    instance._loaded_catalog_state = (status, presented)
+
+
+# Fields that decide whether and where an approved project shows up in search
+# results and facets
+SEARCHABLE_FIELDS = frozenset(
+    {
+        "title",
+        "abstract",
+        "student_author_name",
+        "collaborator_names",
+        "project_sponsor",
+        "pdf_file",
+        "github_link",
+        "video_link",
+    }
+)
+
+
+@receiver(post_save, sender=ResearchProject)
+def bump_catalog_version_on_save(sender, instance, using=None, update_fields=None, **kwargs):
+    """Retire cached per-query results when a public project is edited."""
+    if update_fields is not None and not SEARCHABLE_FIELDS & set(update_fields):
+        return
+    # Membership changes are handled by invalidate_catalog_on_save
+    if instance.__dict__.get("approval_status") in (None, "approved"):
+        bump_catalog_version(using)
+
+
+@receiver(post_delete, sender=ResearchProject)
+def invalidate_catalog_on_delete(sender, instance, using=None, **kwargs):
+    if instance.__dict__.get("approval_status") in (None, "approved"):
+        invalidate_catalog_cache(using)
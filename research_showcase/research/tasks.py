@@ -0,0 +1,42 @@
+"""
+Background tasks run by the ``run_jobs`` worker (see research/jobs.py).
+
+Imported from ``ResearchConfig.ready()`` so every process knows the tasks.
+"""
+
+from django.core.files.storage import default_storage
+
+from .jobs import enqueue, task
+from .models import OutboxEmail
+from .outbox import DELIVER_TASK, deliver_outbox
+from .previews import PREVIEW_TASK, render_pdf_preview
+from .thumbnails import DERIVATIVES_TASK, generate_derivatives
+
+
+@task(DELIVER_TASK)
+def deliver_outbox_emails():
+    """Drain the email outbox, then come back for messages waiting on backoff."""
+    deliver_outbox()
+    retry = (
+        OutboxEmail.objects.filter(status=OutboxEmail.PENDING)
+        .order_by("next_attempt_at")
+        .first()
+    )
+    if retry is not None:
+        job = enqueue(DELIVER_TASK, unique=True)
+        if job.run_at < retry.next_attempt_at:
+            job.run_at = retry.next_attempt_at
+            job.save(update_fields=["run_at"])
+
+
+
+@task(PREVIEW_TASK)
+def render_document_preview(path):
+    """Render the first-page preview of an uploaded PDF and its thumbnails."""
+    render_pdf_preview(default_storage, path)
+
+
+@task(DERIVATIVES_TASK)
+def generate_image_derivatives(path):
+    """Write the resized derivatives of an uploaded image."""
+    generate_derivatives(default_storage, path)
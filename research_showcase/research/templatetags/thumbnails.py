@@ -0,0 +1,38 @@
+from django import template
+
+from ..thumbnails import (
+    DERIVATIVE_WIDTHS,
+    SRCSET_VARIANTS,
+    derivative_urls,
+    is_image_name,
+)
+
+register = template.Library()
+
+
+@register.filter
+def thumbnail_url(fieldfile, variant="card"):
+    """
+    URL of a resized derivative, or of the original image if the file has no
+    recorded derivatives (see ``load_thumbnail_flags``).
+
+    Empty for documents (PDFs) whose preview has not been rendered, since an
+    ``<img>`` cannot display the document itself.
+    """
+    if not fieldfile:
+        return ""
+    urls = derivative_urls(fieldfile, [variant])
+    if variant in urls:
+        return urls[variant]
+    return fieldfile.url if is_image_name(fieldfile.name) else ""
+
+
+@register.filter
+def thumbnail_srcset(fieldfile, size="card"):
+    """``srcset`` value listing the derivatives available for ``size``."""
+    if not fieldfile:
+        return ""
+    urls = derivative_urls(fieldfile, SRCSET_VARIANTS[size])
+    return ", ".join(
+        f"{url} {DERIVATIVE_WIDTHS[variant]}w" for variant, url in urls.items()
+    )
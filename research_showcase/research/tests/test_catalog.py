@@ -0,0 +1,161 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ..catalog import DATE_RANGE_KEY, approved_date_range, search_facets
+from ..models import ResearchProject
+from ..semester_utils import semester_key
+
+User = get_user_model()
+
+
+class ApprovedDateRangeCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(username="catalog_author", password="password")
+        self.project = ResearchProject.objects.create(
+            title="Catalogued",
+            abstract="Abstract",
+            author=self.author,
+            approval_status="approved",
+            date_presented=date(2022, 4, 1),
+        )
+
+    def _project(self, **fields):
+        return ResearchProject.objects.create(
+            title="Another", abstract="Abstract", author=self.author, **fields
+        )
+
+    def _is_cached(self):
+        return cache.get(DATE_RANGE_KEY) is not None
+
+    def test_search_page_reuses_cached_range(self):
+        self.client.get(reverse("search_research"))
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("search_research"))
+        self.assertEqual(response.status_code, 200)
+        for query in ctx.captured_queries:
+            self.assertNotIn("MIN(", query["sql"].upper())
+
+    def test_catalog_changes_invalidate(self):
+        self.assertEqual(approved_date_range(), (date(2022, 4, 1), date(2022, 4, 1)))
+
+        later = self._project(approval_status="pending", date_presented=date(2024, 4, 1))
+        self.assertTrue(self._is_cached())  # Pending submissions are not public
+        later.approval_status = "approved"
+        later.save()
+        self.assertEqual(approved_date_range(), (date(2022, 4, 1), date(2024, 4, 1)))
+
+        self.project.date_presented = date(2020, 1, 20)
+        self.project.save()
+        self.assertEqual(approved_date_range(), (date(2020, 1, 20), date(2024, 4, 1)))
+
+        later.delete()
+        self.assertEqual(approved_date_range(), (date(2020, 1, 20), date(2020, 1, 20)))
+
+        self.project.approval_status = "rejected"
+        self.project.save()
+        self.assertEqual(approved_date_range(), (None, None))
+
+    def test_unrelated_edits_keep_cache(self):
+        approved_date_range()
+        self.project.title = "Renamed"
+        self.project.save()
+        project = ResearchProject.objects.only("id", "title").get(pk=self.project.pk)
+        project.title = "Renamed again"
+        project.save(update_fields=["title"])
+        self.assertTrue(self._is_cached())
+
+    def test_created_approved_projects_invalidate(self):
+        approved_date_range()
+        self._project(approval_status="approved", date_presented=date(2025, 1, 15))
+        self.assertEqual(approved_date_range()[1], date(2025, 1, 15))
+
+    def test_bulk_approval_invalidates(self):
+        pending = self._project(approval_status="pending", date_presented=date(2026, 2, 1))
+        User.objects.create_user(username="catalog_admin", password="password", role="admin")
+        self.client.login(username="catalog_admin", password="password")
+        approved_date_range()
+        self.client.post(
+            reverse("bulk_review"), {"project_ids": [pending.id], "action": "approve"}
+        )
+        self.assertEqual(approved_date_range()[1], date(2026, 2, 1))
+
+
+class SearchFacetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(username="facet_author", password="password")
+        self.project = self._project(
+            "Robot Arms",
+            date(2023, 9, 1),
+            project_sponsor="NASA",
+            pdf_file="research_papers/arms.pdf",
+            github_link="https://github.com/example/arms",
+        )
+        self._project("Robot Legs", date(2023, 9, 20), project_sponsor="NASA")
+        self._project(
+            "Soil Study", date(2024, 3, 1), video_link="https://example.com/soil"
+        )
+        self._project("Hidden Robot", date(2024, 3, 1), approval_status="pending")
+
+    def _project(self, title, presented, approval_status="approved", **fields):
+        return ResearchProject.objects.create(
+            title=title,
+            abstract="Abstract",
+            author=self.author,
+            approval_status=approval_status,
+            date_presented=presented,
+            **fields,
+        )
+
+    def test_counts_come_from_one_query(self):
+        with self.assertNumQueries(1):
+            facets = search_facets()
+        self.assertEqual(facets.total, 3)
+        self.assertEqual(
+            facets.semesters,
+            [(semester_key("Fall 2023"), 2), (semester_key("Spring 2024"), 1)],
+        )
+        self.assertEqual(facets.sponsors, [("NASA", 2)])
+        self.assertEqual((facets.has_paper, facets.has_github, facets.has_video), (1, 1, 1))
+
+        robots = search_facets("robot")
+        self.assertEqual((robots.total, robots.has_video), (2, 0))
+
+    def test_cached_per_normalized_query(self):
+        search_facets("Robot  arms")
+        with self.assertNumQueries(0):
+            self.assertEqual(search_facets(" robot ARMS").total, 1)
+
+    def test_public_edits_retire_cached_facets(self):
+        self.assertEqual(search_facets("robot").has_video, 0)
+        self.project.video_link = "https://example.com/arms"
+        self.project.save()
+        self.assertEqual(search_facets("robot").has_video, 1)
+
+        self._project("Robot Eyes", date(2024, 3, 2))
+        self.assertEqual(search_facets("robot").total, 3)
+
+    def test_search_page_links_facets(self):
+        url = reverse("search_research")
+        response = self.client.get(url, {"q": "robot"})
+        links = response.context["facet_links"]
+        self.assertEqual([(f["name"], f["count"]) for f in links["sponsors"]], [("NASA", 2)])
+        self.assertEqual(
+            [(f["name"], f["count"]) for f in links["semesters"]], [("Fall 2023", 2)]
+        )
+
+        response = self.client.get(url + links["attachments"][0]["url"])
+        self.assertEqual(response.context["attachments"], ["paper"])
+        self.assertEqual([p.title for p in response.context["projects"]], ["Robot Arms"])
+
+        response = self.client.get(url + links["sponsors"][0]["url"])
+        self.assertEqual(
+            sorted(p.title for p in response.context["projects"]), ["Robot Arms", "Robot Legs"]
+        )
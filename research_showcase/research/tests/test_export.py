@@ -0,0 +1,142 @@
+import csv
+import io
+import json
+import os
+import tempfile
+from datetime import date
+from functools import partial
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from .. import export
+from ..models import ResearchProject, StatusHistory
+
+User = get_user_model()
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="export_admin", password="password", role="admin"
+        )
+        self.faculty = User.objects.create_user(
+            username="export_faculty", password="password", role="faculty"
+        )
+        self.paper = ResearchProject.objects.create(
+            title="=HYPERLINK(robots)",
+            abstract="Robots",
+            author=self.faculty,
+            approval_status="approved",
+            date_presented=date(2023, 9, 1),
+            project_sponsor="NASA",
+            pdf_file="research_papers/robots.pdf",
+        )
+        StatusHistory.objects.create(
+            project=self.paper, actor=self.admin, status_from="pending", status_to="approved"
+        )
+        self.pending = ResearchProject.objects.create(
+            title="Pending Soil Study",
+            abstract="Soil",
+            author=self.faculty,
+            date_presented=date(2024, 3, 1),
+        )
+        self.url = reverse("export_projects")
+
+    def _get(self, **params):
+        self.client.login(username="export_admin", password="password")
+        return self.client.get(self.url, params)
+
+    def _csv(self, response):
+        body = b"".join(response.streaming_content).decode()
+        return list(csv.DictReader(io.StringIO(body)))
+
+    def test_admin_only(self):
+        self.client.login(username="export_faculty", password="password")
+        self.assertNotEqual(self.client.get(self.url).status_code, 200)
+
+    def test_csv_streams_approved_projects(self):
+        response = self._get()
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        (row,) = self._csv(response)
+        self.assertEqual(row["title"], "'=HYPERLINK(robots)")
+        self.assertEqual(row["semester"], "Fall 2023")
+        self.assertEqual(row["faculty_author"], "export_faculty")
+        self.assertEqual(row["status_changes"], "1")
+        self.assertEqual((row["has_paper"], row["has_video"]), ("True", "False"))
+
+    def test_ndjson_with_search_filters(self):
+        response = self._get(format="ndjson", status="all", q="soil")
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual([r["title"] for r in rows], ["Pending Soil Study"])
+        self.assertEqual(rows[0]["approval_status"], "pending")
+
+        response = self._get(status="all", start_semester="Spring 2024", has="paper")
+        self.assertEqual(self._csv(response), [])
+
+    async def test_asgi_response_streams_in_chunks(self):
+        await ResearchProject.objects.abulk_create(
+            ResearchProject(
+                title=f"Approved Study {i}",
+                abstract="Study",
+                author=self.faculty,
+                approval_status="approved",
+            )
+            for i in range(3)
+        )
+        fetches = []
+        next_lines = export._next_lines
+
+        def counting_next_lines(lines, count):
+            fetches.append(count)
+            return next_lines(lines, count)
+
+        await self.async_client.aforce_login(self.admin)
+        with patch.object(export, "_next_lines", counting_next_lines), patch(
+            "research.views.aiter_export", partial(export.aiter_export, chunk_size=1)
+        ):
+            response = await self.async_client.get(self.url)
+            self.assertTrue(response.is_async)
+            lines = aiter(response.streaming_content)
+            self.assertTrue((await anext(lines)).startswith(b"id,title,"))
+            # Only the first chunk has been read when the header goes out
+            self.assertEqual(len(fetches), 1)
+            rest = [line async for line in lines]
+        self.assertEqual(len(rest), 4)
+        self.assertGreater(len(fetches), 4)
+
+    def test_since_and_invalid_parameters(self):
+        future = (timezone.now() + timezone.timedelta(days=1)).isoformat()
+        self.assertEqual(self._csv(self._get(since=future)), [])
+        for params in (
+            {"format": "xml"},
+            {"since": "yesterday"},
+            {"since": "2024-02-30"},
+            {"end_semester": "Fall"},
+        ):
+            self.assertEqual(self._get(**params).status_code, 400)
+
+    def test_command_writes_file(self):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        err = StringIO()
+        call_command("export_projects", status="all", output=path, stderr=err)
+        with open(path, newline="", encoding="utf-8") as f:
+            titles = [row["title"] for row in csv.DictReader(f)]
+        self.assertEqual(titles, ["Pending Soil Study", "'=HYPERLINK(robots)"])
+        self.assertIn("Exported 2 projects", err.getvalue())
+
+    def test_command_streams_ndjson_to_stdout(self):
+        out = StringIO()
+        call_command(
+            "export_projects", fmt="ndjson", sponsor="NASA", stdout=out, stderr=StringIO()
+        )
+        (line,) = out.getvalue().splitlines()
+        self.assertEqual(json.loads(line)["id"], self.paper.id)
@@ -1,8 +1,14 @@
+import io
+import zipfile
 from datetime import date, timedelta
 
 from django.contrib.auth import get_user_model
+from django.core.files import File
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from PIL import Image
+
+from ..file_checks import sniff_upload
 
 from ..forms import (
     MAX_POSTER_SIZE_MB,
@@ -276,3 +282,107 @@ class ResearchProjectFormValidationTest(TestCase):
 
 
 # ... existing form tests if any ...
+
+
+PDF_CONTENT = b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF\n"
+
+
+def make_image(image_format: str) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), "navy").save(buffer, image_format)
+    return buffer.getvalue()
+
+
+def make_pptx(part: str = "ppt/presentation.xml") -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr(part, "<presentation/>")
+    return buffer.getvalue()
+
+
+class CountingBytesIO(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class FileContentCheckTests(TestCase):
+    """Uploads whose content does not match their extension are rejected."""
+
+    def setUp(self):
+        self.data = {
+            "title": "Valid Test Research Project Title",
+            "abstract": "This is a valid sample abstract for testing purposes. It should be long enough to pass validation which requires at least 100 characters.",
+            "student_author_name": "Valid Test Student",
+        }
+
+    def _form(self, **files):
+        uploads = {
+            field: SimpleUploadedFile(name, content) for field, (name, content) in files.items()
+        }
+        return ResearchProjectForm(data=self.data, files=uploads)
+
+    def test_valid_files_are_accepted(self):
+        form = self._form(
+            pdf_file=("paper.pdf", PDF_CONTENT),
+            poster_image=("poster.png", make_image("PNG")),
+            presentation_file=("slides.pptx", make_pptx()),
+        )
+        self.assertTrue(form.is_valid(), form.errors.as_text())
+
+    def test_pdf_and_jpeg_posters_are_accepted(self):
+        for name, content in (("poster.pdf", PDF_CONTENT), ("poster.jpg", make_image("JPEG"))):
+            form = self._form(poster_image=(name, content))
+            self.assertTrue(form.is_valid(), form.errors.as_text())
+
+    def test_renamed_file_is_rejected(self):
+        form = self._form(pdf_file=("paper.pdf", b"PK\x03\x04 definitely a zip"))
+        self.assertFalse(form.is_valid())
+        self.assertIn("File is not a valid PDF document", form.errors["pdf_file"])
+
+    def test_truncated_pdf_is_rejected(self):
+        form = self._form(pdf_file=("paper.pdf", PDF_CONTENT[:-7] + b"x" * 4096))
+        self.assertFalse(form.is_valid())
+        self.assertIn("PDF file is truncated or corrupted", form.errors["pdf_file"])
+
+    def test_image_signature_must_match_extension(self):
+        form = self._form(poster_image=("poster.png", make_image("JPEG")))
+        self.assertFalse(form.is_valid())
+        self.assertIn("File is not a valid PNG image", form.errors["poster_image"])
+
+    def test_corrupt_image_is_rejected(self):
+        png = make_image("PNG")
+        form = self._form(poster_image=("poster.png", png[:40] + b"\0" * 40 + png[80:]))
+        self.assertFalse(form.is_valid())
+        self.assertIn("Image file is corrupted or unreadable", form.errors["poster_image"])
+
+    def test_zip_without_slides_is_rejected(self):
+        form = self._form(presentation_file=("slides.pptx", make_pptx("word/document.xml")))
+        self.assertFalse(form.is_valid())
+        self.assertIn(
+            "File is not a valid PowerPoint presentation", form.errors["presentation_file"]
+        )
+
+    def test_each_bad_file_is_reported(self):
+        form = self._form(
+            pdf_file=("paper.pdf", b"junk"),
+            poster_image=("poster.png", b"junk"),
+            presentation_file=("slides.ppt", b"junk"),
+        )
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            set(form.errors), {"pdf_file", "poster_image", "presentation_file"}
+        )
+
+    def test_pdf_check_reads_only_head_and_tail(self):
+        stream = CountingBytesIO(b"%PDF-1.7\n" + b"0" * (4 * 1024 * 1024) + b"\n%%EOF\n")
+        upload = File(stream, name="paper.pdf")
+        self.assertIsNone(sniff_upload(upload))
+        self.assertLess(stream.bytes_read, 4096)
+        self.assertEqual(upload.tell(), 0)
@@ -0,0 +1,163 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+
+from ..importer import import_projects
+from ..models import ResearchProject, StatusHistory
+from ..search_index import search_projects
+
+User = get_user_model()
+
+ABSTRACT = "An archived capstone project about soil moisture sensing. " * 3
+PDF_BYTES = b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF\n"
+MANIFEST_COLUMNS = [
+    "title",
+    "student_author_name",
+    "abstract",
+    "date_presented",
+    "project_sponsor",
+    "pdf_file",
+    "poster_image",
+]
+
+
+class ImportProjectsTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+        self.source = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.source, ignore_errors=True)
+        os.makedirs(os.path.join(self.source, "papers"))
+        for name in ("papers/soil.pdf", "papers/rivers.pdf"):
+            with open(os.path.join(self.source, name), "wb") as f:
+                f.write(PDF_BYTES)
+
+        self.faculty = User.objects.create_user(
+            username="import_faculty", password="password", role="faculty"
+        )
+
+    def _manifest(self, rows, name="manifest.csv"):
+        path = os.path.join(self.source, name)
+        if name.endswith(".json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+            return path
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=MANIFEST_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    def _row(self, title, **fields):
+        row = {
+            "title": title,
+            "student_author_name": "Ada Student",
+            "abstract": ABSTRACT,
+            "date_presented": "2019-04-20",
+        }
+        row.update(fields)
+        return row
+
+    def test_imports_valid_rows_with_files_and_history(self):
+        manifest = self._manifest(
+            [
+                self._row("Soil Moisture Sensing", pdf_file="papers/soil.pdf"),
+                self._row("River Sediment Survey", pdf_file="papers/rivers.pdf"),
+                self._row("Short", pdf_file="papers/soil.pdf"),
+                self._row("Missing Paper Project", pdf_file="papers/absent.pdf"),
+            ]
+        )
+        report = import_projects(manifest, self.source, self.faculty, batch_size=1)
+
+        self.assertEqual((report.rows, report.imported, report.files), (4, 2, 2))
+        self.assertEqual([number for number, _ in report.errors], [3, 4])
+        self.assertIn("title", report.errors[0][1])
+        self.assertIn("file not found", report.errors[1][1])
+
+        project = ResearchProject.objects.get(title="Soil Moisture Sensing")
+        self.assertEqual(project.author, self.faculty)
+        self.assertEqual(project.approval_status, "approved")
+        self.assertEqual(project.date_presented, date(2019, 4, 20))
+        self.assertIsNotNone(project.semester_key)
+        self.assertTrue(project.pdf_file.name.startswith("research_papers/"))
+        self.assertEqual(project.thumbnail, project.pdf_file.name)
+        with project.pdf_file.open("rb") as f:
+            self.assertEqual(f.read(), PDF_BYTES)
+
+        history = StatusHistory.objects.get(project=project)
+        self.assertEqual((history.status_from, history.status_to), (None, "approved"))
+        self.assertEqual(history.actor, self.faculty)
+
+        found = search_projects(ResearchProject.objects.all(), "sediment")
+        self.assertEqual([p.title for p in found], ["River Sediment Survey"])
+
+    def test_rerun_skips_existing_projects(self):
+        manifest = self._manifest(
+            [
+                self._row("Soil Moisture Sensing", pdf_file="papers/soil.pdf"),
+                self._row("Soil Moisture Sensing"),
+            ]
+        )
+        first = import_projects(manifest, self.source, self.faculty)
+        second = import_projects(manifest, self.source, self.faculty)
+
+        self.assertEqual((first.imported, first.duplicates), (1, 1))
+        self.assertEqual((second.imported, second.duplicates, second.files), (0, 2, 0))
+        self.assertEqual(ResearchProject.objects.count(), 1)
+
+    def test_json_fixture_manifest(self):
+        manifest = self._manifest(
+            [{"model": "research.researchproject", "pk": 7, "fields": self._row("Fixture Project")}],
+            name="fixture.json",
+        )
+        report = import_projects(manifest, self.source, self.faculty, status="pending")
+
+        self.assertEqual(report.imported, 1)
+        self.assertEqual(
+            ResearchProject.objects.get(title="Fixture Project").approval_status, "pending"
+        )
+
+    def test_dry_run_writes_nothing(self):
+        manifest = self._manifest([self._row("Soil Moisture Sensing", pdf_file="papers/soil.pdf")])
+        report = import_projects(manifest, self.source, self.faculty, dry_run=True)
+
+        self.assertEqual((report.rows, report.imported, report.errors), (1, 0, []))
+        self.assertFalse(ResearchProject.objects.exists())
+        self.assertFalse(os.path.exists(os.path.join(self.media_root, "research_papers")))
+
+    def test_failed_batch_removes_copied_files(self):
+        manifest = self._manifest([self._row("Soil Moisture Sensing", pdf_file="papers/soil.pdf")])
+        with self.assertRaises(Exception):
+            # An unsaved author makes the insert fail after the files are copied
+            import_projects(manifest, self.source, User(username="ghost"))
+
+        self.assertFalse(ResearchProject.objects.exists())
+        papers = os.path.join(self.media_root, "research_papers")
+        self.assertEqual(os.listdir(papers) if os.path.isdir(papers) else [], [])
+
+    def test_command_reports_throughput(self):
+        manifest = self._manifest([self._row("Soil Moisture Sensing", pdf_file="papers/soil.pdf")])
+        out = StringIO()
+        call_command("import_projects", manifest, author="import_faculty", stdout=out)
+
+        self.assertIn("Imported 1 of 1 projects", out.getvalue())
+        self.assertIn("projects/s", out.getvalue())
+        self.assertTrue(ResearchProject.objects.filter(title="Soil Moisture Sensing").exists())
+
+    def test_command_rejects_unknown_author(self):
+        manifest = self._manifest([self._row("Soil Moisture Sensing")])
+        with self.assertRaises(CommandError):
+            call_command("import_projects", manifest, author="nobody", stdout=StringIO())
@@ -0,0 +1,101 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ..jobs import (
+    UnknownTask,
+    backoff_delay,
+    enqueue,
+    requeue_stale_jobs,
+    run_pending_jobs,
+    task,
+)
+from ..models import Job
+
+calls = []
+
+
+@task("tests.record")
+def record(value):
+    calls.append(value)
+
+
+@task("tests.explode")
+def explode():
+    raise ConnectionError("SMTP timed out")
+
+
+class JobQueueTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_and_run(self):
+        job = enqueue("tests.record", value=1)
+        self.assertEqual(job.status, Job.PENDING)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(run_pending_jobs(), 1)
+        self.assertEqual(calls, [1])
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.DONE, 1))
+        self.assertIsNotNone(job.finished_at)
+
+    def test_unique_enqueue_reuses_waiting_job(self):
+        first = enqueue("tests.record", unique=True, value=1)
+        self.assertEqual(enqueue("tests.record", unique=True, value=1), first)
+        self.assertNotEqual(enqueue("tests.record", unique=True, value=2), first)
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_unknown_task_rejected_at_enqueue(self):
+        with self.assertRaises(UnknownTask):
+            enqueue("tests.missing")
+
+    def test_jobs_run_in_due_order_and_future_jobs_wait(self):
+        later = enqueue("tests.record", value="later")
+        later.run_at = timezone.now() + timedelta(minutes=5)
+        later.save()
+        enqueue("tests.record", value="first")
+        enqueue("tests.record", value="second")
+        run_pending_jobs()
+        self.assertEqual(calls, ["first", "second"])
+
+    def test_failures_back_off_then_dead_letter(self):
+        job = enqueue("tests.explode", max_attempts=2)
+        with self.assertLogs("research.jobs", "WARNING"):
+            run_pending_jobs()
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.PENDING, 1))
+        self.assertIn("SMTP timed out", job.last_error)
+        self.assertGreater(job.run_at, timezone.now() + backoff_delay(1) - timedelta(seconds=5))
+
+        # Not due yet
+        self.assertEqual(run_pending_jobs(), 0)
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        with self.assertLogs("research.jobs", "ERROR"):
+            run_pending_jobs()
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.FAILED, 2))
+
+    def test_backoff_grows_and_is_capped(self):
+        self.assertLess(backoff_delay(1), backoff_delay(2))
+        self.assertEqual(backoff_delay(30), backoff_delay(40))
+
+    def test_stale_running_jobs_are_requeued(self):
+        job = enqueue("tests.record", value=1)
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.RUNNING, locked_at=timezone.now() - timedelta(hours=1)
+        )
+        self.assertEqual(requeue_stale_jobs(), 1)
+        self.assertEqual(run_pending_jobs(), 1)
+
+    def test_run_jobs_command_once(self):
+        enqueue("tests.record", value=1)
+        enqueue("tests.record", value=2)
+        out = StringIO()
+        call_command("run_jobs", once=True, stdout=out)
+        self.assertIn("Ran 2 jobs", out.getvalue())
+        self.assertEqual(calls, [1, 2])
+
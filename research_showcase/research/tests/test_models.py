@@ -1,9 +1,20 @@
-from datetime import date
+from datetime import date, timedelta
+from io import StringIO
 
 from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
 from django.test import TestCase
+from django.utils import timezone
 
-from ..models import Colloquium, ProjectImage, ResearchProject, StatusHistory
+from ..models import (
+    Colloquium,
+    ProjectImage,
+    ResearchProject,
+    StatusHistory,
+    refresh_project_thumbnails,
+    refresh_semester_keys,
+)
+from ..semester_utils import semester_key
 
 User = get_user_model()
 
@@ -74,6 +85,156 @@ class ProjectImageModelTest(TestCase):
         self.assertEqual(str(self.project_image), expected_str)
 
 
+class ProjectThumbnailTests(TestCase):
+    """ResearchProject.thumbnail tracks the first image, else the poster."""
+
+    def setUp(self):
+        faculty_user = User.objects.create_user(
+            username="thumb_faculty", password="testpassword123", role="faculty"
+        )
+        self.project = ResearchProject.objects.create(
+            title="Thumbnail Project",
+            abstract="Abstract",
+            author=faculty_user,
+            poster_image="posters/poster.png",
+        )
+
+    def _thumbnail(self):
+        self.project.refresh_from_db(fields=["thumbnail"])
+        return self.project.thumbnail.name
+
+    def test_poster_used_without_images(self):
+        self.assertEqual(self._thumbnail(), "posters/poster.png")
+
+    def test_first_image_wins_and_deletes_fall_back(self):
+        first = ProjectImage.objects.create(
+            project=self.project, image="project_images/a.jpg"
+        )
+        ProjectImage.objects.create(project=self.project, image="project_images/b.jpg")
+        self.assertEqual(self._thumbnail(), "project_images/a.jpg")
+
+        first.delete()
+        self.assertEqual(self._thumbnail(), "project_images/b.jpg")
+        self.project.images.all().delete()
+        self.assertEqual(self._thumbnail(), "posters/poster.png")
+
+    def test_clearing_poster_clears_thumbnail(self):
+        self.project.poster_image = None
+        self.project.save()
+        self.assertEqual(self._thumbnail(), "")
+
+    def test_paper_used_without_poster(self):
+        self.project.poster_image = None
+        self.project.pdf_file = "research_papers/paper.pdf"
+        self.project.save()
+        self.assertEqual(self._thumbnail(), "research_papers/paper.pdf")
+
+    def test_backfill_command_repairs_bypassed_writes(self):
+        ResearchProject.objects.update(thumbnail="")
+        out = StringIO()
+        call_command("backfill_thumbnails", batch_size=1, stdout=out)
+        self.assertIn("1 projects", out.getvalue())
+        self.assertEqual(self._thumbnail(), "posters/poster.png")
+
+
+class SemesterKeyTests(TestCase):
+    """ResearchProject.semester_key follows date_presented."""
+
+    def setUp(self):
+        faculty_user = User.objects.create_user(
+            username="semester_faculty", password="testpassword123", role="faculty"
+        )
+        self.project = ResearchProject.objects.create(
+            title="Semester Project",
+            abstract="Abstract",
+            author=faculty_user,
+            date_presented=date(2023, 9, 1),
+        )
+
+    def _key(self):
+        self.project.refresh_from_db(fields=["semester_key"])
+        return self.project.semester_key
+
+    def test_set_on_save(self):
+        self.assertEqual(self._key(), semester_key("Fall 2023"))
+        self.project.date_presented = None
+        self.project.save()
+        self.assertIsNone(self._key())
+
+    def test_update_fields_saves_include_the_key(self):
+        self.project.date_presented = date(2024, 3, 1)
+        self.project.save(update_fields=["date_presented"])
+        self.assertEqual(self._key(), semester_key("Spring 2024"))
+
+    def test_refresh_repairs_bypassed_writes(self):
+        ResearchProject.objects.update(date_presented=date(2024, 1, 5), semester_key=None)
+        self.assertEqual(refresh_semester_keys(ResearchProject.objects.all()), 1)
+        self.assertEqual(self._key(), semester_key("Winter 2023"))
+
+    def test_backfill_command(self):
+        ResearchProject.objects.update(semester_key=None)
+        out = StringIO()
+        call_command("backfill_semester_keys", batch_size=1, stdout=out)
+        self.assertIn("1 projects", out.getvalue())
+        self.assertEqual(self._key(), semester_key("Fall 2023"))
+
+
+class UpdatedAtTests(TestCase):
+    """ResearchProject.updated_at records every change, bulk writes included."""
+
+    def setUp(self):
+        faculty_user = User.objects.create_user(
+            username="updated_faculty", password="testpassword123", role="faculty"
+        )
+        self.project = ResearchProject.objects.create(
+            title="Tracked Project", abstract="Abstract", author=faculty_user
+        )
+        self.past = timezone.now() - timedelta(days=1)
+        ResearchProject.objects.update(updated_at=self.past)
+
+    def _changed(self):
+        return ResearchProject.objects.changed_since(self.past).exists()
+
+    def test_partial_saves_bump(self):
+        self.project.title = "Renamed"
+        self.project.save(update_fields=["title"])
+        self.assertTrue(self._changed())
+
+    def test_queryset_writes_bump(self):
+        ResearchProject.objects.update(approval_status="approved")
+        self.assertTrue(self._changed())
+
+        ResearchProject.objects.update(updated_at=self.past)
+        self.project.title = "Bulk renamed"
+        ResearchProject.objects.bulk_update([self.project], ["title"])
+        self.assertTrue(self._changed())
+
+    def test_image_changes_bump(self):
+        ProjectImage.objects.create(project=self.project, image="project_images/a.jpg")
+        self.assertTrue(self._changed())
+
+    def test_derived_columns_do_not_bump(self):
+        refresh_project_thumbnails(ResearchProject.objects.all())
+        refresh_semester_keys(ResearchProject.objects.all())
+        self.assertFalse(self._changed())
+
+    def test_changed_since_walks_the_index(self):
+        self.project.save()
+        changed = ResearchProject.objects.changed_since(self.past)
+        self.assertEqual(list(changed), [self.project])
+        self.assertIn("research_updated_idx", changed.explain())
+
+    def test_incremental_search_reindex(self):
+        self.project.save()
+        out = StringIO()
+        call_command(
+            "rebuild_search_index", since=self.past.date().isoformat(), stdout=out
+        )
+        self.assertIn("Reindexed 1 projects", out.getvalue())
+        with self.assertRaisesMessage(CommandError, "Invalid --since value"):
+            call_command("rebuild_search_index", since="last week", stdout=out)
+
+
 class StatusHistoryModelTest(TestCase):
     def setUp(self):
         # Create test users
@@ -0,0 +1,117 @@
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from ..jobs import run_pending_jobs
+from ..models import Job, OutboxEmail, ResearchProject
+from ..outbox import DELIVER_TASK, deliver_outbox, queue_status_change_email
+
+User = get_user_model()
+
+APPROVED_TEMPLATE = "research/emails/submission_approved.txt"
+
+
+class OutboxTestCase(TestCase):
+    def setUp(self):
+        self.faculty = User.objects.create_user(
+            username="outbox_faculty",
+            email="faculty@example.com",
+            password="password",
+            role="faculty",
+        )
+        self.project = ResearchProject.objects.create(
+            title="Outbox Project", abstract="Abstract", author=self.faculty
+        )
+
+    def _queue(self, count):
+        for _ in range(count):
+            queue_status_change_email(self.project, APPROVED_TEMPLATE)
+
+
+class ReviewOutboxTests(OutboxTestCase):
+    def setUp(self):
+        super().setUp()
+        User.objects.create_user(username="outbox_admin", password="password", role="admin")
+        self.client.login(username="outbox_admin", password="password")
+
+    def test_review_writes_outbox_row_and_one_delivery_job(self):
+        with patch("django.core.mail.backends.locmem.EmailBackend.send_messages") as send:
+            self.client.post(reverse("approve_research", args=[self.project.id]))
+            self.client.post(
+                reverse("request_revision", args=[self.project.id]),
+                {"revision_feedback": "Tighten the abstract"},
+            )
+            send.assert_not_called()
+
+        self.assertEqual(
+            list(OutboxEmail.objects.values_list("status", flat=True)),
+            [OutboxEmail.PENDING, OutboxEmail.PENDING],
+        )
+        self.assertEqual(Job.objects.filter(name=DELIVER_TASK).count(), 1)
+
+        run_pending_jobs()
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIn("Tighten the abstract", mail.outbox[1].body)
+        self.assertFalse(OutboxEmail.objects.exclude(status=OutboxEmail.SENT).exists())
+
+    def test_opted_out_author_gets_no_mail(self):
+        self.faculty.notify_by_email_on_status_change = False
+        self.faculty.save()
+        self.client.post(reverse("approve_research", args=[self.project.id]))
+        self.assertFalse(OutboxEmail.objects.exists())
+        self.assertFalse(Job.objects.exists())
+
+    def test_rolled_back_change_leaves_no_email(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                queue_status_change_email(self.project, APPROVED_TEMPLATE)
+                raise RuntimeError("status update failed")
+        self.assertFalse(OutboxEmail.objects.exists())
+
+
+class DeliverOutboxTests(OutboxTestCase):
+    def test_batches_share_one_connection(self):
+        self._queue(5)
+        connection = MagicMock()
+        report = deliver_outbox(batch_size=2, connection=connection)
+        self.assertEqual(report.sent, 5)
+        connection.open.assert_called_once()
+        self.assertEqual(connection.send_messages.call_count, 5)
+        self.assertEqual(OutboxEmail.objects.filter(status=OutboxEmail.SENT).count(), 5)
+
+    def test_failed_message_is_retried_then_dead_lettered(self):
+        self._queue(3)
+        failing = OutboxEmail.objects.order_by("id")[1]
+        OutboxEmail.objects.filter(pk=failing.pk).update(max_attempts=2)
+
+        connection = MagicMock()
+        # The second message (in id order) hits a transient server error
+        connection.send_messages.side_effect = [None, OSError("454 Temporary failure"), None]
+        report = deliver_outbox(connection=connection)
+        self.assertEqual((report.sent, report.retried, report.dead), (2, 1, 0))
+        failing.refresh_from_db()
+        self.assertEqual((failing.status, failing.attempts), (OutboxEmail.PENDING, 1))
+        self.assertIn("454", failing.last_error)
+        self.assertGreater(failing.next_attempt_at, timezone.now())
+
+        connection.send_messages.side_effect = OSError("454 Temporary failure")
+        OutboxEmail.objects.filter(pk=failing.pk).update(next_attempt_at=timezone.now())
+        with self.assertLogs("research.outbox", "ERROR"):
+            report = deliver_outbox(connection=connection)
+        self.assertEqual(report.dead, 1)
+        failing.refresh_from_db()
+        self.assertEqual(failing.status, OutboxEmail.DEAD)
+
+    def test_send_outbox_command_with_locmem_backend(self):
+        self._queue(3)
+        out = StringIO()
+        call_command("send_outbox", batch_size=2, stdout=out)
+        self.assertIn("Sent 3 emails", out.getvalue())
+        self.assertEqual([m.to for m in mail.outbox], [["faculty@example.com"]] * 3)
@@ -0,0 +1,181 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from ..models import ResearchProject
+from ..pagination import (
+    MAX_PAGE_SIZE,
+    InvalidCursor,
+    KeysetPaginator,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+)
+
+User = get_user_model()
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user(
+            username="page_faculty", password="password", role="faculty"
+        )
+        today = date(2024, 10, 1)
+        # Pairs share a date so the id tie-breaker matters
+        cls.projects = [
+            ResearchProject.objects.create(
+                title=f"Project {i:02d}",
+                abstract="Abstract",
+                author=author,
+                approval_status="approved",
+                date_presented=today - timedelta(days=i // 2),
+            )
+            for i in range(7)
+        ]
+        cls.by_date = sorted(
+            cls.projects, key=lambda p: (p.date_presented, p.id), reverse=True
+        )
+
+    def _paginator(self, ordering=("-date_presented", "-id"), size=3):
+        return KeysetPaginator(ResearchProject.objects.all(), ordering, page_size=size)
+
+    def test_walk_forward_and_back(self):
+        paginator = self._paginator()
+        first = paginator.get_page()
+        self.assertEqual(list(first), self.by_date[:3])
+        self.assertFalse(first.has_previous)
+        self.assertTrue(first.has_next)
+
+        second = paginator.get_page(first.next_cursor)
+        self.assertEqual(list(second), self.by_date[3:6])
+        self.assertTrue(second.has_previous)
+
+        third = paginator.get_page(second.next_cursor)
+        self.assertEqual(list(third), self.by_date[6:])
+        self.assertFalse(third.has_next)
+
+        back = paginator.get_page(third.previous_cursor)
+        self.assertEqual(list(back), self.by_date[3:6])
+        self.assertTrue(back.has_next)
+        back_again = paginator.get_page(back.previous_cursor)
+        self.assertEqual(list(back_again), self.by_date[:3])
+        self.assertFalse(back_again.has_previous)
+
+    def test_ascending_title_order(self):
+        paginator = self._paginator(("title", "id"), size=4)
+        first = paginator.get_page()
+        second = paginator.get_page(first.next_cursor)
+        titles = [p.title for p in list(first) + list(second)]
+        self.assertEqual(titles, sorted(p.title for p in self.projects))
+
+    def test_cursor_survives_inserts_before_it(self):
+        paginator = self._paginator()
+        first = paginator.get_page()
+        ResearchProject.objects.create(
+            title="Newest",
+            abstract="Abstract",
+            author=self.projects[0].author,
+            approval_status="approved",
+            date_presented=date(2025, 1, 1),
+        )
+        second = paginator.get_page(first.next_cursor)
+        self.assertEqual(list(second), self.by_date[3:6])
+
+    def test_invalid_cursors(self):
+        paginator = self._paginator()
+        for token in ("garbage!", encode_cursor("x", [1, 2]), encode_cursor("n", [1])):
+            with self.assertRaises(InvalidCursor):
+                paginator.get_page(token)
+
+    def test_malformed_cursor_values(self):
+        paginator = self._paginator()
+        for values in (
+            [[1], 5],
+            [{"year": 2024}, 5],
+            ["2024-10-01", float("inf")],
+            ["2024-10-01", 1e300],
+            ["2024-13-45", 5],
+        ):
+            with self.subTest(values=values), self.assertRaises(InvalidCursor):
+                paginator.get_page(encode_cursor("n", values))
+
+        relevance = self._paginator(ordering=("-score", "-id"))
+        for values in ([float("nan"), 5], ["high", 5], [[0.5], 5]):
+            with self.subTest(values=values), self.assertRaises(InvalidCursor):
+                relevance.get_page(encode_cursor("n", values))
+
+    def test_cursor_round_trip(self):
+        token = encode_cursor("p", ["2024-10-01", 5])
+        self.assertEqual(decode_cursor(token), ("p", ["2024-10-01", 5]))
+
+    def test_clamp_page_size(self):
+        self.assertEqual(clamp_page_size("5"), 5)
+        self.assertEqual(clamp_page_size("100000"), MAX_PAGE_SIZE)
+        self.assertEqual(clamp_page_size("0"), 1)
+        self.assertEqual(clamp_page_size("abc", default=12), 12)
+
+
+class SearchPaginationViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user(
+            username="page_view_faculty", password="password", role="faculty"
+        )
+        for i in range(5):
+            ResearchProject.objects.create(
+                title=f"Paged Project {i}",
+                abstract="Abstract",
+                author=author,
+                approval_status="approved",
+                date_presented=date.today() - timedelta(days=i),
+            )
+
+    def test_next_and_previous_links(self):
+        url = reverse("search_research")
+        response = self.client.get(url, {"page_size": 2})
+        self.assertEqual(len(response.context["projects"]), 2)
+        self.assertIsNone(response.context["previous_page_url"])
+        next_url = response.context["next_page_url"]
+        self.assertIn("page_size=2", next_url)
+
+        seen = [p.title for p in response.context["projects"]]
+        while next_url:
+            response = self.client.get(url + next_url)
+            self.assertIsNotNone(response.context["previous_page_url"])
+            seen += [p.title for p in response.context["projects"]]
+            next_url = response.context["next_page_url"]
+        self.assertEqual(seen, [f"Paged Project {i}" for i in range(5)])
+
+    def test_invalid_cursor_shows_first_page(self):
+        response = self.client.get(
+            reverse("search_research"), {"cursor": "not-a-cursor", "page_size": 2}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [p.title for p in response.context["projects"]],
+            ["Paged Project 0", "Paged Project 1"],
+        )
+
+    def test_tampered_cursor_values_show_first_page(self):
+        for values in ([[1], 5], ["2024-10-01", float("inf")], ["2024-10-01", 10**30]):
+            response = self.client.get(
+                reverse("search_research"),
+                {"cursor": encode_cursor("n", values), "page_size": 2},
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                [p.title for p in response.context["projects"]],
+                ["Paged Project 0", "Paged Project 1"],
+            )
+
+    def test_relevance_pagination(self):
+        url = reverse("search_research")
+        response = self.client.get(url, {"q": "paged", "page_size": 3})
+        self.assertEqual(response.context["sort_by"], "relevance")
+        titles = [p.title for p in response.context["projects"]]
+        response = self.client.get(url + response.context["next_page_url"])
+        titles += [p.title for p in response.context["projects"]]
+        self.assertEqual(sorted(titles), [f"Paged Project {i}" for i in range(5)])
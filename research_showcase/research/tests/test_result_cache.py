@@ -0,0 +1,80 @@
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from ..models import ResearchProject
+from ..result_cache import result_cache_stats
+
+User = get_user_model()
+
+
+class SearchResultCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("search_research")
+        self.author = User.objects.create_user(username="cache_author", password="password")
+        self.projects = [self._project(f"Robot {i}", date(2023, 9, i + 1)) for i in range(3)]
+
+    def _project(self, title, presented, **fields):
+        return ResearchProject.objects.create(
+            title=title,
+            abstract="Abstract",
+            author=self.author,
+            approval_status="approved",
+            date_presented=presented,
+            **fields,
+        )
+
+    def _titles(self, params=None):
+        response = self.client.get(self.url, params or {})
+        return [p.title for p in response.context["projects"]]
+
+    def test_repeat_requests_read_ids_from_cache(self):
+        params = {"q": "robot", "page_size": 2}
+        first = self._titles(params)
+        # Only the primary-key lookup of the cached ids remains
+        with self.assertNumQueries(1):
+            self.assertEqual(self._titles({"q": "  ROBOT ", "page_size": 2}), first)
+        stats = result_cache_stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_cursor_is_part_of_the_key(self):
+        response = self.client.get(self.url, {"page_size": 2})
+        next_url = response.context["next_page_url"]
+        self.assertEqual(self._titles({"page_size": 2}), ["Robot 2", "Robot 1"])
+        response = self.client.get(self.url + next_url)
+        self.assertEqual([p.title for p in response.context["projects"]], ["Robot 0"])
+
+    def test_catalog_changes_retire_cached_pages(self):
+        self.assertEqual(self._titles(), ["Robot 2", "Robot 1", "Robot 0"])
+
+        self.projects[0].title = "Renamed"
+        self.projects[0].save()
+        self.assertEqual(self._titles(), ["Robot 2", "Robot 1", "Renamed"])
+
+        self._project("Robot 3", date(2023, 9, 10))
+        self.assertEqual(self._titles()[0], "Robot 3")
+
+        self.projects[1].approval_status = "rejected"
+        self.projects[1].save()
+        self.assertNotIn("Robot 1", self._titles())
+
+    @override_settings(SEARCH_RESULT_CACHE_TIMEOUT=0)
+    def test_timeout_zero_disables_cache(self):
+        self._titles()
+        self._titles()
+        self.assertEqual(result_cache_stats().hits, 0)
+
+    def test_stats_command(self):
+        self._titles()
+        self._titles()
+        out = StringIO()
+        call_command("search_cache_stats", reset=True, stdout=out)
+        self.assertIn("1 hits, 1 misses (50.0% hit rate)", out.getvalue())
+        self.assertEqual(result_cache_stats().hits, 0)
@@ -0,0 +1,129 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from ..models import ResearchProject
+from ..search_index import (
+    LikeSearchBackend,
+    SQLiteFTS5Backend,
+    get_search_backend,
+    rank_projects,
+    search_projects,
+    tokenize_query,
+)
+
+User = get_user_model()
+
+
+class TokenizeQueryTests(TestCase):
+    def test_strips_punctuation_and_lowercases(self):
+        self.assertEqual(
+            tokenize_query('Deep "Learning" OR NEAR(x)*'),
+            ["deep", "learning", "or", "near", "x"],
+        )
+
+    def test_empty_query(self):
+        self.assertEqual(tokenize_query(""), [])
+        self.assertEqual(tokenize_query("  -- "), [])
+
+
+class SearchIndexTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="search_faculty", password="password", role="faculty"
+        )
+        self.project = ResearchProject.objects.create(
+            title="Bayesian Models of Rainfall",
+            abstract="We fit hierarchical models to precipitation records.",
+            author=self.user,
+            student_author_name="Ada Lovelace",
+            collaborator_names="Grace Hopper, Alan Turing",
+            project_sponsor="Arizona Water Board",
+            approval_status="approved",
+        )
+        self.other = ResearchProject.objects.create(
+            title="Graph Coloring Heuristics",
+            abstract="Greedy and tabu search approaches to coloring.",
+            author=self.user,
+            student_author_name="Emmy Noether",
+            approval_status="approved",
+        )
+
+    def _search(self, query):
+        return list(search_projects(ResearchProject.objects.all(), query))
+
+    def test_backend_matches_database_vendor(self):
+        backend = get_search_backend()
+        if connection.vendor == "sqlite":
+            self.assertIsInstance(backend, (SQLiteFTS5Backend, LikeSearchBackend))
+        self.assertEqual(backend.using, "default")
+
+    def test_matches_every_indexed_field(self):
+        for query in ("bayesian", "precipitation", "water board", "lovelace", "hopper"):
+            self.assertEqual(self._search(query), [self.project], query)
+
+    def test_prefix_and_case_insensitive_match(self):
+        self.assertEqual(self._search("RAIN"), [self.project])
+        self.assertEqual(self._search("colo"), [self.other])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self._search("bayesian coloring"), [])
+
+    def test_blank_query_returns_queryset_unchanged(self):
+        self.assertEqual(len(self._search("")), 2)
+
+    def test_index_follows_updates(self):
+        self.project.title = "Frequentist Models of Snowfall"
+        self.project.save()
+        self.assertEqual(self._search("bayesian"), [])
+        self.assertEqual(self._search("snowfall"), [self.project])
+
+    def test_index_follows_deletes(self):
+        self.project.delete()
+        self.assertEqual(self._search("rainfall"), [])
+
+    def test_rebuild_restores_index(self):
+        # Simulate a write that bypassed signals
+        ResearchProject.objects.filter(pk=self.other.pk).update(title="Spectral Methods")
+        self.assertEqual(self._search("spectral"), [])
+        get_search_backend().reindex()
+        self.assertEqual(self._search("spectral"), [self.other])
+
+
+class RelevanceRankingTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username="rank_faculty", password="password", role="faculty"
+        )
+
+        def make(title, abstract, sponsor=""):
+            return ResearchProject.objects.create(
+                title=title,
+                abstract=abstract,
+                project_sponsor=sponsor,
+                author=user,
+                approval_status="approved",
+            )
+
+        # Created in reverse order of expected relevance for "topology"
+        self.sponsor_hit = make("Census Sampling", "Survey weights.", "Topology Lab")
+        self.abstract_hit = make("Knot Invariants", "Applied topology of knots.")
+        self.title_hit = make("Topology of Neural Networks", "Layer geometry.")
+
+    def _ranked(self, query):
+        return list(
+            rank_projects(ResearchProject.objects.all(), query).order_by("relevance", "id")
+        )
+
+    def test_title_outranks_abstract_outranks_sponsor(self):
+        if not isinstance(get_search_backend(), SQLiteFTS5Backend):
+            self.skipTest("Relevance scores require the FTS5 index")
+        self.assertEqual(
+            self._ranked("topology"),
+            [self.title_hit, self.abstract_hit, self.sponsor_hit],
+        )
+
+    def test_rank_annotates_relevance_and_filters(self):
+        ranked = self._ranked("knots")
+        self.assertEqual(ranked, [self.abstract_hit])
+        self.assertIsInstance(ranked[0].relevance, float)
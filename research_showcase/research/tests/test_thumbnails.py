@@ -0,0 +1,235 @@
+import shutil
+import tempfile
+from datetime import date
+from io import BytesIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+
+from ..jobs import run_pending_jobs
+from ..models import Job, ProjectImage, ResearchProject, ThumbnailSource
+from ..previews import PREVIEW_TASK, render_pdf_preview
+from ..templatetags.thumbnails import thumbnail_srcset, thumbnail_url
+from ..thumbnails import (
+    DERIVATIVE_WIDTHS,
+    DERIVATIVES_TASK,
+    OUTPUT_EXTENSION,
+    derivative_name,
+    generate_derivatives,
+    preview_name,
+)
+
+User = get_user_model()
+
+
+def make_png(width, height, color="navy"):
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class ThumbnailTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+
+class GenerateDerivativesTests(ThumbnailTestCase):
+    def test_derivative_names_are_deterministic(self):
+        self.assertEqual(
+            derivative_name("project_images/plot.png", "card"),
+            f"project_images/plot.png.card.{OUTPUT_EXTENSION}",
+        )
+
+    def test_same_stem_with_different_extensions(self):
+        png = default_storage.save("posters/poster.png", ContentFile(make_png(800, 600, "red")))
+        jpg = default_storage.save("posters/poster.jpg", ContentFile(make_png(800, 600, "blue")))
+        self.assertNotEqual(derivative_name(png, "card"), derivative_name(jpg, "card"))
+        self.assertEqual(len(generate_derivatives(default_storage, png)), 3)
+        self.assertEqual(len(generate_derivatives(default_storage, jpg)), 3)
+        for name, channel in ((png, 0), (jpg, 2)):
+            with default_storage.open(derivative_name(name, "card")) as f:
+                pixel = Image.open(f).convert("RGB").getpixel((10, 10))
+            self.assertGreater(pixel[channel], 200)
+
+    def test_writes_each_width_without_upscaling(self):
+        name = default_storage.save("project_images/wide.png", ContentFile(make_png(2000, 1000)))
+        written = generate_derivatives(default_storage, name)
+        self.assertEqual(
+            sorted(written), sorted(derivative_name(name, v) for v in DERIVATIVE_WIDTHS)
+        )
+        for variant, width in DERIVATIVE_WIDTHS.items():
+            with default_storage.open(derivative_name(name, variant)) as f:
+                self.assertEqual(Image.open(f).size, (width, width // 2))
+
+        small = default_storage.save("project_images/small.png", ContentFile(make_png(300, 200)))
+        generate_derivatives(default_storage, small)
+        with default_storage.open(derivative_name(small, "detail")) as f:
+            self.assertEqual(Image.open(f).size, (300, 200))
+
+    def test_existing_derivatives_are_kept_unless_forced(self):
+        name = default_storage.save("posters/poster.png", ContentFile(make_png(800, 600)))
+        self.assertEqual(len(generate_derivatives(default_storage, name)), 3)
+        self.assertEqual(generate_derivatives(default_storage, name), [])
+        rewritten = generate_derivatives(default_storage, name, force=True)
+        self.assertEqual(
+            sorted(rewritten), sorted(derivative_name(name, v) for v in DERIVATIVE_WIDTHS)
+        )
+
+    def test_unreadable_and_non_image_files_are_skipped(self):
+        broken = default_storage.save("posters/broken.png", ContentFile(b"not an image"))
+        with self.assertLogs("research.thumbnails", "WARNING") as logs:
+            self.assertEqual(generate_derivatives(default_storage, broken), [])
+            self.assertEqual(
+                generate_derivatives(default_storage, "posters/missing.png"), []
+            )
+        self.assertEqual(len(logs.output), 2)
+        self.assertEqual(generate_derivatives(default_storage, "posters/poster.pdf"), [])
+
+
+class ThumbnailRenderingTests(ThumbnailTestCase):
+    def setUp(self):
+        super().setUp()
+        author = User.objects.create_user(
+            username="thumb_render_faculty", password="password", role="faculty"
+        )
+        self.project = ResearchProject.objects.create(
+            title="Rendered Thumbnails",
+            abstract="Abstract",
+            author=author,
+            approval_status="approved",
+            date_presented=date(2024, 10, 1),
+        )
+
+    def _upload_image(self, run_jobs=True):
+        image = ProjectImage.objects.create(
+            project=self.project,
+            image=SimpleUploadedFile("plot.png", make_png(1600, 1200), "image/png"),
+        )
+        if run_jobs:
+            run_pending_jobs()
+        return image
+
+    def test_upload_queues_derivatives(self):
+        image = self._upload_image(run_jobs=False)
+        job = Job.objects.get(name=DERIVATIVES_TASK)
+        self.assertEqual(job.payload, {"path": image.image.name})
+        # Nothing is resized in the upload request itself
+        for variant in DERIVATIVE_WIDTHS:
+            self.assertFalse(default_storage.exists(derivative_name(image.image.name, variant)))
+
+        self.assertEqual(run_pending_jobs(), 1)
+        for variant in DERIVATIVE_WIDTHS:
+            self.assertTrue(default_storage.exists(derivative_name(image.image.name, variant)))
+
+    def test_filters_fall_back_to_original(self):
+        image = ProjectImage.objects.create(
+            project=self.project, image="project_images/legacy.png"
+        )
+        self.assertEqual(thumbnail_url(image.image, "card"), image.image.url)
+        self.assertEqual(thumbnail_srcset(image.image, "card"), "")
+
+    def test_search_cards_use_card_srcset(self):
+        image = self._upload_image()
+        response = self.client.get(reverse("search_research"))
+        card = default_storage.url(derivative_name(image.image.name, "card"))
+        card_2x = default_storage.url(derivative_name(image.image.name, "card_2x"))
+        self.assertContains(response, f'src="{card}"')
+        self.assertContains(response, f'srcset="{card} 480w, {card_2x} 960w"')
+        self.assertNotContains(response, f'src="{image.image.url}"')
+
+    def test_rendering_does_not_query_storage(self):
+        image = self._upload_image()
+        self.assertTrue(ThumbnailSource.objects.filter(name=image.image.name).exists())
+        with patch.object(
+            type(default_storage._wrapped), "exists", side_effect=AssertionError
+        ):
+            response = self.client.get(reverse("search_research"))
+        card = default_storage.url(derivative_name(image.image.name, "card"))
+        self.assertContains(response, f'src="{card}"')
+
+    def test_detail_page_uses_detail_srcset(self):
+        image = self._upload_image()
+        response = self.client.get(reverse("project_detail", args=[self.project.id]))
+        detail = default_storage.url(derivative_name(image.image.name, "detail"))
+        self.assertContains(response, f"{detail} 1200w")
+
+
+def fake_renderer(data, width):
+    return Image.new("RGB", (width, width * 4 // 3), "white")
+
+
+class PdfPreviewTests(ThumbnailTestCase):
+    def setUp(self):
+        super().setUp()
+        self.name = default_storage.save("posters/F1-Poster.pdf", ContentFile(b"%PDF-1.4"))
+
+    @patch("research.previews.get_renderer")
+    def test_preview_rendered_once_and_cached(self, get_renderer):
+        renderer = get_renderer.return_value
+        renderer.side_effect = fake_renderer
+        written = render_pdf_preview(default_storage, self.name)
+        preview = preview_name(self.name)
+        self.assertEqual(preview, f"posters/F1-Poster.pdf.preview.{OUTPUT_EXTENSION}")
+        self.assertEqual(
+            sorted(written),
+            sorted([preview] + [derivative_name(preview, v) for v in DERIVATIVE_WIDTHS]),
+        )
+        self.assertEqual(render_pdf_preview(default_storage, self.name), [])
+        renderer.assert_called_once()
+
+    @patch("research.previews.get_renderer", return_value=None)
+    def test_no_renderer_installed(self, get_renderer):
+        self.assertEqual(render_pdf_preview(default_storage, self.name), [])
+
+    @patch("research.previews.get_renderer")
+    def test_render_failures_are_logged(self, get_renderer):
+        get_renderer.return_value.side_effect = RuntimeError("damaged xref table")
+        with self.assertLogs("research.previews", "WARNING"):
+            self.assertEqual(render_pdf_preview(default_storage, self.name), [])
+
+    def _pdf_poster_project(self):
+        author = User.objects.create_user(
+            username="pdf_faculty", password="password", role="faculty"
+        )
+        project = ResearchProject.objects.create(
+            title="PDF Poster Project",
+            abstract="Abstract",
+            author=author,
+            approval_status="approved",
+            date_presented=date(2024, 10, 1),
+            poster_image=self.name,
+        )
+        job = Job.objects.get(name=PREVIEW_TASK)
+        self.assertEqual(job.payload, {"path": self.name})
+        return project
+
+    @patch("research.previews.get_renderer", return_value=fake_renderer)
+    def test_upload_queues_preview_job(self, get_renderer):
+        self._pdf_poster_project()
+        # Nothing is rendered until the worker runs the job
+        self.assertFalse(default_storage.exists(preview_name(self.name)))
+        self.assertEqual(run_pending_jobs(), 1)
+        self.assertTrue(default_storage.exists(preview_name(self.name)))
+        self.assertTrue(ThumbnailSource.objects.filter(name=self.name).exists())
+
+    def test_card_shows_placeholder_until_preview_exists(self):
+        self._pdf_poster_project()
+        response = self.client.get(reverse("search_research"))
+        self.assertContains(response, "bi-file-earmark-pdf fs-1")
+        self.assertNotContains(response, f'src="{default_storage.url(self.name)}"')
+
+        with patch("research.previews.get_renderer", return_value=fake_renderer):
+            render_pdf_preview(default_storage, self.name)
+        response = self.client.get(reverse("search_research"))
+        card = default_storage.url(derivative_name(preview_name(self.name), "card"))
+        self.assertContains(response, f'src="{card}"')
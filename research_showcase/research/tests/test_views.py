@@ -3,16 +3,27 @@ from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.middleware.csrf import get_token
+from django.shortcuts import render
 from django.test import Client, RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
-from ..models import ResearchProject, StatusHistory
+from users.models import Notification, create_in_app_notification
+
+from ..models import Job, OutboxEmail, ProjectImage, ResearchProject, StatusHistory
 from ..views import approve_research, submit_research  # Needed for the mock test
+from .budget import QueryBudgetMixin
 
 User = get_user_model()
 
+# Smallest file that passes the form's PDF content check
+PDF_CONTENT = b"%PDF-1.4\n%%EOF\n"
+
 
 class ResearchViewTests(TestCase):
     def setUp(self):
@@ -93,6 +104,59 @@ class ResearchViewTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertNotContains(response, "Machine Learning Analysis")
 
+    def test_search_filters_by_semester_range(self):
+        for title, presented in (
+            ("Spring Project", date(2023, 3, 1)),
+            ("Fall Project", date(2023, 9, 1)),
+            ("Winter Project", date(2024, 1, 5)),
+        ):
+            ResearchProject.objects.create(
+                title=title,
+                abstract="Abstract",
+                author=self.faculty_user,
+                approval_status="approved",
+                date_presented=presented,
+            )
+        response = self.client.get(
+            reverse("search_research"),
+            {"start_semester": "Fall 2023", "end_semester": "Winter 2023"},
+        )
+        self.assertNotContains(response, "Spring Project")
+        self.assertContains(response, "Fall Project")
+        self.assertContains(response, "Winter Project")
+
+    def test_search_defaults_to_relevance_sort_with_query(self):
+        """Relevance is the default sort for text queries, date otherwise."""
+        ResearchProject.objects.create(
+            title="Learning Rates in Practice",
+            abstract="Machine tuning notes",
+            author=self.faculty_user,
+            approval_status="approved",
+            date_presented=date.today(),
+        )
+        ResearchProject.objects.create(
+            title="Machine Translation Systems",
+            abstract="Sequence models",
+            author=self.faculty_user,
+            approval_status="approved",
+            date_presented=date.today() - timedelta(days=30),
+        )
+        response = self.client.get(reverse("search_research"), {"q": "machine"})
+        self.assertEqual(response.context["sort_by"], "relevance")
+        titles = [p.title for p in response.context["projects"]]
+        self.assertEqual(titles[0], "Machine Translation Systems")  # Title match first
+
+        response = self.client.get(
+            reverse("search_research"), {"q": "machine", "sort_by": "date"}
+        )
+        self.assertEqual(response.context["sort_by"], "date")
+        titles = [p.title for p in response.context["projects"]]
+        self.assertEqual(titles[0], "Learning Rates in Practice")
+
+        # Relevance without a query falls back to date
+        response = self.client.get(reverse("search_research"), {"sort_by": "relevance"})
+        self.assertEqual(response.context["sort_by"], "date")
+
 
 class ResearchSubmissionViewTest(TestCase):
     def setUp(self):
@@ -111,7 +175,7 @@ class ResearchSubmissionViewTest(TestCase):
 
         # Minimal valid data for POST
         self.valid_pdf = SimpleUploadedFile(
-            "valid.pdf", b"pdf content", content_type="application/pdf"
+            "valid.pdf", PDF_CONTENT, content_type="application/pdf"
         )
         self.valid_data = {
             "title": "Test Submission",
@@ -268,7 +332,7 @@ class ResearchReviewProcessTest(TestCase):
         )
         # Create file attachments for the project
         self.pdf_file = SimpleUploadedFile(
-            "test.pdf", b"pdf content", content_type="application/pdf"
+            "test.pdf", PDF_CONTENT, content_type="application/pdf"
         )
         self.project_pending.pdf_file.save("test.pdf", self.pdf_file, save=True)
 
@@ -438,6 +502,231 @@ class ResearchReviewProcessTest(TestCase):
         self.assertEqual(self.project_pending.approval_status, "needs_revision")
 
 
+class ReviewQueueTest(QueryBudgetMixin, TestCase):
+    """The review table is one projected query, whatever the queue length."""
+
+    # Session, user, the projected page and the unread count on a cache miss
+    QUERY_BUDGET = 4
+
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create_user(username="admin_queue", password="password", role="admin")
+
+    def setUp(self):
+        cache.clear()  # Unread counters of users from earlier tests
+        self.client.login(username="admin_queue", password="password")
+        self.url = reverse("review_research")
+
+    def _add_projects(self, count, **fields):
+        projects = []
+        for _ in range(count):
+            # One author per project so per-row author lookups would show up
+            author = User.objects.create_user(
+                username=f"queue_author{User.objects.count()}", role="faculty"
+            )
+            projects.append(
+                ResearchProject.objects.create(
+                    title=f"Queued Project {ResearchProject.objects.count()}",
+                    abstract="A long abstract " * 50,
+                    author=author,
+                    approval_status="pending",
+                    **fields,
+                )
+            )
+        return projects
+
+    def test_query_budget_holds_for_long_queues(self):
+        self._add_projects(2)
+        with self.assertQueryBudget(self.QUERY_BUDGET):
+            small = self.client.get(self.url)
+        self._add_projects(20, github_link="https://example.com/repo")
+        with self.assertQueryBudget(self.QUERY_BUDGET):
+            large = self.client.get(self.url)
+        self.assertEqual(len(small.context["projects"]), 2)
+        self.assertEqual(len(large.context["projects"]), 22)
+        self.assertContains(large, "queue_author")
+
+    def test_abstract_is_not_loaded_for_the_table(self):
+        self._add_projects(1)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        self.assertNotContains(response, "A long abstract")
+        project_queries = [
+            q["sql"] for q in ctx.captured_queries if "research_researchproject" in q["sql"]
+        ]
+        self.assertTrue(project_queries)
+        for sql in project_queries:
+            self.assertNotIn('"abstract"', sql)
+
+    def test_flags_are_computed_in_the_database(self):
+        (with_link,) = self._add_projects(1, github_link="https://example.com/repo")
+        (bare,) = self._add_projects(1)
+        response = self.client.get(self.url)
+        rows = {p.id: p for p in response.context["projects"]}
+        self.assertTrue(rows[with_link.id].has_github)
+        self.assertFalse(rows[with_link.id].has_video)
+        self.assertFalse(rows[bare.id].has_github)
+        self.assertFalse(rows[bare.id].has_paper)
+
+    def test_pagination(self):
+        self._add_projects(3)
+        response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(len(response.context["projects"]), 2)
+        next_url = response.context["next_page_url"]
+        self.assertIsNotNone(next_url)
+        response = self.client.get(self.url + next_url)
+        self.assertEqual(len(response.context["projects"]), 1)
+        self.assertIsNone(response.context["next_page_url"])
+        self.assertIsNotNone(response.context["previous_page_url"])
+
+        # A garbled cursor falls back to the first page
+        response = self.client.get(self.url, {"cursor": "garbage"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_abstract_endpoint(self):
+        (project,) = self._add_projects(1, project_sponsor="Acme")
+        url = reverse("review_abstract", args=[project.id])
+        response = self.client.get(url)
+        self.assertEqual(
+            response.json(), {"abstract": project.abstract, "project_sponsor": "Acme"}
+        )
+        self.assertEqual(self.client.get(reverse("review_abstract", args=[0])).status_code, 404)
+
+        User.objects.create_user(username="faculty_queue", password="password", role="faculty")
+        self.client.login(username="faculty_queue", password="password")
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+
+class BulkReviewTest(TestCase):
+    def setUp(self):
+        self.faculty_user = User.objects.create_user(
+            username="faculty_bulk",
+            password="password",
+            role="faculty",
+            email="faculty_bulk@example.com",
+        )
+        self.quiet_user = User.objects.create_user(
+            username="faculty_quiet",
+            password="password",
+            role="faculty",
+            email="quiet@example.com",
+            notify_by_email_on_status_change=False,
+            notify_in_app_on_status_change=False,
+        )
+        User.objects.create_user(username="admin_bulk", password="password", role="admin")
+        self.client.login(username="admin_bulk", password="password")
+        self.url = reverse("bulk_review")
+
+    def _make_projects(self, count, author=None, status="pending"):
+        return [
+            ResearchProject.objects.create(
+                title=f"Bulk Project {ResearchProject.objects.count()}",
+                abstract="Abstract",
+                author=author or self.faculty_user,
+                approval_status=status,
+            )
+            for _ in range(count)
+        ]
+
+    def _post(self, projects, action, **extra):
+        return self.client.post(
+            self.url,
+            {"project_ids": [p.id for p in projects], "action": action, **extra},
+            follow=True,
+        )
+
+    def test_bulk_approve(self):
+        projects = self._make_projects(3) + self._make_projects(1, author=self.quiet_user)
+        response = self._post(projects, "approve")
+        self.assertRedirects(response, reverse("review_research"))
+        self.assertContains(response, "4 project(s) updated")
+
+        self.assertEqual(
+            ResearchProject.objects.filter(approval_status="approved").count(), 4
+        )
+        history = StatusHistory.objects.filter(status_to="approved")
+        self.assertEqual(history.count(), 4)
+        self.assertTrue(all(h.status_from == "pending" for h in history))
+        self.assertEqual(history.first().comment, "Project approved.")
+        # The opted-out author gets neither an email nor a notification
+        self.assertEqual(OutboxEmail.objects.count(), 3)
+        self.assertEqual(Notification.objects.count(), 3)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_bulk_approve_ignores_feedback(self):
+        project = self._make_projects(1)[0]
+        ResearchProject.objects.filter(pk=project.pk).update(admin_feedback="Old notes")
+        self._post([project], "approve", feedback="Typed before switching actions")
+        project.refresh_from_db()
+        self.assertEqual(project.approval_status, "approved")
+        self.assertIsNone(project.admin_feedback)
+        self.assertNotIn("Typed before switching actions", OutboxEmail.objects.get().body)
+        self.assertNotIn("Typed before switching actions", Notification.objects.get().message)
+
+    def test_bulk_revise_records_feedback(self):
+        projects = self._make_projects(2)
+        self._post(projects, "revise", feedback="Add a conclusion")
+        for project in projects:
+            project.refresh_from_db()
+            self.assertEqual(project.approval_status, "needs_revision")
+            self.assertEqual(project.admin_feedback, "Add a conclusion")
+        self.assertIn("Add a conclusion", OutboxEmail.objects.first().body)
+        self.assertEqual(
+            StatusHistory.objects.first().comment,
+            "Revisions requested. Feedback: Add a conclusion",
+        )
+
+    def test_projects_no_longer_under_review_are_skipped(self):
+        pending = self._make_projects(1)
+        approved = self._make_projects(1, status="approved")
+        response = self._post(pending + approved, "reject")
+        self.assertContains(response, "1 selected project(s) were no longer awaiting review")
+        approved[0].refresh_from_db()
+        self.assertEqual(approved[0].approval_status, "approved")
+        self.assertEqual(
+            StatusHistory.objects.get().comment, "Project rejected. Reason: No reason provided."
+        )
+
+    def test_query_count_independent_of_selection_size(self):
+        def count_queries(projects):
+            Job.objects.all().delete()  # Each run queues its own delivery job
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.post(
+                    self.url, {"project_ids": [p.id for p in projects], "action": "approve"}
+                )
+            return len(ctx.captured_queries)
+
+        small = count_queries(self._make_projects(2))
+        large = count_queries(self._make_projects(20))
+        self.assertEqual(small, large)
+
+    def test_invalid_requests(self):
+        projects = self._make_projects(1)
+        self.assertEqual(self.client.get(self.url).status_code, 405)
+        response = self._post(projects, "publish")
+        self.assertContains(response, "Select at least one project and an action.")
+        self.assertFalse(StatusHistory.objects.exists())
+
+        self.client.login(username="faculty_bulk", password="password")
+        response = self.client.post(self.url, {"project_ids": [projects[0].id], "action": "approve"})
+        self.assertEqual(response.status_code, 403)
+
+    def test_non_admins_are_refused_before_the_method_check(self):
+        projects = self._make_projects(1)
+        data = {"project_ids": [projects[0].id], "action": "approve"}
+        self.client.logout()
+        for response in (self.client.get(self.url), self.client.post(self.url, data)):
+            self.assertRedirects(
+                response, f"{reverse('login')}?next={self.url}", fetch_redirect_response=False
+            )
+
+        self.client.login(username="faculty_bulk", password="password")
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        self.assertEqual(self.client.post(self.url, data).status_code, 403)
+        projects[0].refresh_from_db()
+        self.assertEqual(projects[0].approval_status, "pending")
+
+
 class MultiStepFormTest(TestCase):
     def setUp(self):
         # Create a faculty user for testing
@@ -683,6 +972,88 @@ class PublicViewsTest(TestCase):
         self.assertEqual(response.status_code, 404)  # Should be Not Found
 
 
+class ProjectDetailCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.faculty = User.objects.create_user(
+            username="detail_faculty", password="password", role="faculty"
+        )
+        self.project = ResearchProject.objects.create(
+            title="Cached Project",
+            abstract="Abstract",
+            author=self.faculty,
+            approval_status="approved",
+        )
+        self.url = reverse("project_detail", args=[self.project.id])
+
+    def test_conditional_get_returns_not_modified(self):
+        response = self.client.get(self.url)
+        self.assertIn("Last-Modified", response)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, headers={"if-none-match": response["ETag"]})
+        self.assertEqual(response.status_code, 304)
+
+    def test_changes_produce_new_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        ProjectImage.objects.create(project=self.project, image="project_images/a.jpg")
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+        etag = response["ETag"]
+        self.project.title = "Renamed Project"
+        self.project.save()
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertContains(response, "Renamed Project")
+
+    def test_anonymous_page_served_from_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertContains(response, "Cached Project")
+
+    def test_anonymous_visitors_never_share_a_csrf_token(self):
+        first, second = Client(), Client()
+        first_page = first.get(self.url).content.decode()
+        second_page = second.get(self.url).content.decode()
+        self.assertNotIn("X-CSRFToken", first_page)
+        self.assertNotIn("X-CSRFToken", second_page)
+
+        # A page that did use the visitor's token is not cached for others
+        def render_with_token(request, *args, **kwargs):
+            get_token(request)
+            return render(request, *args, **kwargs)
+
+        cache.clear()
+        with patch("research.views.render", side_effect=render_with_token):
+            first.get(self.url)
+            with CaptureQueriesContext(connection) as queries:
+                second.get(self.url)
+        # Rendered afresh rather than served (in one query) from the cache
+        self.assertGreater(len(queries), 1)
+
+    def test_gallery_images_fetched_once(self):
+        for name in ("a", "b", "c"):
+            ProjectImage.objects.create(project=self.project, image=f"project_images/{name}.jpg")
+        # Validators, project with author, images, their thumbnail flags
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.context["project_images"]), 3)
+
+    def test_signed_in_etag_is_per_user(self):
+        anonymous = self.client.get(self.url)["ETag"]
+        self.client.login(username="detail_faculty", password="password")
+        response = self.client.get(self.url)
+        self.assertNotEqual(response["ETag"], anonymous)
+        self.assertNotIn("Last-Modified", response)
+        self.assertIn("private", response["Cache-Control"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_in_app_notification(self.faculty, "Approved")
+        response = self.client.get(self.url, headers={"if-none-match": response["ETag"]})
+        self.assertEqual(response.status_code, 200)
+
+
 # --- Test from Step 2 of Implementation Guide ---
 class ApproveResearchViewTest(TestCase):
     """Tests for the approve_research view with mock objects."""
@@ -881,3 +1252,68 @@ class HomeViewTest(TestCase):
         self.assertEqual(len(response.context["projects"]), 0)
         # Check for a message indicating no projects, if applicable in the template
         # self.assertContains(response, "No projects found matching your criteria.")
+
+
+class SearchQueryCountTest(TestCase):
+    """The search page must not issue per-result queries (e.g. for thumbnails)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.faculty = User.objects.create_user(
+            username="count_faculty", password="password", role="faculty"
+        )
+
+    def _add_projects(self, count):
+        for i in range(count):
+            project = ResearchProject.objects.create(
+                title=f"Counted Project {ResearchProject.objects.count()}",
+                abstract="Abstract",
+                author=self.faculty,
+                approval_status="approved",
+                date_presented=date.today() - timedelta(days=i),
+            )
+            # Stored names only; no files are needed to build URLs
+            if i % 2:
+                project.poster_image.name = f"posters/poster{project.id}.png"
+                project.save()
+            else:
+                ProjectImage.objects.create(
+                    project=project, image=f"project_images/second{project.id}.jpg"
+                )
+                ProjectImage.objects.create(
+                    project=project, image=f"project_images/third{project.id}.jpg"
+                )
+
+    def _count_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("search_research"))
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_query_count_independent_of_result_count(self):
+        self._add_projects(2)
+        small_count, response = self._count_queries()
+        self.assertEqual(len(response.context["projects"]), 2)
+
+        self._add_projects(8)
+        large_count, response = self._count_queries()
+        self.assertEqual(len(response.context["projects"]), 10)
+        self.assertEqual(small_count, large_count)
+
+    def test_page_does_not_touch_image_table(self):
+        self._add_projects(4)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(reverse("search_research"))
+        for query in ctx.captured_queries:
+            self.assertNotIn("research_projectimage", query["sql"])
+
+    def test_thumbnail_prefers_first_image_then_poster(self):
+        self._add_projects(2)
+        _, response = self._count_queries()
+        thumbnails = {
+            p.title: p.thumbnail.url for p in response.context["projects"]
+        }
+        with_images, with_poster = ResearchProject.objects.order_by("id")
+        first_image = with_images.images.order_by("id").first()
+        self.assertEqual(thumbnails[with_images.title], first_image.image.url)
+        self.assertEqual(thumbnails[with_poster.title], with_poster.poster_image.url)
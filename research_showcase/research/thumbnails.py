@@ -0,0 +1,185 @@
+"""
+Resized derivatives of project images and image posters.
+
+Search cards and the project detail page used to load the full original
+upload (often several MB) and shrink it with CSS.  Instead, each image is
+rendered once into a few fixed widths, stored next to the original under a
+deterministic name::
+
+    project_images/plot.png -> project_images/plot.png.card.webp
+                               project_images/plot.png.card_2x.webp
+                               project_images/plot.png.detail.webp
+
+The original's extension stays in the name, so ``plot.png`` and ``plot.jpg``
+never share derivatives.
+
+PDF posters and papers get the same derivatives from a raster of their first
+page (see ``research/previews.py``)::
+
+    posters/f1.pdf -> posters/f1.pdf.preview.webp -> posters/f1.pdf.preview.card.webp ...
+
+Uploads queue the rendering as a job for the ``run_jobs`` worker (see
+research/jobs.py), so resizing never delays the upload request.  Generated
+files are recorded as ``ThumbnailSource`` rows.  Templates pick
+between the derivatives with ``srcset`` (see
+``research/templatetags/thumbnails.py``) for recorded files, and fall back to
+the original image otherwise, e.g. for uploads that predate this module;
+``manage.py generate_thumbnails`` fills those in.  Rendering a page never asks
+storage whether a derivative exists.
+"""
+
+import logging
+import os
+from io import BytesIO
+from typing import Dict, List
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from PIL import Image, ImageOps, features
+
+from .jobs import enqueue
+from .models import record_thumbnail_source
+
+logger = logging.getLogger(__name__)
+
+# Derivative name -> maximum width in pixels (aspect ratio is preserved)
+DERIVATIVE_WIDTHS: Dict[str, int] = {
+    "card": 480,
+    "card_2x": 960,
+    "detail": 1200,
+}
+
+# Derivatives offered in each srcset, smallest first
+SRCSET_VARIANTS: Dict[str, List[str]] = {
+    "card": ["card", "card_2x"],
+    "detail": ["card_2x", "detail"],
+}
+
+# Originals Pillow can read; PDFs go through a first-page preview instead
+SOURCE_EXTENSIONS: List[str] = ["jpg", "jpeg", "png", "gif", "webp"]
+PREVIEW_EXTENSIONS: List[str] = ["pdf"]
+
+OUTPUT_FORMAT: str = "WEBP" if features.check("webp") else "JPEG"
+OUTPUT_EXTENSION: str = "webp" if OUTPUT_FORMAT == "WEBP" else "jpg"
+OUTPUT_QUALITY: int = 80
+DERIVATIVES_TASK: str = "research.generate_derivatives"
+
+
+def _extension(name: str) -> str:
+    return os.path.splitext(name or "")[1][1:].lower()
+
+
+def is_image_name(name: str) -> bool:
+    return _extension(name) in SOURCE_EXTENSIONS
+
+
+def is_previewable_name(name: str) -> bool:
+    return _extension(name) in PREVIEW_EXTENSIONS
+
+
+def derivative_name(name: str, variant: str) -> str:
+    """Storage name of ``variant`` for the original stored as ``name``."""
+    return f"{name}.{variant}.{OUTPUT_EXTENSION}"
+
+
+def preview_name(name: str) -> str:
+    """Storage name of the first-page raster of the document ``name``."""
+    return derivative_name(name, "preview")
+
+
+def _render(source: Image.Image, width: int) -> bytes:
+    image = source.copy()
+    if image.width > width:
+        height = max(1, round(image.height * width / image.width))
+        image = image.resize((width, height), Image.Resampling.LANCZOS)
+
+    buffer = BytesIO()
+    image.save(buffer, OUTPUT_FORMAT, quality=OUTPUT_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+def write_image(storage: Storage, name: str, image: Image.Image, width: int) -> str:
+    """Store ``image`` scaled down to ``width`` under exactly ``name``."""
+    if storage.exists(name):
+        # save() would pick a new name instead of overwriting
+        storage.delete(name)
+    return storage.save(name, ContentFile(_render(image, width)))
+
+
+def prepare_image(image: Image.Image) -> Image.Image:
+    """First frame, upright, in a mode the output format can encode."""
+    image.seek(0)
+    image = ImageOps.exif_transpose(image)
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    if has_alpha and OUTPUT_FORMAT == "WEBP":
+        return image.convert("RGBA")
+    if has_alpha:
+        # JPEG has no alpha channel; flatten onto white like the page background
+        rgba = image.convert("RGBA")
+        flattened = Image.new("RGB", rgba.size, (255, 255, 255))
+        flattened.paste(rgba, mask=rgba.getchannel("A"))
+        return flattened
+    return image.convert("RGB")
+
+
+def generate_derivatives(
+    storage: Storage, name: str, force: bool = False, record_as: str = ""
+) -> List[str]:
+    """
+    Write the resized derivatives of the image stored as ``name``.
+
+    Existing derivatives are kept unless ``force`` is set.  Once all of them
+    exist, ``record_as`` (default ``name``) is recorded as a thumbnail source.
+    Returns the names written; unreadable or missing originals are logged and
+    skipped.
+    """
+    if not is_image_name(name):
+        return []
+    targets = {
+        variant: derivative_name(name, variant) for variant in DERIVATIVE_WIDTHS
+    }
+    if not force:
+        targets = {v: n for v, n in targets.items() if not storage.exists(n)}
+
+    written = []
+    if targets:
+        try:
+            with storage.open(name, "rb") as original:
+                with Image.open(original) as opened:
+                    source = prepare_image(opened)
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            logger.warning("Cannot create thumbnails for %s: %s", name, e)
+            return []
+        written = [
+            write_image(storage, target, source, DERIVATIVE_WIDTHS[variant])
+            for variant, target in targets.items()
+        ]
+    record_thumbnail_source(record_as or name)
+    return written
+
+
+def schedule_derivatives(name: str) -> None:
+    """
+    Queue a job writing the derivatives of the image ``name`` in default
+    storage.  Call inside the transaction that stores the upload.
+    """
+    enqueue(DERIVATIVES_TASK, unique=True, path=name)
+
+
+def derivative_urls(fieldfile, variants: List[str]) -> Dict[str, str]:
+    """
+    URLs of the ``variants`` of ``fieldfile``, or none if its derivatives are
+    not known to exist (see ``load_thumbnail_flags``).
+    """
+    if not fieldfile:
+        return {}
+    if not getattr(fieldfile.instance, f"{fieldfile.field.name}_derivatives", False):
+        return {}
+    if is_image_name(fieldfile.name):
+        source = fieldfile.name
+    elif is_previewable_name(fieldfile.name):
+        source = preview_name(fieldfile.name)
+    else:
+        return {}
+    storage = fieldfile.storage
+    return {variant: storage.url(derivative_name(source, variant)) for variant in variants}
@@ -2,12 +2,15 @@ from django.urls import path
 
 from .views import (
     approve_research,
+    bulk_review,
     edit_submission,
+    export_projects,
     my_submissions,
     project_detail,
     project_history,
     reject_research,
     request_revision,
+    review_abstract,
     review_research,
     search_research,
     submission_success,
@@ -22,7 +25,10 @@ urlpatterns = [
     path("approve/<int:project_id>/", approve_research, name="approve_research"),
     path("reject/<int:project_id>/", reject_research, name="reject_research"),
     path("revise/<int:project_id>/", request_revision, name="request_revision"),
+    path("review/bulk/", bulk_review, name="bulk_review"),
+    path("review/<int:project_id>/abstract/", review_abstract, name="review_abstract"),
     path("search/", search_research, name="search_research"),
+    path("export/", export_projects, name="export_projects"),
     path("submit/success/", submission_success, name="submission_success"),
     path("project/<int:project_id>/", project_detail, name="project_detail"),
     path("project/<int:project_id>/history/", project_history, name="project_history"),
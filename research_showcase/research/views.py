@@ -1,25 +1,91 @@
+import hashlib
 from datetime import date
+from urllib.parse import urlencode
 
-from django.conf import settings  # To get default from email
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required  # Import login_required
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied  # Import PermissionDenied
-
-# Import Django's email functions and template loader
-from django.core.mail import send_mail
-
-# Import Q for complex lookups, and Min/Max for aggregates
-from django.db.models import Max, Min, Q
-from django.http import Http404  # Import Http404
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+
+# Import Q for complex lookups and the expressions used to project the
+# review queue
+from django.db.models import (
+    BooleanField,
+    Case,
+    CharField,
+    Count,
+    ExpressionWrapper,
+    F,
+    Max,
+    Q,
+    Value,
+    When,
+)
+from django.db.models.functions import Concat, Length, Substr
+from django.http import (  # Import Http404
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect, render
-from django.template.loader import render_to_string
 from django.urls import reverse  # Import reverse
+from django.utils import timezone
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+    quote_etag,
+)
+from django.utils.http import http_date
+from django.views.decorators.http import require_POST
 from users.decorators import admin_required, faculty_required
-from users.models import create_in_app_notification  # Import the new function
-
+from users.models import (  # Import the new functions
+    bulk_create_in_app_notifications,
+    create_in_app_notification,
+)
+from users.notifications import get_unread_count
+
+from .catalog import (
+    approved_date_range,
+    invalidate_catalog_cache,
+    normalize_query,
+    search_facets,
+)
+from .export import (
+    EXPORT_FORMATS,
+    aiter_export,
+    export_queryset,
+    export_statuses,
+    iter_export,
+    parse_since,
+)
 from .forms import ResearchProjectForm
-from .models import ProjectImage, ResearchProject, StatusHistory
-from .semester_utils import generate_semesters
+from .models import (
+    OutboxEmail,
+    ProjectImage,
+    ResearchProject,
+    StatusHistory,
+    load_thumbnail_flags,
+)
+from .outbox import (
+    build_status_change_email,
+    queue_status_change_email,
+    schedule_delivery,
+)
+from .pagination import InvalidCursor, KeysetPage, KeysetPaginator, clamp_page_size
+from .result_cache import CachedPage, cache_page, get_cached_page, result_cache_key
+from .search_filters import (
+    SEARCH_ATTACHMENT_FILTERS,
+    SEARCH_SORT_ORDERS,
+    clean_attachments,
+    filter_projects,
+    resolve_sort,
+)
+from .semester_utils import get_semester_catalog, semester_name
 
 # Define the canonical home view here
 # def home_view(request):
@@ -108,112 +174,131 @@ def submission_success(request):
     return render(request, "research/submission_success.html")
 
 
+# Statuses shown in the review queue, and so open to review actions
+REVIEWABLE_STATUSES = ("pending", "needs_revision")
+# Review queue rows are ordered newest submission first
+REVIEW_ORDERING = ("-submission_date", "-id")
+REVIEW_PAGE_SIZE = 25
+# Collaborator lists longer than this are truncated in the review table
+COLLABORATORS_DISPLAY_LENGTH = 100
+
+
+def _review_queue():
+    """
+    Pending and needs_revision projects, projected for the review table.
+
+    Loads the author in the same query, skips the abstract (fetched on
+    demand by ``review_abstract``) and computes the attachment flags and
+    the collaborator summary in the database.
+    """
+    collaborators = F("collaborator_names")
+    return (
+        ResearchProject.objects.filter(approval_status__in=REVIEWABLE_STATUSES)
+        .select_related("author")
+        .only(
+            "id",
+            "title",
+            "student_author_name",
+            "submission_date",
+            "date_presented",
+            "approval_status",
+            "pdf_file",
+            "presentation_file",
+            "poster_image",
+            "github_link",
+            "video_link",
+            "author__username",
+        )
+        .alias(collaborators_length=Length("collaborator_names"))
+        .annotate(
+            # Check file attachments; NULL and "" both mean "none"
+            has_paper=ExpressionWrapper(Q(pdf_file__gt=""), output_field=BooleanField()),
+            has_poster=ExpressionWrapper(Q(poster_image__gt=""), output_field=BooleanField()),
+            has_presentation=ExpressionWrapper(
+                Q(presentation_file__gt=""), output_field=BooleanField()
+            ),
+            # Check links
+            has_github=ExpressionWrapper(Q(github_link__gt=""), output_field=BooleanField()),
+            has_video=ExpressionWrapper(Q(video_link__gt=""), output_field=BooleanField()),
+            # Format collaborators for display, truncating long lists
+            collaborators_display=Case(
+                When(Q(collaborator_names=""), then=Value("")),
+                When(
+                    Q(collaborators_length__gt=COLLABORATORS_DISPLAY_LENGTH),
+                    then=Concat(
+                        Substr(collaborators, 1, COLLABORATORS_DISPLAY_LENGTH), Value("...")
+                    ),
+                ),
+                default=collaborators,
+                output_field=CharField(),
+            ),
+        )
+    )
+
+
 @admin_required  # Only admins can review research
 def review_research(request):
     """
     View for administrators to review pending research submissions.
 
-    Displays a table of all pending research projects with their details
-    and provides options to approve or reject each submission.
+    Displays a paginated table of pending research projects with their
+    details and provides options to approve or reject each submission.
 
     Args:
         request: The HTTP request object
 
     Returns:
-        Rendered template with list of pending projects
+        Rendered template with a page of pending projects
     """
-    # Fetch pending and needs_revision projects
-    projects = ResearchProject.objects.filter(
-        Q(approval_status="pending") | Q(approval_status="needs_revision")
-    ).order_by("-submission_date")
-
-    # Process projects for display
-    for project in projects:
-        # Check file attachments
-        project.has_paper = bool(project.pdf_file)
-        project.has_poster = bool(project.poster_image)
-        project.has_presentation = bool(project.presentation_file)
-
-        # Check links
-        project.has_github = bool(project.github_link)
-        project.has_video = bool(project.video_link)
-
-        # Format collaborators for display if needed
-        if project.collaborator_names:
-            # If it's a long list, truncate it for the table view
-            if len(project.collaborator_names) > 100:
-                project.collaborators_display = project.collaborator_names[:100] + "..."
-            else:
-                project.collaborators_display = project.collaborator_names
-        else:
-            project.collaborators_display = "None"
+    paginator = KeysetPaginator(
+        _review_queue(),
+        REVIEW_ORDERING,
+        page_size=clamp_page_size(request.GET.get("page_size"), default=REVIEW_PAGE_SIZE),
+    )
+    try:
+        page = paginator.get_page(request.GET.get("cursor"))
+    except InvalidCursor:
+        page = paginator.get_page()
 
     return render(
         request,
         "research/review_research.html",
-        {"projects": projects, "page_title": "Review Research Submissions"},
+        {
+            "projects": page.object_list,
+            "page": page,
+            "next_page_url": _page_url(request, page.next_cursor) if page.has_next else None,
+            "previous_page_url": (
+                _page_url(request, page.previous_cursor) if page.has_previous else None
+            ),
+            "page_title": "Review Research Submissions",
+        },
     )
 
 
-# --- Email Sending Utility ---
+@admin_required
+def review_abstract(request, project_id):
+    """Abstract and sponsor of a submission, loaded when its review modal opens."""
+    project = get_object_or_404(
+        ResearchProject.objects.only("abstract", "project_sponsor"), id=project_id
+    )
+    return JsonResponse(
+        {"abstract": project.abstract, "project_sponsor": project.project_sponsor or ""}
+    )
 
 
-def send_status_change_email(project, template_name, subject_prefix, feedback=None):
-    """Sends an email notification to the faculty author about status change."""
-    faculty_user = project.author
+# --- Email Sending Utility ---
 
-    # Check if the user wants email notifications and has an email address
-    if (
-        not faculty_user
-        or not faculty_user.email
-        or not faculty_user.notify_by_email_on_status_change
-    ):
-        if faculty_user and not faculty_user.notify_by_email_on_status_change:
-            print(
-                f"Skipping email for '{project.title}': User {faculty_user.username} opted out."
-            )  # Log skip
-        elif not faculty_user or not faculty_user.email:
-            # Keep the original warning message behavior for missing user/email
-            # We need a request object to use messages.warning, so maybe just print for now
-            print(
-                f"WARNING: Could not send notification for '{project.title}': Author or email missing."
-            )
-        # messages.warning(
-        #     request, # request is not available in this scope
-        #     f"Could not send notification for '{project.title}': Author email missing.",
-        # )
-        return
 
-    context = {
-        "project": project,
-        "faculty_name": faculty_user.get_full_name() or faculty_user.username,
-        "feedback": feedback or project.admin_feedback or "N/A",
-    }
+def send_status_change_email(project, template_name, feedback=None):
+    """
+    Queues an email notification to the faculty author about a status change.
 
-    try:
-        # Render subject and message from templates
-        email_content = render_to_string(template_name, context)
-        # Simple subject extraction (assumes first line is Subject: ...)
-        subject = email_content.splitlines()[0]
-        message = "\n".join(email_content.splitlines()[1:]).strip()
-
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,  # Use default sender from settings
-            recipient_list=[faculty_user.email],
-            fail_silently=False,  # Raise error if sending fails
-        )
-        print(
-            f"Status change email sent to {faculty_user.email} for project {project.id}"
-        )  # Logging
-    except Exception as e:
-        # Log the error - replace print with proper logging in production
-        print(
-            f"ERROR sending status change email for project {project.id} to {faculty_user.email}: {e}"
-        )
-        # Optionally inform the admin via messages
-        # messages.error(request, f"Failed to send email notification to {faculty_user.email}. Error: {e}")
+    The message is written to the outbox in the caller's transaction and sent
+    in a batch by the ``run_jobs`` worker (see research/outbox.py), so a slow
+    mail server cannot stall the review pages.
+    """
+    if queue_status_change_email(project, template_name, feedback=feedback):
+        schedule_delivery()
 
 
 # --- End Email Sending Utility ---
@@ -235,22 +320,23 @@ def approve_research(request, project_id):
     project = get_object_or_404(ResearchProject, id=project_id)
     old_status = project.approval_status
 
-    # Update approval status and clear feedback
-    project.approval_status = "approved"
-    project.admin_feedback = None  # Clear feedback on approval
-    project.save()
+    # The status change, its history and the queued email commit together
+    with transaction.atomic():
+        # Update approval status and clear feedback
+        project.approval_status = "approved"
+        project.admin_feedback = None  # Clear feedback on approval
+        project.save()
 
-    # Create history record
-    _create_status_history(
-        project, request.user, old_status, "approved", "Project approved."
-    )
+        # Create history record
+        _create_status_history(
+            project, request.user, old_status, "approved", "Project approved."
+        )
 
-    # Send email notification
-    send_status_change_email(
-        project,
-        template_name="research/emails/submission_approved.txt",
-        subject_prefix="Research Project Approved",
-    )
+        # Queue email notification
+        send_status_change_email(
+            project,
+            template_name="research/emails/submission_approved.txt",
+        )
 
     # Create in-app notification
     try:
@@ -283,27 +369,27 @@ def reject_research(request, project_id):
             "rejection_reason", "No reason provided."
         )  # Provide default
 
-        # Update status and feedback
-        project.approval_status = "rejected"
-        project.admin_feedback = rejection_reason  # Store the reason
-        project.save()
-
-        # Create history record
-        _create_status_history(
-            project,
-            request.user,
-            old_status,
-            "rejected",
-            f"Project rejected. Reason: {rejection_reason}",
-        )
+        with transaction.atomic():
+            # Update status and feedback
+            project.approval_status = "rejected"
+            project.admin_feedback = rejection_reason  # Store the reason
+            project.save()
+
+            # Create history record
+            _create_status_history(
+                project,
+                request.user,
+                old_status,
+                "rejected",
+                f"Project rejected. Reason: {rejection_reason}",
+            )
 
-        # Send email notification
-        send_status_change_email(
-            project,
-            template_name="research/emails/submission_rejected.txt",
-            subject_prefix="Research Project Rejected",
-            feedback=rejection_reason,  # Pass feedback explicitly
-        )
+            # Queue email notification
+            send_status_change_email(
+                project,
+                template_name="research/emails/submission_rejected.txt",
+                feedback=rejection_reason,  # Pass feedback explicitly
+            )
 
         # Create in-app notification
         try:
@@ -348,27 +434,27 @@ def request_revision(request, project_id):
             "revision_feedback", "Revisions requested."
         )  # Provide default
 
-        # Update status and feedback
-        project.approval_status = "needs_revision"
-        project.admin_feedback = revision_feedback  # Store the feedback
-        project.save()
-
-        # Create history record
-        _create_status_history(
-            project,
-            request.user,
-            old_status,
-            "needs_revision",
-            f"Revisions requested. Feedback: {revision_feedback}",
-        )
+        with transaction.atomic():
+            # Update status and feedback
+            project.approval_status = "needs_revision"
+            project.admin_feedback = revision_feedback  # Store the feedback
+            project.save()
+
+            # Create history record
+            _create_status_history(
+                project,
+                request.user,
+                old_status,
+                "needs_revision",
+                f"Revisions requested. Feedback: {revision_feedback}",
+            )
 
-        # Send email notification
-        send_status_change_email(
-            project,
-            template_name="research/emails/submission_revision_requested.txt",
-            subject_prefix="Revisions Requested for Research Project",
-            feedback=revision_feedback,  # Pass feedback explicitly
-        )
+            # Queue email notification
+            send_status_change_email(
+                project,
+                template_name="research/emails/submission_revision_requested.txt",
+                feedback=revision_feedback,  # Pass feedback explicitly
+            )
 
         # Create in-app notification
         try:
@@ -398,14 +484,283 @@ def request_revision(request, project_id):
         )
 
 
+# Bulk review actions: target status, default feedback, email template and
+# the history comment / notification text used by the single-project views
+BULK_REVIEW_ACTIONS = {
+    "approve": {
+        "status": "approved",
+        # Approval clears feedback, as in approve_research
+        "takes_feedback": False,
+        "default_feedback": None,
+        "template": "research/emails/submission_approved.txt",
+        "comment": "Project approved.",
+        "notification": "Your research project '{title}' has been approved and published.",
+        "link": lambda project: reverse("project_detail", args=[project.id]),
+    },
+    "reject": {
+        "status": "rejected",
+        "takes_feedback": True,
+        "default_feedback": "No reason provided.",
+        "template": "research/emails/submission_rejected.txt",
+        "comment": "Project rejected. Reason: {feedback}",
+        "notification": "Your research project '{title}' was rejected. Reason: {feedback}",
+        "link": lambda project: reverse("my_submissions"),
+    },
+    "revise": {
+        "status": "needs_revision",
+        "takes_feedback": True,
+        "default_feedback": "Revisions requested.",
+        "template": "research/emails/submission_revision_requested.txt",
+        "comment": "Revisions requested. Feedback: {feedback}",
+        "notification": "Revisions requested for your project '{title}'. Feedback: {feedback}",
+        "link": lambda project: reverse("edit_submission", args=[project.id]),
+    },
+}
+
+
+@admin_required
+@require_POST
+def bulk_review(request):
+    """
+    Apply one review action to many submissions at once.
+
+    Expects ``project_ids`` (repeated), ``action`` (a key of
+    ``BULK_REVIEW_ACTIONS``) and optional ``feedback``, which approvals
+    ignore. The status change is a single UPDATE and the history rows,
+    outbox emails and notifications are bulk inserts, all in one
+    transaction, so the number of queries does not grow with the number of
+    projects.
+    """
+    action = BULK_REVIEW_ACTIONS.get(request.POST.get("action"))
+    project_ids = {
+        int(value) for value in request.POST.getlist("project_ids") if value.isdigit()
+    }
+    if action is None or not project_ids:
+        messages.error(request, "Select at least one project and an action.")
+        return redirect("review_research")
+
+    feedback = action["default_feedback"]
+    if action["takes_feedback"]:
+        feedback = request.POST.get("feedback", "").strip() or feedback
+    new_status = action["status"]
+
+    with transaction.atomic():
+        projects = list(
+            ResearchProject.objects.select_for_update()
+            .select_related("author")
+            .filter(id__in=project_ids, approval_status__in=REVIEWABLE_STATUSES)
+        )
+        ResearchProject.objects.filter(id__in=[p.id for p in projects]).update(
+            approval_status=new_status, admin_feedback=feedback
+        )
+        if new_status == "approved":
+            # update() sends no signals
+            invalidate_catalog_cache()
+
+        history, emails, notifications = [], [], []
+        for project in projects:
+            history.append(
+                StatusHistory(
+                    project=project,
+                    actor=request.user,
+                    status_from=project.approval_status,
+                    status_to=new_status,
+                    comment=action["comment"].format(feedback=feedback),
+                )
+            )
+            # Render emails against the new state
+            project.approval_status = new_status
+            project.admin_feedback = feedback
+            email = build_status_change_email(project, action["template"], feedback=feedback)
+            if email is not None:
+                emails.append(email)
+            notifications.append(
+                (
+                    project.author,
+                    action["notification"].format(title=project.title, feedback=feedback),
+                    action["link"](project),
+                )
+            )
+
+        StatusHistory.objects.bulk_create(history)
+        if emails:
+            OutboxEmail.objects.bulk_create(emails)
+            schedule_delivery()
+        bulk_create_in_app_notifications(notifications)
+
+    if projects:
+        messages.success(
+            request,
+            f"{len(projects)} project(s) updated to "
+            f"'{dict(ResearchProject.STATUS_CHOICES)[new_status]}'.",
+        )
+    skipped = len(project_ids) - len(projects)
+    if skipped:
+        messages.warning(
+            request, f"{skipped} selected project(s) were no longer awaiting review."
+        )
+    return redirect("review_research")
+
+
+def _page_url(request, cursor):
+    """Current URL with the pagination cursor replaced."""
+    params = request.GET.copy()
+    params["cursor"] = cursor
+    return f"?{params.urlencode()}"
+
+
+def _facet_url(request, **params):
+    """
+    Current URL with ``params`` replaced (``None`` or an empty list removes
+    one) and pagination restarted.
+    """
+    query = request.GET.copy()
+    query.pop("cursor", None)
+    for name, value in params.items():
+        if value is None or value == []:
+            query.pop(name, None)
+        elif isinstance(value, list):
+            query.setlist(name, value)
+        else:
+            query[name] = value
+    return f"?{query.urlencode()}"
+
+
+def _facet_links(request, facets, start, end, sponsor, attachments):
+    """Facet values of the search page with their counts and toggle links."""
+    semester_links = []
+    for key, count in facets.semesters:
+        name = semester_name(key)
+        active = start is not None and start.key == key == (end.key if end else None)
+        semester_links.append(
+            {
+                "name": name,
+                "count": count,
+                "active": active,
+                "url": _facet_url(
+                    request,
+                    start_semester=None if active else name,
+                    end_semester=None if active else name,
+                ),
+            }
+        )
+    sponsor_links = [
+        {
+            "name": name,
+            "count": count,
+            "active": name == sponsor,
+            "url": _facet_url(request, sponsor=None if name == sponsor else name),
+        }
+        for name, count in facets.sponsors
+    ]
+    attachment_links = []
+    for value, (label, _) in SEARCH_ATTACHMENT_FILTERS.items():
+        active = value in attachments
+        toggled = [v for v in attachments if v != value] if active else [*attachments, value]
+        attachment_links.append(
+            {
+                "name": label,
+                "count": getattr(facets, f"has_{value}"),
+                "active": active,
+                "url": _facet_url(request, has=toggled),
+            }
+        )
+    return {
+        "semesters": semester_links,
+        "sponsors": sponsor_links,
+        "attachments": attachment_links,
+    }
+
+
+def _semester_selection(start_semester, end_semester, earliest_date, latest_date):
+    """
+    Resolve the semester range selected on the search page.
+
+    Returns the semester catalog covering the archive's dates (plus a year
+    either side) and the selected start and end semesters, defaulting to
+    the semesters around the earliest and latest projects and swapped if
+    given in reverse.  Unknown names resolve to ``None``.
+    """
+    catalog = get_semester_catalog(earliest_date.year - 1, latest_date.year + 1)
+
+    if start_semester:
+        start = catalog.get(start_semester)
+    else:
+        # The first semester that contains or follows the earliest project
+        start = catalog.first_ending_on_or_after(earliest_date) or catalog.semesters[0]
+    if end_semester:
+        end = catalog.get(end_semester)
+    else:
+        # The last semester that contains or precedes the latest project
+        end = catalog.last_starting_on_or_before(latest_date) or catalog.semesters[-1]
+
+    if start and end and start.ordinal > end.ordinal:
+        start, end = end, start
+    return catalog, start, end
+
+
+def _search_page(query, start, end, sponsor, attachments, sort_by, cursor, page_size):
+    """Run the search page's query and fetch the page at ``cursor``."""
+    # Cards use the denormalized thumbnail column, so the page needs no
+    # join to the project image table
+    projects_query = filter_projects(
+        ResearchProject.objects.filter(approval_status="approved"),
+        query=query,
+        start_key=start.key if start else None,
+        end_key=end.key if end else None,
+        sponsor=sponsor,
+        attachments=attachments,
+        sort_by=sort_by,
+    )
+
+    # Keyset cursors need non-null sort keys; undated projects fall outside
+    # every semester range anyway
+    if sort_by == "date":
+        projects_query = projects_query.exclude(date_presented__isnull=True)
+
+    # Fetch only the requested page, in sort order
+    paginator = KeysetPaginator(
+        projects_query, SEARCH_SORT_ORDERS[sort_by], page_size=page_size
+    )
+    try:
+        return paginator.get_page(cursor)
+    except InvalidCursor:
+        # Stale or tampered cursor: start over from the first page
+        return paginator.get_page()
+
+
+def _cached_search_page(cached):
+    """Rebuild a search page from its cached ids, in the cached order."""
+    projects = ResearchProject.objects.filter(approval_status="approved").in_bulk(
+        cached.ids
+    )
+    return KeysetPage(
+        [projects[pk] for pk in cached.ids if pk in projects],
+        next_cursor=cached.next_cursor,
+        previous_cursor=cached.previous_cursor,
+    )
+
+
 def search_research(request):
     """
-    Search for research projects by title, abstract, or project sponsor.
+    Search for research projects by title, abstract, sponsor, or people.
 
     This view handles searching of approved research projects. When a query
-    is provided, it filters projects containing the search term in their
-    title, abstract, or project sponsor fields. Without a query, it returns
-    all approved projects.
+    is provided, it filters projects through the full-text index (title,
+    abstract, project sponsor, student author and collaborators; see
+    research/search_index.py). Without a query, it returns all approved
+    projects.
+
+    The sidebar shows facet counts for the query (per semester, sponsor
+    and attachment type; see ``research.catalog.search_facets``), and the
+    'sponsor' and 'has' parameters narrow the results to one sponsor or to
+    projects with a paper, GitHub link or video.
+
+    Results can be sorted by relevance (BM25 score from the index, the
+    default when a query is given), presentation date (the default
+    otherwise) or title, and are paginated by keyset cursors ('cursor' and
+    'page_size' parameters) so each request reads a bounded slice.  Pages
+    are cached as id lists per normalized request (research/result_cache.py).
 
     Args:
         request: The HTTP request object containing the 'q' query parameter
@@ -413,18 +768,16 @@ def search_research(request):
     Returns:
         Rendered template with filtered research projects and the search query
     """
-    query = request.GET.get("q", "")
+    query = request.GET.get("q", "").strip()
     start_semester = request.GET.get("start_semester", "")
     end_semester = request.GET.get("end_semester", "")
-    sort_by = request.GET.get("sort_by", "date")  # Default to sorting by date
-
-    # First, determine the date range of all projects in the database
-    date_range = ResearchProject.objects.filter(approval_status="approved").aggregate(
-        earliest=Min("date_presented"), latest=Max("date_presented")
-    )
+    sponsor = request.GET.get("sponsor", "")
+    attachments = clean_attachments(request.GET.getlist("has"))
+    requested_sort = request.GET.get("sort_by", "")
+    sort_by = resolve_sort(requested_sort, query)
 
-    earliest_date = date_range["earliest"]
-    latest_date = date_range["latest"]
+    # First, determine the date range of all approved projects (cached)
+    earliest_date, latest_date = approved_date_range()
 
     # If no projects exist, use reasonable defaults
     if not earliest_date or not latest_date:
@@ -432,129 +785,208 @@ def search_research(request):
         earliest_date = date(current_year - 2, 1, 1)
         latest_date = date(current_year, 12, 31)
 
-    # Generate semesters covering our data range, plus a buffer
-    start_year = earliest_date.year - 1  # Add one year buffer before
-    end_year = latest_date.year + 1  # Add one year buffer after
-
-    # Generate all semesters in this range
-    semesters = generate_semesters(start_year, end_year)
-
-    # Sort semesters chronologically
-    season_order = {"Spring": 0, "Summer": 1, "Fall": 2, "Winter": 3}
-    sorted_semesters = sorted(
-        semesters.keys(), key=lambda x: (int(x.split()[1]), season_order[x.split()[0]])
+    catalog, start, end = _semester_selection(
+        start_semester, end_semester, earliest_date, latest_date
     )
-
-    # Determine default selections if none provided
-    if not start_semester and sorted_semesters:
-        # Find the first semester that contains or precedes the earliest project
-        for sem in sorted_semesters:
-            if semesters[sem]["end"] >= earliest_date:
-                start_semester = sem
-                break
-        if not start_semester:  # Fallback
-            start_semester = sorted_semesters[0]
-
-    if not end_semester and sorted_semesters:
-        # Find the last semester that contains or follows the latest project
-        for sem in reversed(sorted_semesters):
-            if semesters[sem]["start"] <= latest_date:
-                end_semester = sem
-                break
-        if not end_semester:  # Fallback
-            end_semester = sorted_semesters[-1]
-
-    if start_semester in semesters and end_semester in semesters:
-        start_idx = sorted_semesters.index(start_semester)
-        end_idx = sorted_semesters.index(end_semester)
-
-        if start_idx > end_idx:
-            # Swap them
-            start_semester, end_semester = end_semester, start_semester
-
-    # Convert selected semesters to dates for filtering
-    start_date = None
-    end_date = None
-
-    if start_semester and start_semester in semesters:
-        start_date = semesters[start_semester]["start"]
-
-    if end_semester and end_semester in semesters:
-        end_date = semesters[end_semester]["end"]
-
-    # Build the query with prefetching for efficiency
-    projects_query = ResearchProject.objects.filter(
-        approval_status="approved"
-    ).prefetch_related("images")  # Prefetch related ProjectImage objects
-
-    # Apply text search if provided
-    if query:
-        projects_query = projects_query.filter(
-            Q(title__icontains=query)
-            | Q(abstract__icontains=query)
-            | Q(project_sponsor__icontains=query)
+    start_semester = start.name if start else start_semester
+    end_semester = end.name if end else end_semester
+
+    # Result pages are cached as id lists under the normalized request
+    # (research/result_cache.py); a hit needs one primary-key lookup
+    search_query = normalize_query(query)
+    cursor = request.GET.get("cursor", "")
+    page_size = clamp_page_size(request.GET.get("page_size"))
+    cache_key = result_cache_key(
+        q=search_query,
+        start=start.key if start else None,
+        end=end.key if end else None,
+        sponsor=sponsor,
+        has=sorted(attachments),
+        sort_by=sort_by,
+        cursor=cursor,
+        page_size=page_size,
+    )
+    cached = get_cached_page(cache_key)
+    if cached is not None:
+        page = _cached_search_page(cached)
+    else:
+        page = _search_page(
+            search_query, start, end, sponsor, attachments, sort_by, cursor, page_size
         )
+        cache_page(
+            cache_key,
+            CachedPage([p.pk for p in page], page.next_cursor, page.previous_cursor),
+        )
+    projects_list = page.object_list
+    # Which card thumbnails have resized derivatives, in one query
+    load_thumbnail_flags((project, "thumbnail") for project in projects_list)
 
-    # Apply date filtering if provided
-    if start_date:
-        projects_query = projects_query.filter(date_presented__gte=start_date)
-
-    if end_date:
-        projects_query = projects_query.filter(date_presented__lte=end_date)
-
-    # Apply sorting before final processing
-    sort_order = "title" if sort_by == "title" else "-date_presented"
-    projects_list = list(
-        projects_query.order_by(sort_order)
-    )  # Execute query and get list
-
-    # Process list to add thumbnail URL
-    for project in projects_list:
-        project.thumbnail_url = None  # Default to None
-        first_image = (
-            project.images.first()
-        )  # Get first related image (uses prefetched data)
-        if first_image:
-            project.thumbnail_url = first_image.image.url
-        elif project.poster_image:  # Check poster image if no project images exist
-            project.thumbnail_url = project.poster_image.url
-
-    # Ensure sort_by is correctly set for the template context
-    if sort_by != "title":
-        sort_by = "date"
+    facets = search_facets(search_query)
+    # Carried on the sort links, which are built in the template
+    filter_params = [("has", value) for value in attachments]
+    if sponsor:
+        filter_params.insert(0, ("sponsor", sponsor))
 
     context = {
-        "projects": projects_list,  # Pass the processed list
+        "projects": projects_list,
         "query": query,
-        "semesters": sorted_semesters,
+        "sponsor": sponsor,
+        "attachments": attachments,
+        "facets": facets,
+        "facet_links": _facet_links(request, facets, start, end, sponsor, attachments),
+        "filter_params": urlencode(filter_params),
+        "semesters": catalog.names,
         "start_semester": start_semester,
         "end_semester": end_semester,
         "sort_by": sort_by,
+        "sort_is_explicit": sort_by == requested_sort,
+        "page": page,
+        "next_page_url": _page_url(request, page.next_cursor) if page.has_next else None,
+        "previous_page_url": (
+            _page_url(request, page.previous_cursor) if page.has_previous else None
+        ),
     }
 
     return render(request, "research/search_results.html", context)
 
 
+@admin_required
+def export_projects(request):
+    """
+    Stream the archive as CSV (default) or NDJSON ('format' parameter).
+
+    Accepts the search page's filters plus 'status' (an approval status or
+    "all"; default "approved") and 'since' (ISO date or date/time of the
+    last export, for incremental pulls).  Rows stream as they are read, so
+    the response starts at once and memory use does not grow with the
+    archive.
+    """
+    fmt = request.GET.get("format", "csv")
+    status = request.GET.get("status", "approved")
+    since = request.GET.get("since", "")
+    if fmt not in EXPORT_FORMATS or status not in export_statuses():
+        return HttpResponseBadRequest("Unknown export format or status.")
+    since_datetime = parse_since(since) if since else None
+    if since and since_datetime is None:
+        return HttpResponseBadRequest("'since' must be an ISO date or date/time.")
+    try:
+        rows = export_queryset(
+            status=status,
+            query=request.GET.get("q", "").strip(),
+            start_semester=request.GET.get("start_semester", ""),
+            end_semester=request.GET.get("end_semester", ""),
+            sponsor=request.GET.get("sponsor", ""),
+            attachments=clean_attachments(request.GET.getlist("has")),
+            sort_by=request.GET.get("sort_by", ""),
+            since=since_datetime,
+        )
+    except ValueError:
+        return HttpResponseBadRequest("Semesters must look like 'Fall 2023'.")
+
+    # An ASGI server needs an async iterator to stream rather than buffer
+    if isinstance(request, ASGIRequest):
+        lines = aiter_export(rows, fmt)
+    else:
+        lines = iter_export(rows, fmt)
+    response = StreamingHttpResponse(lines, content_type=EXPORT_FORMATS[fmt])
+    filename = f"research_projects_{timezone.now():%Y%m%d}.{fmt}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
 # --- Project Detail View ---
 
 
+# Rendered public project pages cached for anonymous visitors
+PROJECT_PAGE_CACHE_TIMEOUT: int = 10 * 60
+
+
+def _project_page_validators(request, project_id):
+    """
+    ETag and Last-Modified (epoch seconds) of a public project page, or
+    ``None`` when the project is not publicly visible.
+
+    The ETag combines the project's ``updated_at`` with its image set
+    (count and newest id, which also catches images added without
+    signals).  Pages for signed-in users also show their navbar, so their
+    ETag adds the user and unread notification count and carries no
+    Last-Modified.
+    """
+    version = (
+        ResearchProject.objects.filter(pk=project_id, approval_status="approved")
+        .annotate(image_count=Count("images"), last_image_id=Max("images__id"))
+        .values_list("updated_at", "image_count", "last_image_id")
+        .first()
+    )
+    if version is None:
+        return None
+    updated_at, image_count, last_image_id = version
+    modified = int(updated_at.timestamp() * 1_000_000)
+    tag = f"{project_id}-{modified}-{image_count}-{last_image_id or 0}"
+    last_modified = int(updated_at.timestamp())
+    if request.user.is_authenticated:
+        tag += f"-u{request.user.pk}-{get_unread_count(request.user)}"
+        last_modified = None
+    return quote_etag(tag), last_modified
+
+
 def project_detail(request, project_id):
-    """Display details of a single research project."""
-    project = get_object_or_404(ResearchProject, id=project_id)
+    """
+    Display details of a single research project.
 
+    Supports conditional GETs (ETag/Last-Modified, answered with 304s
+    after one small query) and serves anonymous visitors a cached copy of
+    the rendered page, keyed on the ETag so any change to the project or
+    its images retires it.
+    """
+    validators = _project_page_validators(request, project_id)
     # Ensure only approved projects are publicly visible
-    if project.approval_status != "approved":
+    if validators is None:
         raise Http404("Project not found or not approved.")
-
-    # Prefetch related images for efficiency
-    project_images = project.images.all()
-
-    context = {
-        "project": project,
-        "project_images": project_images,
-        "page_title": project.title,
-    }
-    return render(request, "research/project_detail.html", context)
+    etag, last_modified = validators
+
+    # Pages with pending flash messages are one-off; always render them
+    cacheable = request.method in ("GET", "HEAD") and not messages.get_messages(request)
+    if cacheable:
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is not None:
+            return response
+
+    # Anonymous pages hold nothing per visitor; base.html renders the CSRF
+    # token for signed-in users only
+    cache_key = None
+    if cacheable and not request.user.is_authenticated:
+        cache_key = "research:project-page:" + hashlib.sha1(etag.encode()).hexdigest()
+    content = cache.get(cache_key) if cache_key else None
+    if content is not None:
+        response = HttpResponse(content)
+    else:
+        project = get_object_or_404(
+            ResearchProject.objects.select_related("author"), id=project_id
+        )
+        # Evaluated once; the gallery loops over it twice
+        project_images = list(project.images.all())
+        load_thumbnail_flags(
+            [(project, "poster_image"), *((image, "image") for image in project_images)]
+        )
+        context = {
+            "project": project,
+            "project_images": project_images,
+            "page_title": project.title,
+        }
+        response = render(request, "research/project_detail.html", context)
+        # Never share a page that rendered this visitor's CSRF token
+        if cache_key and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE"):
+            cache.set(cache_key, response.content, PROJECT_PAGE_CACHE_TIMEOUT)
+
+    if cacheable:
+        response.headers["ETag"] = etag
+        if last_modified is not None:
+            response.headers["Last-Modified"] = http_date(last_modified)
+    # Browsers revalidate every time, so moderation changes show at once
+    patch_cache_control(response, no_cache=True, private=request.user.is_authenticated)
+    patch_vary_headers(response, ("Cookie",))
+    return response
 
 
 # --- Faculty Workflow Views ---
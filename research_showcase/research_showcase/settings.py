@@ -98,6 +98,46 @@ DEFAULT_FROM_EMAIL = "webmaster@localhost"  # TODO: Set a real sender address
 # SERVER_EMAIL = 'root@localhost' # Address for error emails
 # --- END PRODUCTION EMAIL SETTINGS --- #
 
+# Cache configuration
+# Holds per-user unread-notification counters (see users/notifications.py).
+# The local-memory cache is per process; counters expire after a few minutes
+# so separate processes cannot disagree for long.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "research-showcase",
+    }
+}
+
+# --- PRODUCTION CACHE SETTINGS --- #
+# TODO: Use a cache shared by all server processes in production, e.g. Redis.
+# CACHES = {
+#     "default": {
+#         "BACKEND": "django.core.cache.backends.redis.RedisCache",
+#         "LOCATION": "redis://127.0.0.1:6379",  # Load from env var
+#     }
+# }
+# --- END PRODUCTION CACHE SETTINGS --- #
+
+# Seconds a cached search result page lives (research/result_cache.py);
+# 0 disables the cache
+SEARCH_RESULT_CACHE_TIMEOUT = 600
+
+# Live notification events (see users/events.py)
+# The in-process broker only reaches streams served by the same process.
+NOTIFICATION_BROKER = {
+    "BACKEND": "users.events.InProcessBroker",
+}
+# With several ASGI server processes, share events through Redis:
+# NOTIFICATION_BROKER = {
+#     "BACKEND": "users.events.RedisBroker",
+#     "OPTIONS": {"url": "redis://127.0.0.1:6379/0"},  # Load from env var
+# }
+
+# Read notifications older than this are moved to the archive table by
+# `manage.py archive_notifications` (or its scheduled job)
+NOTIFICATION_RETENTION_DAYS = 90
+
 # Custom user model
 AUTH_USER_MODEL = "users.User"
 
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "users"
+
+    def ready(self):
+        # Register the handlers that maintain cached unread-notification
+        # counts and the background tasks run by the run_jobs worker
+        from . import signals, tasks  # noqa: F401
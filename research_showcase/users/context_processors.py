@@ -1,13 +1,20 @@
 from .models import Notification
+from .notifications import get_unread_count
 
 
 def unread_notifications(request):
-    """Makes unread notifications available to templates."""
+    """
+    Makes unread notifications available to templates.
+
+    The count comes from the cache; the recent list is an unevaluated
+    queryset that only hits the database if a template iterates it.
+    """
     if request.user.is_authenticated:
-        notifications = Notification.objects.filter(recipient=request.user, read=False)
-        unread_count = notifications.count()
+        unread_count = get_unread_count(request.user)
         # Limit the number shown in dropdown for performance/UI reasons
-        recent_unread = notifications[:5]
+        recent_unread = Notification.objects.filter(
+            recipient=request.user, read=False
+        )[:5]
     else:
         unread_count = 0
         recent_unread = []
@@ -0,0 +1,191 @@
+"""
+Live notification events for the navbar bell.
+
+New notifications are published to a broker once their transaction commits
+(see ``users.notifications.notifications_created``), and the
+``notification_stream`` view relays them to the browser as Server-Sent
+Events.  A page keeps one cheap, mostly idle connection open instead of being
+reloaded to look for review outcomes.
+
+The broker is chosen by ``settings.NOTIFICATION_BROKER``:
+
+* ``InProcessBroker`` (the default) hands events to subscribers in the same
+  process.  It is enough for a single ASGI server process.
+* ``RedisBroker`` uses Redis pub/sub, so events published by one process reach
+  streams held open by another.  It needs the ``redis`` package.
+
+Other brokers only need to implement ``NotificationBroker``.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from typing import Dict, Optional, Set
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BROKER: str = "users.events.InProcessBroker"
+# Events buffered per connection before a slow client starts losing them
+SUBSCRIBER_QUEUE_SIZE: int = 100
+
+
+class Subscription:
+    """The events for one user, as seen by one open stream."""
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        """The next event, or ``None`` if none arrived within ``timeout``."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        raise NotImplementedError
+
+
+class NotificationBroker:
+    """Fans notification events out to the streams of their recipient."""
+
+    def publish(self, user_id, event: dict) -> None:
+        """Send ``event`` to every open stream of ``user_id``; called from sync code."""
+        raise NotImplementedError
+
+    async def subscribe(self, user_id) -> Subscription:
+        raise NotImplementedError
+
+
+class _QueueSubscription(Subscription):
+    def __init__(self, broker: "InProcessBroker", user_id):
+        self.broker = broker
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def deliver(self, event: dict) -> None:
+        """Queue ``event``; runs on the subscriber's event loop."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("Dropped a notification event for user %s", self.user_id)
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        self.broker._unsubscribe(self)
+
+
+class InProcessBroker(NotificationBroker):
+    """Delivers events to streams served by the current process only."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[object, Set[_QueueSubscription]] = {}
+
+    def publish(self, user_id, event: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for subscription in subscribers:
+            # Publishers run on request threads; hand over to the stream's loop
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                self._unsubscribe(subscription)  # Its loop has shut down
+
+    async def subscribe(self, user_id) -> Subscription:
+        subscription = _QueueSubscription(self, user_id)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: _QueueSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.user_id]
+
+
+class _RedisSubscription(Subscription):
+    def __init__(self, client, pubsub):
+        self.client = client
+        self.pubsub = pubsub
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if message is None:
+            return None
+        return json.loads(message["data"])
+
+    async def close(self) -> None:
+        await self.pubsub.aclose()
+        await self.client.aclose()
+
+
+class RedisBroker(NotificationBroker):
+    """Shares events between server processes through Redis pub/sub."""
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "notifications"):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImproperlyConfigured("RedisBroker requires the redis package") from e
+        self.url = url
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+
+    def _channel(self, user_id) -> str:
+        return f"{self.prefix}:{user_id}"
+
+    def publish(self, user_id, event: dict) -> None:
+        self._client.publish(self._channel(user_id), json.dumps(event))
+
+    async def subscribe(self, user_id) -> Subscription:
+        import redis.asyncio
+
+        client = redis.asyncio.Redis.from_url(self.url)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(self._channel(user_id))
+        return _RedisSubscription(client, pubsub)
+
+
+_broker: Optional[NotificationBroker] = None
+_broker_lock = threading.Lock()
+
+
+def get_broker() -> NotificationBroker:
+    """The broker configured by ``settings.NOTIFICATION_BROKER``."""
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            config = getattr(settings, "NOTIFICATION_BROKER", {})
+            broker_class = import_string(config.get("BACKEND", DEFAULT_BROKER))
+            _broker = broker_class(**config.get("OPTIONS", {}))
+        return _broker
+
+
+def notification_event(notification) -> dict:
+    """The JSON payload sent to the browser for ``notification``."""
+    return {
+        "id": notification.pk,
+        "message": notification.message,
+        "link": notification.link or "",
+        "timestamp": notification.timestamp.isoformat(),
+    }
+
+
+def publish_notifications(notifications) -> None:
+    """Push committed notifications to their recipients' open streams."""
+    broker = get_broker()
+    for notification in notifications:
+        try:
+            broker.publish(notification.recipient_id, notification_event(notification))
+        except Exception:
+            # Live updates are best effort; the next page load shows the rest
+            logger.exception("Could not publish notification %s", notification.pk)
@@ -0,0 +1,57 @@
+# Description: Moves old read notifications out of the live table into the archive
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from users.retention import DEFAULT_BATCH_SIZE, archive_read_notifications, retention_period
+from users.tasks import schedule_notification_archival
+
+
+class Command(BaseCommand):
+    help = (
+        "Archives read notifications older than the retention period "
+        "(NOTIFICATION_RETENTION_DAYS) in small batches and reports throughput"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=retention_period().days,
+            help="Archive read notifications older than this many days (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Rows moved per transaction (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches, leaving the database to other writers",
+        )
+        parser.add_argument(
+            "--schedule",
+            action="store_true",
+            help="Instead of archiving now, queue the daily archival job for the run_jobs worker",
+        )
+
+    def handle(self, *args, **options):
+        if options["schedule"]:
+            job = schedule_notification_archival()
+            self.stdout.write(self.style.SUCCESS(f"Scheduled {job}"))
+            return
+
+        report = archive_read_notifications(
+            older_than=timedelta(days=max(0, options["days"])),
+            batch_size=max(1, options["batch_size"]),
+            pause=max(0.0, options["pause"]),
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {report.archived} notifications in {report.batches} batches, "
+                f"{report.seconds:.2f}s ({report.rows_per_second:.0f} rows/s)"
+            )
+        )
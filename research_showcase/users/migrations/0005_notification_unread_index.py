@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_remove_notification_users_notif_recipie_29f6f4_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('read', False)), fields=['recipient', '-timestamp'], name='users_notif_unread_idx'),
+        ),
+    ]
@@ -1,8 +1,10 @@
 from django.conf import settings  # To link recipient to User model
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
+from .notifications import notifications_created
+
 
 class User(AbstractUser):
     """
@@ -77,11 +79,47 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ["-timestamp"]  # Show newest first
+        indexes = [
+            # Unread notifications of one recipient, newest first: the navbar
+            # count and dropdown, and mark_notifications_read. Partial, so read
+            # history does not grow it.
+            models.Index(
+                fields=["recipient", "-timestamp"],
+                condition=models.Q(read=False),
+                name="users_notif_unread_idx",
+            ),
+        ]
+
+
+class ArchivedNotification(models.Model):
+    """
+    A read notification moved out of the live table by
+    ``users.retention.archive_read_notifications``.
+    """
+
+    recipient: models.ForeignKey = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_notifications",
+    )
+    message: models.TextField = models.TextField()
+    link: models.URLField = models.URLField(blank=True, null=True)
+    timestamp: models.DateTimeField = models.DateTimeField()  # When it was created
+    archived_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-timestamp"]
+
+    def __str__(self):
+        return f"Archived notification for user {self.recipient_id}"
 
 
 def create_in_app_notification(user, message, link=None):
     """
     Creates an in-app notification for the specified user if they have opted in.
+
+    The post_save handler updates the user's cached unread count and pushes
+    the notification to their open pages.
     """
     if user and user.notify_in_app_on_status_change:
         try:
@@ -92,3 +130,22 @@ def create_in_app_notification(user, message, link=None):
         except Exception as e:
             # Log the error - replace print with proper logging in production
             print(f"ERROR creating in-app notification for {user.username}: {e}")
+
+
+def bulk_create_in_app_notifications(notifications):
+    """
+    Creates in-app notifications for many users at once.
+
+    ``notifications`` is an iterable of ``(user, message, link)`` tuples;
+    users who opted out of in-app notifications are skipped. Returns the
+    created notifications.
+    """
+    pending = [
+        Notification(recipient=user, message=message, link=link)
+        for user, message, link in notifications
+        if user and user.notify_in_app_on_status_change
+    ]
+    created = Notification.objects.bulk_create(pending)
+    # bulk_create sends no post_save signals, so count and announce here
+    transaction.on_commit(lambda: notifications_created(created))
+    return created
@@ -0,0 +1,65 @@
+"""
+Cached unread-notification counts.
+
+The navbar bell is rendered on every page, so counting a user's unread
+notifications there used to cost a ``COUNT(*)`` per request.  The count now
+lives in the cache under one key per user:
+
+* creating a notification increments it (``Notification`` post_save, or
+  ``bulk_create_in_app_notifications`` for bulk inserts, which skip signals);
+* any other change (``mark_notifications_read``, edits in the admin,
+  deletions) drops the key, and the next page view recounts once.
+
+A counter that is missing from the cache is never incremented, only
+recomputed, so a cache miss can cost a query but never produce a wrong count.
+Entries expire after ``UNREAD_COUNT_TIMEOUT`` so that a per-process cache
+(the default local-memory backend) cannot drift for long; use a shared cache
+such as Redis or Memcached when running several server processes.
+"""
+
+from typing import Iterable
+
+from django.core.cache import cache
+
+from .events import publish_notifications
+
+UNREAD_COUNT_TIMEOUT: int = 5 * 60
+
+
+def _unread_count_key(user_id) -> str:
+    return f"users:unread-notifications:{user_id}"
+
+
+def get_unread_count(user) -> int:
+    """Unread notifications of ``user``, counted in the database on a miss."""
+    key = _unread_count_key(user.pk)
+    count = cache.get(key)
+    if count is None:
+        # Imported here: this module is imported by users.models
+        from .models import Notification
+
+        count = Notification.objects.filter(recipient=user, read=False).count()
+        cache.set(key, count, UNREAD_COUNT_TIMEOUT)
+    return count
+
+
+def increment_unread_counts(user_ids: Iterable) -> None:
+    """Add one unread notification to each of ``user_ids``' cached counts."""
+    for user_id in user_ids:
+        try:
+            cache.incr(_unread_count_key(user_id))
+        except ValueError:
+            pass  # Not cached; the next read counts from the database
+
+
+def invalidate_unread_count(user_id) -> None:
+    cache.delete(_unread_count_key(user_id))
+
+
+def notifications_created(notifications) -> None:
+    """
+    Count newly committed unread notifications and push them to the
+    recipients' live streams (``users/events.py``).
+    """
+    increment_unread_counts(n.recipient_id for n in notifications)
+    publish_notifications(notifications)
@@ -0,0 +1,91 @@
+"""
+Retention for in-app notifications.
+
+Marking notifications read only flips a flag, so without pruning the live
+``Notification`` table would grow forever.  ``archive_read_notifications()``
+copies read notifications older than the retention period into
+``ArchivedNotification`` and deletes them from the live table.  Each batch is
+its own short transaction, so SQLite's database-wide write lock is held only
+for one batch at a time and page views can write in between.  Deleting read
+notifications leaves unread counts alone, so a batch costs no cache traffic
+(see ``users/signals.py``).
+
+It runs from ``manage.py archive_notifications`` and, once scheduled with
+``archive_notifications --schedule``, as a daily background job.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import ArchivedNotification, Notification
+
+DEFAULT_RETENTION_DAYS: int = 90
+DEFAULT_BATCH_SIZE: int = 500
+
+
+@dataclass
+class ArchiveReport:
+    archived: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.archived / self.seconds if self.seconds else 0.0
+
+
+def retention_period() -> timedelta:
+    """How long read notifications stay live (``NOTIFICATION_RETENTION_DAYS``)."""
+    return timedelta(
+        days=getattr(settings, "NOTIFICATION_RETENTION_DAYS", DEFAULT_RETENTION_DAYS)
+    )
+
+
+def archive_read_notifications(
+    older_than: Optional[timedelta] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pause: float = 0.0,
+) -> ArchiveReport:
+    """
+    Move read notifications created more than ``older_than`` ago to the
+    archive, ``batch_size`` rows per transaction, sleeping ``pause`` seconds
+    between batches.
+    """
+    cutoff = timezone.now() - (older_than if older_than is not None else retention_period())
+    report = ArchiveReport()
+    started = time.perf_counter()
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            # Walk the primary key so rows skipped as unread are not rescanned
+            batch = list(
+                Notification.objects.filter(read=True, timestamp__lt=cutoff, pk__gt=last_id)
+                .order_by("pk")[:batch_size]
+            )
+            if not batch:
+                break
+            ArchivedNotification.objects.bulk_create(
+                ArchivedNotification(
+                    recipient_id=n.recipient_id,
+                    message=n.message,
+                    link=n.link,
+                    timestamp=n.timestamp,
+                )
+                for n in batch
+            )
+            Notification.objects.filter(pk__in=[n.pk for n in batch]).delete()
+        last_id = batch[-1].pk
+        report.archived += len(batch)
+        report.batches += 1
+        if len(batch) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    report.seconds = time.perf_counter() - started
+    return report
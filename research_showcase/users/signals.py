@@ -0,0 +1,29 @@
+"""
+Signal handlers that keep the cached unread-notification counts in step with
+Notification writes and announce new notifications to live streams.
+
+Connected in ``UsersConfig.ready()``.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Notification
+from .notifications import invalidate_unread_count, notifications_created
+
+
+@receiver(post_save, sender=Notification)
+def count_new_notification(sender, instance, created=False, using=None, **kwargs):
+    if created and not instance.read:
+        # A rolled-back insert must not be counted or announced
+        transaction.on_commit(lambda: notifications_created([instance]), using=using)
+    else:
+        invalidate_unread_count(instance.recipient_id)
+
+
+@receiver(post_delete, sender=Notification)
+def uncount_deleted_notification(sender, instance, **kwargs):
+    # Read notifications were never counted; archiving deletes them in bulk
+    if not instance.read:
+        invalidate_unread_count(instance.recipient_id)
@@ -0,0 +1,34 @@
+"""
+Background tasks for the users app, run by the ``run_jobs`` worker (see
+research/jobs.py).
+
+Imported from ``UsersConfig.ready()`` so every process knows the tasks.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.utils import timezone
+from research.jobs import enqueue, task
+
+from .retention import archive_read_notifications
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_NOTIFICATIONS_TASK: str = "users.archive_notifications"
+ARCHIVE_NOTIFICATIONS_INTERVAL = timedelta(days=1)
+
+
+@task(ARCHIVE_NOTIFICATIONS_TASK)
+def archive_notifications():
+    """Archive old read notifications, then schedule the next run."""
+    report = archive_read_notifications()
+    logger.info(
+        "Archived %s notifications (%.0f rows/s)", report.archived, report.rows_per_second
+    )
+    schedule_notification_archival(timezone.now() + ARCHIVE_NOTIFICATIONS_INTERVAL)
+
+
+def schedule_notification_archival(run_at=None):
+    """Queue the recurring archival job unless it is already waiting."""
+    return enqueue(ARCHIVE_NOTIFICATIONS_TASK, unique=True, run_at=run_at)
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from ..events import InProcessBroker
+from ..models import (
+    Notification,
+    bulk_create_in_app_notifications,
+    create_in_app_notification,
+)
+
+User = get_user_model()
+
+
+class InProcessBrokerTests(TestCase):
+    def test_events_reach_only_the_recipients_streams(self):
+        async def scenario():
+            broker = InProcessBroker()
+            mine = await broker.subscribe(1)
+            also_mine = await broker.subscribe(1)
+            theirs = await broker.subscribe(2)
+            # Published from a request thread, not the event loop
+            thread = threading.Thread(target=broker.publish, args=(1, {"id": 7}))
+            thread.start()
+            thread.join()
+            self.assertEqual(await mine.get(timeout=1), {"id": 7})
+            self.assertEqual(await also_mine.get(timeout=1), {"id": 7})
+            self.assertIsNone(await theirs.get(timeout=0.01))
+
+            for subscription in (mine, also_mine, theirs):
+                await subscription.close()
+            self.assertEqual(broker._subscribers, {})
+
+        asyncio.run(scenario())
+
+
+class NotificationStreamTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="streamer", password="password")
+        self.url = reverse("notification_stream")
+        self.broker = InProcessBroker()
+        patcher = patch("users.views.get_broker", return_value=self.broker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _open_stream(self, **headers):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(self.url, headers=headers)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b"retry:"))
+        return stream
+
+    async def _next_event(self, stream):
+        chunk = await asyncio.wait_for(anext(stream), timeout=2)
+        lines = dict(line.split(": ", 1) for line in chunk.decode().strip().splitlines())
+        return int(lines["id"]), json.loads(lines["data"])
+
+    async def test_streams_published_notifications(self):
+        stream = await self._open_stream()
+        self.broker.publish(self.user.pk, {"id": 5, "message": "Approved"})
+        self.assertEqual(await self._next_event(stream), (5, {"id": 5, "message": "Approved"}))
+
+        # Django cancels the response task when the client disconnects
+        waiting = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        self.assertEqual(self.broker._subscribers, {})
+
+    async def test_reconnect_replays_missed_unread_notifications(self):
+        seen = await Notification.objects.acreate(recipient=self.user, message="Seen")
+        missed = await Notification.objects.acreate(recipient=self.user, message="Missed")
+        stream = await self._open_stream(last_event_id=str(seen.pk))
+        event_id, data = await self._next_event(stream)
+        self.assertEqual((event_id, data["message"]), (missed.pk, "Missed"))
+        await stream.aclose()
+
+    def test_wsgi_requests_are_told_not_to_reconnect(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(self.url).status_code, 204)
+
+    def test_requires_login(self):
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+    def test_new_notifications_are_published_after_commit(self):
+        other = User.objects.create_user(username="other_streamer", password="password")
+        with patch("users.events.get_broker", return_value=self.broker), patch.object(
+            self.broker, "publish"
+        ) as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                create_in_app_notification(self.user, "Approved", link="/project/1/")
+                self.assertFalse(publish.called)
+            with self.captureOnCommitCallbacks(execute=True):
+                bulk_create_in_app_notifications([(other, "Rejected", None)])
+
+        (first, second) = [c.args for c in publish.call_args_list]
+        self.assertEqual(first[0], self.user.pk)
+        self.assertEqual(first[1]["message"], "Approved")
+        self.assertEqual(first[1]["link"], "/project/1/")
+        self.assertEqual(second[0], other.pk)
@@ -1,5 +1,9 @@
+from unittest import skipUnless
+
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from ..models import Notification, User, create_in_app_notification
@@ -128,3 +132,41 @@ class NotificationModelTests(TestCase):
         # Expect no ellipsis for short messages
         expected_str = f"Notification for {self.user.username}: {message_text}"
         self.assertEqual(str(notification), expected_str)
+
+
+class NotificationIndexTests(TestCase):
+    """The unread lookups must be served by users_notif_unread_idx."""
+
+    INDEX = "users_notif_unread_idx"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="indexed", password="password")
+        Notification.objects.bulk_create(
+            Notification(recipient=cls.user, message=f"Old {i}", read=True)
+            for i in range(50)
+        )
+        Notification.objects.create(recipient=cls.user, message="Unread")
+
+    def _unread(self):
+        return Notification.objects.filter(recipient=self.user, read=False)
+
+    def test_unread_count_uses_index(self):
+        # explain() needs a queryset; values() mirrors the columns COUNT reads
+        self.assertIn(self.INDEX, self._unread().values("id").explain())
+
+    def test_recent_unread_uses_index_for_order(self):
+        plan = self._unread()[:5].explain()
+        self.assertIn(self.INDEX, plan)
+        if connection.vendor == "sqlite":
+            self.assertNotIn("TEMP B-TREE", plan)  # No separate sort step
+
+    @skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN is SQLite syntax")
+    def test_mark_read_update_uses_index(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self._unread().update(read=True)
+        (update,) = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {update}")
+            plan = " ".join(str(row) for row in cursor.fetchall())
+        self.assertIn(self.INDEX, plan)
@@ -0,0 +1,75 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from research.jobs import run_pending_jobs
+from research.models import Job
+
+from ..models import ArchivedNotification, Notification
+from ..retention import archive_read_notifications
+
+User = get_user_model()
+
+
+class ArchiveNotificationsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="retained", password="password")
+
+    def _notify(self, message, read, age_days):
+        notification = Notification.objects.create(
+            recipient=self.user, message=message, read=read, link="https://example.com/n"
+        )
+        Notification.objects.filter(pk=notification.pk).update(
+            timestamp=timezone.now() - timedelta(days=age_days)
+        )
+        return notification
+
+    def test_only_old_read_notifications_are_archived(self):
+        old_read = [self._notify(f"Old {i}", read=True, age_days=200) for i in range(5)]
+        self._notify("Old but unread", read=False, age_days=200)
+        self._notify("Recent and read", read=True, age_days=1)
+
+        report = archive_read_notifications(older_than=timedelta(days=90), batch_size=2)
+        self.assertEqual((report.archived, report.batches), (5, 3))
+        self.assertGreater(report.rows_per_second, 0)
+
+        self.assertEqual(
+            sorted(Notification.objects.values_list("message", flat=True)),
+            ["Old but unread", "Recent and read"],
+        )
+        archived = ArchivedNotification.objects.order_by("pk")
+        self.assertEqual([a.message for a in archived], [n.message for n in old_read])
+        self.assertEqual(archived[0].recipient, self.user)
+        self.assertEqual(archived[0].link, "https://example.com/n")
+        self.assertLess(archived[0].timestamp, timezone.now() - timedelta(days=199))
+
+    def test_batches_skip_unread_count_invalidation(self):
+        for i in range(4):
+            self._notify(f"Old {i}", read=True, age_days=200)
+        with patch("users.signals.invalidate_unread_count") as invalidate:
+            report = archive_read_notifications(older_than=timedelta(days=90), batch_size=2)
+        self.assertEqual(report.archived, 4)
+        invalidate.assert_not_called()
+
+    def test_command_reports_throughput(self):
+        self._notify("Old", read=True, age_days=40)
+        out = StringIO()
+        call_command("archive_notifications", days=30, stdout=out)
+        self.assertIn("Archived 1 notifications in 1 batches", out.getvalue())
+        self.assertIn("rows/s", out.getvalue())
+        self.assertFalse(Notification.objects.exists())
+
+    def test_scheduled_job_archives_and_reschedules_itself(self):
+        self._notify("Old", read=True, age_days=400)
+        call_command("archive_notifications", schedule=True, stdout=StringIO())
+        call_command("archive_notifications", schedule=True, stdout=StringIO())
+        self.assertEqual(Job.objects.filter(status=Job.PENDING).count(), 1)
+
+        self.assertEqual(run_pending_jobs(), 1)
+        self.assertEqual(ArchivedNotification.objects.count(), 1)
+        next_run = Job.objects.get(status=Job.PENDING)
+        self.assertGreater(next_run.run_at, timezone.now() + timedelta(hours=23))
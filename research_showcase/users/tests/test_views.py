@@ -1,9 +1,19 @@
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from ..forms import NotificationPreferenceForm
-from ..models import Notification
+from ..models import (
+    Notification,
+    bulk_create_in_app_notifications,
+    create_in_app_notification,
+)
+from ..notifications import invalidate_unread_count
 
 User = get_user_model()
 
@@ -146,3 +156,109 @@ class UserViewsTests(TestCase):
             ).count(),
             0,
         )
+
+
+class UnreadNotificationCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="counted", password="password123", role="faculty"
+        )
+        self.client.login(username="counted", password="password123")
+        self.page_url = reverse("edit_profile")
+
+    def _render(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.page_url)
+        notification_queries = [
+            q["sql"] for q in ctx.captured_queries if "users_notification" in q["sql"]
+        ]
+        return response, notification_queries
+
+    def test_counted_once_then_served_from_cache(self):
+        response, queries = self._render()
+        self.assertEqual(response.context["unread_notifications_count"], 0)
+        self.assertEqual(len(queries), 1)
+
+        response, queries = self._render()
+        self.assertEqual(response.context["unread_notifications_count"], 0)
+        self.assertEqual(queries, [])
+
+    def test_new_notifications_increment_cached_count(self):
+        self._render()
+        with self.captureOnCommitCallbacks(execute=True):
+            create_in_app_notification(self.user, "Approved")
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_create_in_app_notifications([(self.user, "Rejected", None)])
+
+        response, queries = self._render()
+        self.assertEqual(response.context["unread_notifications_count"], 2)
+        # Only the dropdown list is loaded
+        self.assertEqual(len(queries), 1)
+        self.assertContains(response, "Rejected")
+
+    def test_mark_read_invalidates_cached_count(self):
+        Notification.objects.create(recipient=self.user, message="Unread")
+        self._render()
+        self.client.post(reverse("mark_notifications_read"))
+        response, _ = self._render()
+        self.assertEqual(response.context["unread_notifications_count"], 0)
+        _, queries = self._render()
+        self.assertEqual(queries, [])
+
+    def test_notification_created_while_marking_read_is_counted(self):
+        Notification.objects.create(recipient=self.user, message="Unread")
+        self._render()
+
+        def arrive_then_invalidate(user_id):
+            # Lands between the view's UPDATE and its cache write
+            Notification.objects.create(recipient=self.user, message="Just in")
+            invalidate_unread_count(user_id)
+
+        with patch("users.views.invalidate_unread_count", arrive_then_invalidate):
+            self.client.post(reverse("mark_notifications_read"))
+        response, _ = self._render()
+        self.assertEqual(response.context["unread_notifications_count"], 1)
+
+    def test_other_changes_invalidate_cached_count(self):
+        notification = Notification.objects.create(recipient=self.user, message="Unread")
+        self._render()
+        notification.read = True
+        notification.save()
+        response, _ = self._render()
+        self.assertEqual(response.context["unread_notifications_count"], 0)
+
+        another = Notification.objects.create(recipient=self.user, message="Another")
+        cache.clear()
+        response, _ = self._render()
+        self.assertEqual(response.context["unread_notifications_count"], 1)
+        another.delete()
+        response, _ = self._render()
+        self.assertEqual(response.context["unread_notifications_count"], 0)
+
+
+class NotificationListViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="lister", password="password123")
+        self.url = reverse("notification_list")
+
+    def test_requires_login(self):
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+    def test_paginates_own_notifications_newest_first(self):
+        other = User.objects.create_user(username="other_lister", password="password123")
+        Notification.objects.create(recipient=other, message="Not mine")
+        for i in range(25):
+            Notification.objects.create(recipient=self.user, message=f"Note {i}", read=i < 20)
+        self.client.login(username="lister", password="password123")
+
+        response = self.client.get(self.url)
+        page = response.context["page"]
+        self.assertEqual(page.paginator.count, 25)
+        self.assertEqual(page.object_list[0].message, "Note 24")
+        self.assertNotContains(response, "Not mine")
+        self.assertContains(response, "?page=2")
+
+        response = self.client.get(self.url, {"page": 2})
+        self.assertEqual(len(response.context["page"].object_list), 5)
+        self.assertEqual(response.context["page"].object_list[0].message, "Note 4")
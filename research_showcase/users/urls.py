@@ -1,7 +1,14 @@
 from django.contrib.auth import views as auth_views
 from django.urls import path
 
-from .views import edit_profile, login_view, logout_view, mark_notifications_read
+from .views import (
+    edit_profile,
+    login_view,
+    logout_view,
+    mark_notifications_read,
+    notification_list,
+    notification_stream,
+)
 
 urlpatterns = [
     # Authentication URLs
@@ -36,10 +43,17 @@ urlpatterns = [
     ),
     # Add the URL for editing profile/preferences
     path("profile/", edit_profile, name="edit_profile"),
+    path("notifications/", notification_list, name="notification_list"),
     # Add the URL for marking notifications read
     path(
         "notifications/mark-read/",
         mark_notifications_read,
         name="mark_notifications_read",
     ),
+    # Live notification updates (Server-Sent Events, served over ASGI)
+    path(
+        "notifications/stream/",
+        notification_stream,
+        name="notification_stream",
+    ),
 ]
@@ -1,14 +1,29 @@
+import json
+
+from asgiref.sync import sync_to_async
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.forms import AuthenticationForm
-from django.http import JsonResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.core.paginator import Paginator
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import redirect, render
 from django.utils.http import url_has_allowed_host_and_scheme
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import require_GET, require_POST
 
+from .events import get_broker, notification_event
 from .forms import NotificationPreferenceForm
 from .models import Notification
+from .notifications import invalidate_unread_count
+
+NOTIFICATIONS_PER_PAGE: int = 20
+# Comment lines sent on idle streams so proxies do not time them out
+STREAM_KEEPALIVE_SECONDS: int = 25
+# Delay the browser waits before reconnecting a dropped stream
+STREAM_RETRY_MS: int = 5000
+# Unread notifications replayed to a reconnecting stream
+STREAM_REPLAY_LIMIT: int = 20
 
 
 def login_view(request):
@@ -84,6 +99,17 @@ def edit_profile(request):
     return render(request, "users/edit_profile.html", {"form": form})
 
 
+@login_required
+def notification_list(request):
+    """All of the user's live (not yet archived) notifications, newest first."""
+    paginator = Paginator(
+        Notification.objects.filter(recipient=request.user).order_by("-timestamp", "-id"),
+        NOTIFICATIONS_PER_PAGE,
+    )
+    page = paginator.get_page(request.GET.get("page"))
+    return render(request, "users/notifications.html", {"page": page})
+
+
 @require_POST
 @login_required
 def mark_notifications_read(request):
@@ -93,6 +119,9 @@ def mark_notifications_read(request):
         num_updated = Notification.objects.filter(
             recipient=request.user, read=False
         ).update(read=True)
+        # Recount on the next read rather than storing 0: a notification
+        # created since the UPDATE would otherwise go uncounted
+        invalidate_unread_count(request.user.pk)
         return JsonResponse({"success": True, "marked_read_count": num_updated})
     except Exception as e:
         # Log the error ideally
@@ -100,3 +129,58 @@ def mark_notifications_read(request):
             f"Error marking notifications as read for user {request.user.username}: {e}"
         )
         return JsonResponse({"success": False, "error": str(e)}, status=500)
+
+
+def _sse(event: dict) -> str:
+    return f"id: {event['id']}\ndata: {json.dumps(event)}\n\n"
+
+
+def _missed_events(user, last_event_id):
+    """Unread notifications created after the last one a stream saw."""
+    missed = Notification.objects.filter(
+        recipient=user, read=False, pk__gt=last_event_id
+    ).order_by("pk")[:STREAM_REPLAY_LIMIT]
+    return [notification_event(n) for n in missed]
+
+
+async def _event_stream(user, last_event_id):
+    subscription = await get_broker().subscribe(user.pk)
+    try:
+        yield f"retry: {STREAM_RETRY_MS}\n\n"
+        # Subscribed first, so nothing committed meanwhile is lost; the page
+        # ignores ids it has already shown
+        if last_event_id is not None:
+            for event in await sync_to_async(_missed_events)(user, last_event_id):
+                yield _sse(event)
+        while True:
+            event = await subscription.get(timeout=STREAM_KEEPALIVE_SECONDS)
+            yield ": keep-alive\n\n" if event is None else _sse(event)
+    finally:
+        await subscription.close()
+
+
+@require_GET
+@login_required
+async def notification_stream(request):
+    """
+    Server-Sent Events stream of the user's new notifications.
+
+    Needs an ASGI server (``research_showcase/asgi.py``): a WSGI worker would
+    be tied up for the life of the connection, so there the view answers 204,
+    which tells EventSource not to reconnect, and pages fall back to showing
+    notifications on the next load.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+
+    user = await request.auser()
+    try:
+        last_event_id = int(request.headers.get("Last-Event-ID", ""))
+    except ValueError:
+        last_event_id = None
+    response = StreamingHttpResponse(
+        _event_stream(user, last_event_id), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # Stop nginx buffering the stream
+    return response